@@ -0,0 +1,103 @@
+"""
+Custo por item do caminho linha do banco -> corpo JSON da resposta.
+
+- antes: `model_validate` no repositório + validação contra o `response_model` e
+  `JSONResponse` (json da biblioteca padrão), como o FastAPI faz quando a rota retorna modelos;
+- depois: conversão dos repositórios (`model_construct` para professores, `TypeAdapter`
+  em cache para graduações) + `ORJSONModelResponse`.
+
+Uso (na raiz do repositório, com as variáveis de ambiente do serviço definidas):
+    python -m benchmarks.response_serialization [--items 1000] [--repeat 20]
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from typing import Any, Callable, Dict, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from professors.adapters.api.responses import ORJSONModelResponse
+from professors.adapters.api.schemas.graduation_schemas import GraduationResponse
+from professors.adapters.database.graduation_repository import SQLAlchemyGraduationRepository
+from professors.adapters.database.professor_repository import SQLAlchemyProfessorRepository
+from professors.core.domain.graduation_models import Graduation
+from professors.core.domain.professor_models import Professor
+
+
+def professor_rows(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": uuid.uuid4(),
+            "name": f"Professor {i}",
+            "registration_number": i,
+            "institucional_email": f"professor{i}@pucrs.br",
+            "status": "active",
+        }
+        for i in range(count)
+    ]
+
+def graduation_rows(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": uuid.uuid4(),
+            "professor_id": uuid.uuid4(),
+            "degree": "Mestrado",
+            "course": "Engenharia de Software",
+            "institution_name": "PUCRS",
+            "year": 2000 + i % 25,
+        }
+        for i in range(count)
+    ]
+
+
+def before(model, response_model) -> Callable[[List[Dict[str, Any]]], bytes]:
+    field = create_response_field(name="Response", type_=List[response_model])
+
+    def run(rows):
+        items = [model.model_validate(dict(row)) for row in rows]
+        content = asyncio.run(serialize_response(field=field, response_content=items))
+        return JSONResponse(content).body
+    return run
+
+def after(to_domain: Callable[[List[Dict[str, Any]]], list]) -> Callable[[List[Dict[str, Any]]], bytes]:
+    def run(rows):
+        return ORJSONModelResponse(to_domain(rows)).body
+    return run
+
+
+def per_item_us(run: Callable, rows: List[Dict[str, Any]], repeat: int) -> float:
+    run(rows)  # aquecimento
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(rows)
+        best = min(best, time.perf_counter() - start)
+    return best / len(rows) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    professors = SQLAlchemyProfessorRepository(db=None)
+    graduations = SQLAlchemyGraduationRepository(db=None)
+    cases = [
+        ("professors", professor_rows(args.items), Professor, Professor,
+         lambda rows: [professors._to_domain(row) for row in rows]),
+        ("graduations", graduation_rows(args.items), Graduation, GraduationResponse,
+         graduations._to_domain_list),
+    ]
+    print(f"{'lista':<12} {'antes (us/item)':>16} {'depois (us/item)':>17} {'ganho':>7}")
+    for name, rows, model, response_model, to_domain in cases:
+        old = per_item_us(before(model, response_model), rows, args.repeat)
+        new = per_item_us(after(to_domain), rows, args.repeat)
+        print(f"{name:<12} {old:>16.2f} {new:>17.2f} {old / new:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,43 +1,170 @@
-from typing import Annotated
+import asyncio
+from typing import Annotated, Any, Dict, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials # <-- ALTERADO
 import httpx
+import jwt
 
 from professors.config import settings
+from professors.adapters.api.token_cache import TokenCache
+from professors.adapters.api.oauth_client import (
+    OAUTH_HTTP_IN_FLIGHT,
+    OAUTH_HTTP_POOL_TIMEOUTS,
+    get_oauth_client,
+)
+from professors.adapters.api.jwt_verifier import JWKSCache, JWKSUnavailableError, JWTVerifier
+from professors.adapters.api.circuit_breaker import CircuitBreaker, CircuitOpenError
 
 # Usamos HTTPBearer em vez de OAuth2PasswordBearer.
 # Isso dirá ao Swagger para pedir apenas o token, não usuário/senha.
 http_bearer_scheme = HTTPBearer()
 
+# Cache das introspecções já validadas (chave = hash do token)
+token_cache = TokenCache(
+    max_size=settings.OAUTH_TOKEN_CACHE_MAX_SIZE,
+    ttl_seconds=settings.OAUTH_TOKEN_CACHE_TTL_SECONDS,
+)
+
+# Validações em andamento, para que requisições simultâneas com o mesmo
+# token compartilhem uma única chamada ao serviço de OAuth.
+_inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+
+def _is_oauth_failure(exc: Exception) -> bool:
+    """Erros de rede e respostas 5xx indicam falha do serviço de OAuth (um 401 não)."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, httpx.RequestError)
+
+
+# Circuit breaker em volta do /validate: com o OAuth fora do ar, falha rápido com 503
+# em vez de segurar cada requisição até o timeout.
+oauth_circuit_breaker = CircuitBreaker(
+    name="oauth_validate",
+    failure_threshold=settings.OAUTH_CIRCUIT_FAILURE_THRESHOLD,
+    recovery_timeout=settings.OAUTH_CIRCUIT_RECOVERY_SECONDS,
+    call_timeout=settings.OAUTH_CIRCUIT_CALL_TIMEOUT_SECONDS,
+    half_open_max_calls=settings.OAUTH_CIRCUIT_HALF_OPEN_MAX_CALLS,
+    is_failure=_is_oauth_failure,
+)
+
+# Verificação local de JWTs (AUTH_MODE=jwt), com as chaves do JWKS em cache
+jwks_cache = JWKSCache(
+    url=settings.OAUTH_JWKS_URL,
+    path=settings.OAUTH_JWKS_FILE,
+    refresh_interval=settings.OAUTH_JWKS_REFRESH_SECONDS,
+)
+# Só existe com AUTH_MODE=jwt, quando a configuração garante issuer e audience
+jwt_verifier: Optional[JWTVerifier] = None
+if settings.AUTH_MODE == "jwt":
+    jwt_verifier = JWTVerifier(
+        jwks_cache,
+        issuer=settings.OAUTH_JWT_ISSUER,
+        audience=settings.OAUTH_JWT_AUDIENCE,
+        algorithms=settings.JWT_ALGORITHMS,
+        leeway=settings.OAUTH_JWT_LEEWAY_SECONDS,
+    )
+
+
+async def _introspect(token: str) -> Dict[str, Any]:
+    """Chama o endpoint /validate do serviço de OAuth para o token informado."""
+    # Cliente compartilhado (aberto no lifespan), reaproveitando conexões keep-alive
+    client = get_oauth_client()
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async def call_validate() -> httpx.Response:
+        with OAUTH_HTTP_IN_FLIGHT.track_inprogress():
+            # Chama o endpoint /validate do serviço de OAuth
+            response = await client.post(settings.OAUTH_VALIDATE_URL, headers=headers)
+
+        # Se a resposta for 4xx ou 5xx, levanta uma exceção
+        response.raise_for_status()
+        return response
+
+    try:
+        response = await oauth_circuit_breaker.call(call_validate)
+
+        # Retorna os dados da introspecção do token se for válido
+        return response.json()
+
+    except CircuitOpenError as exc:
+        # Circuito aberto: falha imediatamente, sem chamar o serviço de OAuth
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Serviço de autenticação indisponível.",
+            headers={"Retry-After": str(max(1, int(exc.retry_after)))},
+        )
+    except asyncio.TimeoutError:
+        # A chamada excedeu OAUTH_CIRCUIT_CALL_TIMEOUT_SECONDS
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Serviço de autenticação indisponível.",
+        )
+    except httpx.HTTPStatusError as exc:
+        # Captura erros 4xx/5xx (ex: 401 do serviço oauth)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token inválido ou expirado.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    except httpx.RequestError as exc:
+        if isinstance(exc, httpx.PoolTimeout):
+            OAUTH_HTTP_POOL_TIMEOUTS.inc()
+        # Captura erros de rede (ex: serviço oauth indisponível)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Serviço de autenticação indisponível.",
+        )
+
+
+async def _introspect_and_cache(token: str, key: str) -> Dict[str, Any]:
+    claims = await _introspect(token)
+    token_cache.set(key, claims)
+    return claims
+
+
 async def validate_token(credentials: Annotated[HTTPAuthorizationCredentials, Depends(http_bearer_scheme)]):
     """
     Dependência que valida o token de portador (Bearer Token) com o serviço de OAuth.
     Extrai o token do esquema HTTPBearer.
+
+    Com AUTH_MODE=jwt o token é verificado localmente (assinatura, exp, iss, aud)
+    e a chamada ao /validate só é usada se o JWKS estiver indisponível.
+
+    Resultados válidos ficam em cache até o `exp` do token (ou o TTL configurado),
+    e validações simultâneas do mesmo token são feitas uma única vez.
     """
     token = credentials.credentials
-    async with httpx.AsyncClient() as client:
-        headers = {"Authorization": f"Bearer {token}"}
+
+    if settings.AUTH_MODE == "jwt" and jwt_verifier is not None:
         try:
-            # Chama o endpoint /validate do serviço de OAuth
-            response = await client.post(settings.OAUTH_VALIDATE_URL, headers=headers)
-            
-            # Se a resposta for 4xx ou 5xx, levanta uma exceção
-            response.raise_for_status()
-            
-            # Retorna os dados da introspecção do token se for válido
-            return response.json()
-
-        except httpx.HTTPStatusError as exc:
-            # Captura erros 4xx/5xx (ex: 401 do serviço oauth)
+            return await jwt_verifier.verify(token)
+        except jwt.InvalidTokenError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Token inválido ou expirado.",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        except httpx.RequestError:
-            # Captura erros de rede (ex: serviço oauth indisponível)
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Serviço de autenticação indisponível.",
-            )
+        except JWKSUnavailableError:
+            # Sem chaves de assinatura disponíveis: usa a validação remota (/validate)
+            pass
+
+    key = TokenCache.key(token)
+
+    claims = token_cache.get(key)
+    if claims is not None:
+        return claims
+
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(_introspect_and_cache(token, key))
+        _inflight[key] = future
+
+        def _forget(done: "asyncio.Future[Dict[str, Any]]") -> None:
+            if _inflight.get(key) is done:
+                del _inflight[key]
+
+        future.add_done_callback(_forget)
 
+    # shield: o cancelamento de uma requisição não cancela a validação compartilhada
+    return await asyncio.shield(future)
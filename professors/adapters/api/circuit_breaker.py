@@ -0,0 +1,126 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from prometheus_client import Counter, Enum
+
+T = TypeVar("T")
+
+CIRCUIT_STATE = Enum(
+    "professors_circuit_breaker_state",
+    "Estado atual do circuit breaker.",
+    ["name"],
+    states=["closed", "half_open", "open"],
+)
+CIRCUIT_REJECTIONS = Counter(
+    "professors_circuit_breaker_rejections",
+    "Chamadas recusadas imediatamente porque o circuito estava aberto.",
+    ["name"],
+)
+CIRCUIT_FAILURES = Counter(
+    "professors_circuit_breaker_failures",
+    "Falhas (erros ou timeouts) registradas pelo circuit breaker.",
+    ["name"],
+)
+
+
+class CircuitOpenError(Exception):
+    """O circuito está aberto: a chamada foi recusada sem tocar na dependência."""
+
+    def __init__(self, retry_after: float):
+        super().__init__("Circuito aberto.")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker assíncrono para uma dependência externa.
+
+    - closed: as chamadas passam; `failure_threshold` falhas seguidas abrem o circuito.
+    - open: as chamadas falham imediatamente com `CircuitOpenError` até passar `recovery_timeout`.
+    - half_open: até `half_open_max_calls` chamadas de teste passam; um sucesso fecha o
+      circuito e uma falha o abre novamente.
+    """
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        call_timeout: Optional[float] = None,
+        half_open_max_calls: int = 1,
+        is_failure: Callable[[Exception], bool] = lambda exc: True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.call_timeout = call_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.is_failure = is_failure
+        self._clock = clock
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._set_state(self.CLOSED)
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+            self._set_state(self.HALF_OPEN)
+        return self._state
+
+    def _set_state(self, state: str) -> None:
+        self._state = state
+        if state == self.HALF_OPEN:
+            self._half_open_calls = 0
+        CIRCUIT_STATE.labels(name=self.name).state(state)
+
+    def _before_call(self) -> None:
+        state = self.state
+        if state == self.OPEN:
+            CIRCUIT_REJECTIONS.labels(name=self.name).inc()
+            raise CircuitOpenError(self.recovery_timeout - (self._clock() - self._opened_at))
+        if state == self.HALF_OPEN:
+            if self._half_open_calls >= self.half_open_max_calls:
+                CIRCUIT_REJECTIONS.labels(name=self.name).inc()
+                raise CircuitOpenError(self.recovery_timeout)
+            self._half_open_calls += 1
+
+    def record_success(self) -> None:
+        self._failures = 0
+        if self._state != self.CLOSED:
+            self._set_state(self.CLOSED)
+
+    def record_failure(self) -> None:
+        CIRCUIT_FAILURES.labels(name=self.name).inc()
+        self._failures += 1
+        if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+            self._set_state(self.OPEN)
+
+    async def call(self, func: Callable[[], Awaitable[T]]) -> T:
+        """Executa `func` protegida pelo circuito (e pelo `call_timeout`, se houver)."""
+        self._before_call()
+        try:
+            if self.call_timeout is not None:
+                result = await asyncio.wait_for(func(), timeout=self.call_timeout)
+            else:
+                result = await func()
+        except asyncio.CancelledError:
+            # A requisição foi cancelada por quem chamou; libera a vaga de teste sem contar falha.
+            if self._state == self.HALF_OPEN:
+                self._half_open_calls = max(0, self._half_open_calls - 1)
+            raise
+        except Exception as exc:
+            if isinstance(exc, asyncio.TimeoutError) or self.is_failure(exc):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        self.record_success()
+        return result
@@ -0,0 +1,114 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Mapping, Optional
+
+from prometheus_client import Counter
+from starlette.requests import Request
+from starlette.responses import Response
+
+from professors.adapters.api.etag import collection_etag, etag_matches
+from professors.adapters.api.snapshot import DirectorySnapshot
+from professors.adapters.cache.memory_cache import InMemoryCache
+from professors.core.domain.table_version import TableVersion
+
+COLLECTION_CACHE_LOOKUPS = Counter(
+    "professors_collection_cache_lookups",
+    "Respostas das listagens por resultado (not_modified, snapshot, hit, miss).",
+    ["name", "result"],
+)
+
+# Headers da resposta original que não são guardados com o corpo
+_UNCACHED_HEADERS = {"content-length", "content-type", "etag", "last-modified"}
+
+
+def _last_modified(versions: Mapping[str, TableVersion]) -> Optional[datetime]:
+    timestamps = [version.updated_at for version in versions.values() if version.updated_at is not None]
+    if not timestamps:
+        return None
+    # Precisão de segundos (HTTP-date); o ETag continua exato
+    return max(timestamps).astimezone(timezone.utc).replace(microsecond=0)
+
+
+def _not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    # If-None-Match tem precedência: If-Modified-Since só vale sem ele (RFC 9110, 13.2.2)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return since.tzinfo is not None and last_modified <= since
+
+
+class CollectionCache:
+    """
+    Cache HTTP das listagens, guiado pelo contador de alterações das tabelas lidas.
+
+    O ETag (e o Last-Modified) vêm só das versões das tabelas: com `If-None-Match` ou
+    `If-Modified-Since` atualizados, a resposta é 304 sem ler nem serializar as linhas.
+    Caso contrário, o corpo serializado (com os headers de paginação) é reaproveitado
+    enquanto as versões não mudarem, em um LRU por processo de `max_entries` respostas.
+    As versões devem ser lidas antes dos dados: uma escrita no meio deixa o corpo mais
+    novo que o ETag, e a próxima leitura apenas o recalcula.
+    A listagem completa pode vir de um `DirectorySnapshot` (pré-serializado e comprimido),
+    que então não ocupa espaço neste LRU.
+    """
+
+    def __init__(self, name: str, max_entries: int, ttl: float):
+        self.name = name
+        self.ttl = ttl
+        self._bodies = InMemoryCache(max_size=max_entries)
+
+    def clear(self) -> None:
+        self._bodies.clear()
+
+    async def respond(
+        self,
+        request: Request,
+        versions: Optional[Mapping[str, TableVersion]],
+        build: Callable[[], Awaitable[Response]],
+        snapshot: Optional[DirectorySnapshot] = None,
+    ) -> Response:
+        if versions is None:
+            return await build()
+
+        # A URL inclui o host: o header Link da paginação é absoluto
+        etag = collection_etag(
+            str(request.url.replace(query="")),
+            request.query_params.multi_items(),
+            ((table, version.version) for table, version in versions.items()),
+        )
+        headers: Dict[str, str] = {"ETag": etag}
+        last_modified = _last_modified(versions)
+        if last_modified is not None:
+            headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+
+        if _not_modified(request, etag, last_modified):
+            COLLECTION_CACHE_LOOKUPS.labels(name=self.name, result="not_modified").inc()
+            return Response(status_code=304, headers=headers)
+
+        if snapshot is not None:
+            snapshot_body = snapshot.get(versions)
+            if snapshot_body is not None:
+                COLLECTION_CACHE_LOOKUPS.labels(name=self.name, result="snapshot").inc()
+                return snapshot_body.response(request, headers)
+
+        cached = await self._bodies.get(etag)
+        if cached is not None:
+            COLLECTION_CACHE_LOOKUPS.labels(name=self.name, result="hit").inc()
+            body, media_type, extra_headers = cached.value
+            return Response(body, media_type=media_type, headers={**extra_headers, **headers})
+
+        COLLECTION_CACHE_LOOKUPS.labels(name=self.name, result="miss").inc()
+        response = await build()
+        if response.status_code == 200:
+            extra_headers = {
+                key: value for key, value in response.headers.items() if key not in _UNCACHED_HEADERS
+            }
+            await self._bodies.set(etag, (response.body, response.media_type, extra_headers), self.ttl)
+        response.headers.update(headers)
+        return response
@@ -0,0 +1,99 @@
+import hashlib
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import uuid
+
+from fastapi import HTTPException, status
+
+# ETags fortes derivados da coluna `version`: mudam a cada alteração da linha (ou das
+# graduações embutidas) e variam com a representação (?fields=, ?include=).
+_VERSION_ETAG = re.compile(r'^"v(\d+)"$')
+
+
+def attribute(item: Any, name: str) -> Any:
+    """Lê um campo de um modelo ou de um item projetado (dict)."""
+    return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+
+
+def version_of(item: Any) -> Optional[int]:
+    version = attribute(item, "version")
+    return version if isinstance(version, int) else None
+
+
+def version_etag_headers(item: Any) -> Optional[Dict[str, str]]:
+    """Header ETag `"v{versão}"` de um registro recém-gravado (None se não houver versão)."""
+    version = version_of(item)
+    return {"ETag": f'"v{version}"'} if version is not None else None
+
+
+def _digest(*parts: object) -> str:
+    return hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+
+
+def professor_etag(
+    version: int,
+    graduation_versions: Optional[Iterable[Tuple[uuid.UUID, int]]] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> str:
+    """
+    ETag do detalhe do professor. A representação completa é só `"v{versão}"` (o mesmo
+    valor aceito no If-Match); com projeção ou graduações embutidas, recebe um sufixo.
+    """
+    if graduation_versions is None and not fields:
+        return f'"v{version}"'
+    graduations = sorted((str(id), v) for id, v in graduation_versions or ())
+    return f'"v{version}-{_digest(graduations, list(fields or ()))}"'
+
+
+def graduations_list_etag(
+    graduation_versions: Iterable[Tuple[uuid.UUID, int]], fields: Optional[Sequence[str]] = None
+) -> str:
+    """ETag da lista de graduações de um professor: muda com inclusão, exclusão ou alteração."""
+    graduations = sorted((str(id), v) for id, v in graduation_versions)
+    return f'"g{_digest(graduations, list(fields or ()))}"'
+
+
+def collection_etag(
+    url: str, params: Iterable[Tuple[str, str]], table_versions: Iterable[Tuple[str, int]]
+) -> str:
+    """ETag de uma listagem: URL, parâmetros (em qualquer ordem) e versões das tabelas lidas."""
+    return f'"c{_digest(url, sorted(params), sorted(table_versions))}"'
+
+
+def _split_tags(header: str) -> List[str]:
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match (comparação fraca, RFC 9110 13.1.2): `*` ou qualquer tag da lista."""
+    if not if_none_match:
+        return False
+    tags = _split_tags(if_none_match)
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def parse_if_match(if_match: Optional[str]) -> Optional[int]:
+    """
+    Versão esperada pelo If-Match (comparação forte), ou None sem condição (ausente ou `*`).
+    Uma tag que não é de versão (ou é fraca) nunca casa: 412 sem tocar no banco.
+    """
+    if if_match is None:
+        return None
+    tags = _split_tags(if_match)
+    if "*" in tags:
+        return None
+    versions = set()
+    for tag in tags:
+        match = _VERSION_ETAG.match(tag)
+        if match is None:
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="If-Match does not match the current version."
+            )
+        versions.add(int(match.group(1)))
+    if len(versions) != 1:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="If-Match must contain a single version ETag."
+        )
+    return versions.pop()
@@ -0,0 +1,62 @@
+import csv
+import io
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, List, Sequence
+
+import orjson
+from fastapi.responses import StreamingResponse
+
+from professors.adapters.api.responses import _default
+
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv; charset=utf-8",
+}
+
+
+async def _ndjson_chunks(chunks: AsyncIterator[List[Dict[str, Any]]]) -> AsyncIterator[bytes]:
+    # As linhas vêm direto do banco: nada de re-validar com Pydantic, só serializar
+    # (orjson, como as demais respostas: ORJSONModelResponse)
+    async for rows in chunks:
+        yield b"".join(
+            orjson.dumps(dict(row), default=_default, option=orjson.OPT_APPEND_NEWLINE) for row in rows
+        )
+
+
+async def _csv_chunks(
+    chunks: AsyncIterator[List[Dict[str, Any]]], fieldnames: Sequence[str]
+) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+    writer.writeheader()
+    async for rows in chunks:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def export_response(
+    chunks: AsyncIterator[List[Dict[str, Any]]],
+    export_format: ExportFormat,
+    fieldnames: Sequence[str],
+    filename: str,
+) -> StreamingResponse:
+    """Resposta em streaming (NDJSON ou CSV) a partir de lotes de linhas do repositório."""
+    if export_format == ExportFormat.csv:
+        body = _csv_chunks(chunks, fieldnames)
+    else:
+        body = _ndjson_chunks(chunks)
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'},
+    )
@@ -0,0 +1,165 @@
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import jwt
+
+from professors.adapters.api.oauth_client import get_oauth_client
+
+logger = logging.getLogger(__name__)
+
+
+class JWKSUnavailableError(Exception):
+    """As chaves de assinatura (JWKS) não puderam ser obtidas."""
+
+
+class JWKSCache:
+    """
+    Mantém em memória as chaves públicas (JWKS) usadas para verificar os JWTs.
+
+    As chaves são carregadas de uma URL (ex: endpoint `certs` do Keycloak) ou de
+    um arquivo local, e recarregadas periodicamente em segundo plano. Um `kid`
+    desconhecido força uma recarga, para acompanhar rotações de chave sem esperar o
+    próximo ciclo. Essas recargas (com sucesso ou não) ficam limitadas a uma a cada
+    `min_refresh_interval`: quem espera no lock reaproveita o resultado da anterior.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        path: Optional[str] = None,
+        refresh_interval: float = 300.0,
+        min_refresh_interval: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.url = url
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self.min_refresh_interval = min_refresh_interval
+        self._clock = clock
+        self._keys: Dict[Optional[str], jwt.PyJWK] = {}
+        self._loaded_at: Optional[float] = None
+        self._last_attempt: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    async def _fetch(self) -> Dict[str, Any]:
+        if self.path:
+            return json.loads(await asyncio.to_thread(Path(self.path).read_text))
+        if self.url:
+            response = await get_oauth_client().get(self.url)
+            response.raise_for_status()
+            return response.json()
+        raise JWKSUnavailableError("Nenhuma origem de JWKS configurada.")
+
+    async def refresh(self) -> None:
+        """Recarrega as chaves. Em caso de falha, as chaves anteriores são mantidas."""
+        # Registrada antes da busca: uma falha também conta para `min_refresh_interval`
+        self._last_attempt = self._clock()
+        try:
+            keyset = jwt.PyJWKSet.from_dict(await self._fetch())
+        except JWKSUnavailableError:
+            raise
+        except Exception as exc:
+            raise JWKSUnavailableError(f"Falha ao carregar o JWKS: {exc}") from exc
+
+        self._keys = {key.key_id: key for key in keyset.keys}
+        self._loaded_at = self._clock()
+
+    async def get_key(self, kid: Optional[str]) -> Optional[jwt.PyJWK]:
+        """Retorna a chave para o `kid` informado, ou None se ela não existir no JWKS."""
+        key = self._lookup(kid)
+        if key is not None:
+            return key
+
+        async with self._lock:
+            # Quem esperou no lock vê as chaves (ou a tentativa) da recarga anterior
+            key = self._lookup(kid)
+            if key is not None:
+                return key
+            if (
+                self._last_attempt is None
+                or self._clock() - self._last_attempt >= self.min_refresh_interval
+            ):
+                await self.refresh()
+                return self._lookup(kid)
+        if not self.loaded:
+            raise JWKSUnavailableError("JWKS indisponível; nova tentativa em breve.")
+        return None
+
+    def _lookup(self, kid: Optional[str]) -> Optional[jwt.PyJWK]:
+        if kid is None and len(self._keys) == 1:
+            return next(iter(self._keys.values()))
+        return self._keys.get(kid)
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except JWKSUnavailableError as exc:
+                logger.warning("Não foi possível atualizar o JWKS: %s", exc)
+
+    async def start(self) -> None:
+        """Carrega as chaves e inicia a atualização em segundo plano."""
+        try:
+            await self.refresh()
+        except JWKSUnavailableError as exc:
+            logger.warning("JWKS indisponível na inicialização: %s", exc)
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+class JWTVerifier:
+    """Verifica localmente assinatura, `exp`, `iss` e `aud` de JWTs emitidos pelo Keycloak."""
+
+    def __init__(
+        self,
+        jwks: JWKSCache,
+        issuer: str,
+        audience: str,
+        algorithms: List[str],
+        leeway: int = 0,
+    ):
+        self.jwks = jwks
+        self.issuer = issuer
+        self.audience = audience
+        self.algorithms = algorithms
+        self.leeway = leeway
+
+    async def verify(self, token: str) -> Dict[str, Any]:
+        """
+        Retorna as claims do token.
+        Levanta `jwt.InvalidTokenError` se o token for inválido e
+        `JWKSUnavailableError` se as chaves não puderem ser obtidas.
+        """
+        header = jwt.get_unverified_header(token)
+        key = await self.jwks.get_key(header.get("kid"))
+        if key is None:
+            raise jwt.InvalidTokenError("Chave de assinatura desconhecida.")
+
+        return jwt.decode(
+            token,
+            key.key,
+            algorithms=self.algorithms,
+            audience=self.audience,
+            issuer=self.issuer,
+            leeway=self.leeway,
+            options={"require": ["exp", "iss", "aud"]},
+        )
@@ -0,0 +1,32 @@
+import uuid
+from typing import List, Optional
+
+from fastapi import HTTPException, status
+
+from professors.config import settings
+
+# Header com o tamanho do lote efetivamente consultado (IDs distintos)
+BATCH_SIZE_HEADER = "X-Batch-Size"
+
+
+def check_lookup_size(count: int) -> None:
+    """Limita a quantidade de IDs por consulta em lote (LOOKUP_MAX_IDS)."""
+    if count > settings.LOOKUP_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Too many ids: {count} (max {settings.LOOKUP_MAX_IDS})."
+        )
+
+
+def parse_id_list(values: Optional[List[str]]) -> List[uuid.UUID]:
+    """Aceita IDs separados por vírgula e/ou o parâmetro repetido (?ids=a,b&ids=c)."""
+    ids: List[uuid.UUID] = []
+    for value in values or []:
+        for raw in value.split(","):
+            if not raw.strip():
+                continue
+            try:
+                ids.append(uuid.UUID(raw.strip()))
+            except ValueError:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid UUID: '{raw.strip()}'.")
+    return list(dict.fromkeys(ids))
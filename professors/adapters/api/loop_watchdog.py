@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from prometheus_client import Counter, Histogram
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+EVENT_LOOP_LAG = Histogram(
+    "professors_event_loop_lag_seconds",
+    "Atraso do event loop medido pelo watchdog (tempo além do intervalo esperado).",
+    buckets=_BUCKETS,
+)
+EVENT_LOOP_STALLS = Counter(
+    "professors_event_loop_stalls",
+    "Travamentos do event loop acima do limite configurado, por rota em execução.",
+    ["route"],
+)
+EVENT_LOOP_STALL_DURATION = Histogram(
+    "professors_event_loop_stall_seconds",
+    "Duração dos travamentos do event loop, por rota em execução.",
+    ["route"],
+    buckets=_BUCKETS,
+)
+
+NO_ROUTE = "<none>"
+
+
+@dataclass
+class StallSample:
+    """Amostra de um travamento: rota em execução e pilha da thread do event loop."""
+    route: str
+    detected_at: float
+    stack: List[str]
+    duration: Optional[float] = None
+
+
+class EventLoopWatchdog:
+    """
+    Mede o atraso do event loop e detecta travamentos (código síncrono bloqueando o loop).
+
+    Uma corrotina no loop atualiza um "heartbeat" a cada `interval` segundos e registra
+    o atraso observado. Uma thread separada verifica esse heartbeat; se ele ficar parado
+    por mais de `threshold` segundos, a thread captura a pilha da thread do loop e a rota
+    da requisição cuja task está executando naquele momento.
+    """
+
+    def __init__(
+        self,
+        app: Optional[ASGIApp] = None,
+        interval: float = 0.1,
+        threshold: float = 0.25,
+        max_samples: int = 20,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.app = app
+        self.interval = interval
+        self.threshold = threshold
+        self.recent_stalls: Deque[StallSample] = deque(maxlen=max_samples)
+        self._clock = clock
+        self._requests: Dict["asyncio.Task[Any]", Scope] = {}
+        self._heartbeat = clock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._beat_task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._beat_task is not None
+
+    def track(self, task: "asyncio.Task[Any]", scope: Scope) -> None:
+        self._requests[task] = scope
+
+    def untrack(self, task: "asyncio.Task[Any]") -> None:
+        self._requests.pop(task, None)
+
+    def start(self) -> None:
+        """Inicia o heartbeat no loop atual e a thread de monitoramento."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = self._clock()
+        self._stop.clear()
+        self._beat_task = self._loop.create_task(self._beat())
+        self._thread = threading.Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        self._stop.set()
+        self._beat_task.cancel()
+        try:
+            await self._beat_task
+        except asyncio.CancelledError:
+            pass
+        self._beat_task = None
+        if self._thread is not None:
+            await asyncio.to_thread(self._thread.join)
+            self._thread = None
+
+    async def _beat(self) -> None:
+        while True:
+            expected = self._clock() + self.interval
+            await asyncio.sleep(self.interval)
+            now = self._clock()
+            EVENT_LOOP_LAG.observe(max(0.0, now - expected))
+            self._heartbeat = now
+
+    def _watch(self) -> None:
+        stall: Optional[StallSample] = None
+        stall_started = 0.0
+        while not self._stop.wait(self.interval / 2):
+            heartbeat = self._heartbeat
+            blocked_for = self._clock() - heartbeat
+
+            if stall is None and blocked_for > self.threshold + self.interval:
+                stall_started = heartbeat
+                stall = self._sample()
+                self.recent_stalls.append(stall)
+                EVENT_LOOP_STALLS.labels(route=stall.route).inc()
+                logger.warning(
+                    "Event loop bloqueado há %.3fs na rota %s:\n%s",
+                    blocked_for, stall.route, "".join(stall.stack),
+                )
+            elif stall is not None and heartbeat != stall_started:
+                stall.duration = max(0.0, heartbeat - stall_started - self.interval)
+                EVENT_LOOP_STALL_DURATION.labels(route=stall.route).observe(stall.duration)
+                stall = None
+
+    def _sample(self) -> StallSample:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = traceback.format_stack(frame) if frame is not None else []
+        return StallSample(route=self._current_route(), detected_at=time.time(), stack=stack)
+
+    def _current_route(self) -> str:
+        task = asyncio.current_task(self._loop) if self._loop is not None else None
+        scope = self._requests.get(task) if task is not None else None
+        if scope is None:
+            return NO_ROUTE
+
+        for route in getattr(getattr(self.app, "router", None), "routes", []):
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return f"{scope.get('method', '')} {route.path}".strip()
+        return f"{scope.get('method', '')} <unmatched>".strip()
+
+
+class LoopWatchdogMiddleware:
+    """Middleware ASGI que associa cada task de requisição ao seu `scope` para o watchdog."""
+
+    def __init__(self, app: ASGIApp, watchdog: EventLoopWatchdog):
+        self.app = app
+        self.watchdog = watchdog
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.watchdog.running:
+            await self.app(scope, receive, send)
+            return
+
+        task = asyncio.current_task()
+        self.watchdog.track(task, scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.watchdog.untrack(task)
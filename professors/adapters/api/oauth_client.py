@@ -0,0 +1,98 @@
+from typing import Iterator, Optional
+
+import httpx
+from prometheus_client import Counter, Gauge
+from prometheus_client.core import GaugeMetricFamily, REGISTRY
+from prometheus_client.registry import Collector
+
+from professors.config import Settings, get_settings
+
+OAUTH_HTTP_IN_FLIGHT = Gauge(
+    "professors_oauth_http_requests_in_flight",
+    "Requisições ao serviço de OAuth em andamento (incluindo as que aguardam conexão).",
+)
+OAUTH_HTTP_POOL_TIMEOUTS = Counter(
+    "professors_oauth_http_pool_timeouts",
+    "Requisições ao serviço de OAuth que esgotaram o tempo aguardando uma conexão do pool.",
+)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def create_oauth_client(settings: Settings) -> httpx.AsyncClient:
+    """Cria o cliente HTTP (com pool de conexões) usado para falar com o serviço de OAuth."""
+    limits = httpx.Limits(
+        max_connections=settings.OAUTH_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.OAUTH_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.OAUTH_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    )
+    timeout = httpx.Timeout(
+        connect=settings.OAUTH_HTTP_CONNECT_TIMEOUT_SECONDS,
+        read=settings.OAUTH_HTTP_READ_TIMEOUT_SECONDS,
+        write=settings.OAUTH_HTTP_READ_TIMEOUT_SECONDS,
+        pool=settings.OAUTH_HTTP_POOL_TIMEOUT_SECONDS,
+    )
+    return httpx.AsyncClient(limits=limits, timeout=timeout)
+
+
+async def start_oauth_client() -> httpx.AsyncClient:
+    """Abre o cliente compartilhado (chamado no `lifespan` da aplicação)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_oauth_client(get_settings())
+    return _client
+
+
+async def close_oauth_client() -> None:
+    """Fecha o cliente compartilhado e suas conexões (chamado no encerramento)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_oauth_client() -> httpx.AsyncClient:
+    """
+    Retorna o cliente compartilhado.
+    Se o `lifespan` não tiver sido executado (ex: scripts), cria o cliente sob demanda.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_oauth_client(get_settings())
+    return _client
+
+
+class OAuthPoolCollector(Collector):
+    """Expõe o estado do pool de conexões do cliente de OAuth no momento da coleta."""
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        connections = GaugeMetricFamily(
+            "professors_oauth_http_pool_connections",
+            "Conexões abertas no pool do cliente de OAuth, por estado.",
+            labels=["state"],
+        )
+        queued = GaugeMetricFamily(
+            "professors_oauth_http_pool_queued_requests",
+            "Requisições ao serviço de OAuth aguardando uma conexão livre do pool.",
+        )
+
+        # O httpx não expõe o pool publicamente; lemos o estado do httpcore com cuidado.
+        pool = getattr(getattr(_client, "_transport", None), "_pool", None)
+        if pool is not None:
+            pool_connections = list(getattr(pool, "_connections", []))
+            idle = sum(1 for connection in pool_connections if connection.is_idle())
+            connections.add_metric(["active"], len(pool_connections) - idle)
+            connections.add_metric(["idle"], idle)
+            queued.add_metric(
+                [], sum(1 for request in list(getattr(pool, "_requests", [])) if request.is_queued())
+            )
+        else:
+            connections.add_metric(["active"], 0)
+            connections.add_metric(["idle"], 0)
+            queued.add_metric([], 0)
+
+        yield connections
+        yield queued
+
+
+REGISTRY.register(OAuthPoolCollector())
@@ -0,0 +1,40 @@
+import base64
+import binascii
+from typing import Optional
+
+from fastapi import HTTPException, Request, Response, status
+from pydantic import ValidationError
+
+from professors.core.domain.pagination import Keyset, Page
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(keyset: Keyset) -> str:
+    """Codifica a posição da página como um cursor opaco (base64 url-safe)."""
+    return base64.urlsafe_b64encode(keyset.model_dump_json().encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Keyset]:
+    """Decodifica um cursor recebido do cliente. Cursores malformados geram 400."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        return Keyset.model_validate_json(raw)
+    except (binascii.Error, ValueError, ValidationError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor inválido."
+        )
+
+
+def add_pagination_headers(request: Request, response: Response, page: Page) -> None:
+    """Adiciona o link para a próxima página (`Link: <...>; rel="next"` e `X-Next-Cursor`)."""
+    if page.next_keyset is None:
+        return
+    cursor = encode_cursor(page.next_keyset)
+    next_url = request.url.include_query_params(cursor=cursor)
+    response.headers["Link"] = f'<{next_url}>; rel="next"'
+    response.headers["X-Next-Cursor"] = cursor
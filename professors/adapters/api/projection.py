@@ -0,0 +1,30 @@
+from typing import List, Optional, Type
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+
+from professors.core.domain.errors import UnknownFieldsError
+from professors.core.domain.projection import resolve_fields
+
+# Parâmetro ?fields=id,name,status das leituras de professores e graduações
+FIELDS_QUERY = Query(
+    None,
+    description="Campos a retornar, separados por vírgula (ex: id,name,status). `id` sempre é incluído.",
+)
+
+
+def parse_fields(fields: Optional[str], response_model: Optional[Type[BaseModel]] = None) -> Optional[List[str]]:
+    """
+    Separa o valor de ?fields= em nomes de campos. O serviço valida contra o modelo de
+    domínio; com `response_model`, os campos também têm de existir no schema de resposta
+    (ex.: `GraduationResponse` não expõe `professor_id`, que o domínio tem).
+    """
+    if fields is None:
+        return None
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    if names and response_model is not None:
+        try:
+            resolve_fields(response_model, names)
+        except UnknownFieldsError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return names or None
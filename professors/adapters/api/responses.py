@@ -0,0 +1,42 @@
+from functools import lru_cache
+from typing import Any, Dict, Tuple, Type
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from professors.core.domain.graduation_models import Graduation
+from professors.adapters.api.schemas.graduation_schemas import GraduationResponse
+
+# Modelos de domínio cujo schema de resposta expõe menos campos que o domínio
+_RESPONSE_SCHEMAS: Dict[Type[BaseModel], Type[BaseModel]] = {
+    Graduation: GraduationResponse,
+}
+
+
+@lru_cache(maxsize=None)
+def _response_fields(model: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(_RESPONSE_SCHEMAS.get(model, model).model_fields)
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        # Lê os atributos direto do modelo (sem model_dump / nova validação)
+        values = obj.__dict__
+        return {name: values[name] for name in _response_fields(type(obj)) if name in values}
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONModelResponse(JSONResponse):
+    """
+    Resposta JSON serializada com orjson, que aceita diretamente os modelos de domínio.
+
+    Quando a rota retorna esta resposta, o FastAPI não valida o conteúdo de novo contra o
+    `response_model` nem passa pelo `jsonable_encoder`: os modelos (construídos sem
+    revalidação pelos repositórios) vão direto para o orjson. UUIDs, enums e datas são
+    tratados nativamente; os campos de cada modelo seguem o schema de resposta
+    correspondente (ex.: `Graduation` -> `GraduationResponse`, sem `professor_id`).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default)
@@ -17,7 +17,7 @@ router = APIRouter(
 
 # Função auxiliar para verificar se o professor existe
 async def get_professor(id: uuid.UUID, service: ProfessorService = Depends(get_professor_service)):
-    return service.get_professor_by_id(id)
+    return await service.get_professor_by_id(id)
 
 
 @router.get(
@@ -1,8 +1,9 @@
 import uuid
-from typing import List
-from fastapi import APIRouter, Depends, status
-from professors.dependencies import get_professor_service, get_graduation_service
-from professors.core.services.professor_service import ProfessorService
+from typing import Dict, List, Optional, Union
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from professors.dependencies import (
+    get_graduation_service, get_graduation_service_factory, graduation_directory
+)
 from professors.core.services.graduation_service import GraduationService
 from professors.core.domain.graduation_models import GraduationCreate, GraduationUpdate
 from professors.adapters.api.schemas.graduation_schemas import (
@@ -11,18 +12,39 @@ from professors.adapters.api.schemas.graduation_schemas import (
     GraduationUpdateRequest,
 )
 from professors.adapters.api.auth import validate_token
+from professors.adapters.api.pagination import (
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, add_pagination_headers, decode_cursor
+)
+from professors.adapters.api.collection_cache import CollectionCache
+from professors.adapters.api.export import ExportFormat, export_response
+from professors.adapters.api.etag import (
+    attribute, etag_matches, graduations_list_etag, parse_if_match, version_etag_headers
+)
+from professors.adapters.api.lookup import BATCH_SIZE_HEADER, check_lookup_size, parse_id_list
+from professors.adapters.api.projection import FIELDS_QUERY, parse_fields
+from professors.adapters.api.responses import ORJSONModelResponse
+from professors.adapters.api.single_flight import SingleFlight, coalesced_json_response
+from professors.config import settings
 
 # UM Roteador, sem prefixo geral.
 # A tag "Graduations" será usada para todos.
+# As rotas retornam ORJSONModelResponse diretamente (sem revalidar contra o response_model)
 router = APIRouter(
     tags=["Graduations"],
-    dependencies=[Depends(validate_token)]
+    dependencies=[Depends(validate_token)],
+    default_response_class=ORJSONModelResponse
 )
 
-# Dependência para garantir que o professor existe (usada nas rotas aninhadas)
-async def get_professor(professor_id: uuid.UUID, service: ProfessorService = Depends(get_professor_service)):
-    return service.get_professor_by_id(professor_id)
+# Leituras simultâneas das graduações do mesmo professor compartilham uma consulta
+professor_graduation_reads = SingleFlight("professor_graduations")
 
+# Listagem geral: ETag / 304 pela versão da tabela e corpos serializados reaproveitados
+graduation_listings = CollectionCache(
+    "graduations", settings.COLLECTION_CACHE_MAX_ENTRIES, settings.COLLECTION_CACHE_TTL_SECONDS
+)
+
+# Nas rotas aninhadas, a existência do professor (e a posse da graduação) é verificada
+# pela própria consulta do repositório: professor inexistente => 404 "Professor not found.".
 
 # POST - /api/v1/professors/{professor_id}/graduations/
 @router.post(
@@ -31,14 +53,16 @@ async def get_professor(professor_id: uuid.UUID, service: ProfessorService = Dep
     status_code=status.HTTP_201_CREATED,
     summary="Criar graduação para um professor"
 )
-def create_graduation(
+async def create_graduation(
     professor_id: uuid.UUID,
     request: GraduationCreateRequest,
-    service: GraduationService = Depends(get_graduation_service),
-    professor: dict = Depends(get_professor) # Valida o professor
+    service: GraduationService = Depends(get_graduation_service)
 ):
     graduation_create = GraduationCreate(**request.model_dump())
-    return service.create_graduation(professor_id, graduation_create)
+    return ORJSONModelResponse(
+        await service.create_graduation(professor_id, graduation_create),
+        status_code=status.HTTP_201_CREATED
+    )
 
 # GET (id prof) - /api/v1/professors/{professor_id}/graduations/
 @router.get(
@@ -46,12 +70,40 @@ def create_graduation(
     response_model=List[GraduationResponse],
     summary="Listar graduações de um professor específico"
 )
-def get_all_graduations_for_professor(
+async def get_all_graduations_for_professor(
     professor_id: uuid.UUID,
+    fields: Optional[str] = FIELDS_QUERY,
+    if_none_match: Optional[str] = Header(None),
     service: GraduationService = Depends(get_graduation_service),
-    professor: dict = Depends(get_professor) # Valida o professor
+    open_service=Depends(get_graduation_service_factory)
 ):
-    return service.get_all_graduations_for_professor(professor_id)
+    """
+    A resposta tem um ETag forte; com `If-None-Match` igual, retorna 304 consultando só as
+    versões. Requisições simultâneas idênticas são atendidas por uma única leitura (single-flight).
+    """
+    field_names = parse_fields(fields, GraduationResponse)
+
+    async def current_etag(service: GraduationService) -> str:
+        return graduations_list_etag(await service.get_graduation_versions(professor_id), field_names)
+
+    if if_none_match is not None:
+        etag = await current_etag(service)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    async def load(service: GraduationService):
+        # Projeção sem id/version: o ETag é lido antes das linhas (ver get_professor)
+        if field_names and not {"id", "version"} <= set(field_names):
+            etag = await current_etag(service)
+            return await service.get_all_graduations_for_professor(professor_id, fields=field_names), etag
+        graduations = await service.get_all_graduations_for_professor(professor_id, fields=field_names)
+        versions = [(attribute(g, "id"), attribute(g, "version")) for g in graduations]
+        if not all(isinstance(version, int) for _, version in versions):
+            return graduations, None
+        return graduations, graduations_list_etag(versions, field_names)
+
+    key = (professor_id, tuple(field_names) if field_names else None)
+    return await coalesced_json_response(professor_graduation_reads, key, load, open_service)
 
 # PUT - /api/v1/professors/{professor_id}/graduations/{graduation_id}
 @router.put(
@@ -59,16 +111,19 @@ def get_all_graduations_for_professor(
     response_model=GraduationResponse,
     summary="Atualizar uma graduação"
 )
-def update_graduation(
+async def update_graduation(
     graduation_id: uuid.UUID,
     request: GraduationUpdateRequest,
     professor_id: uuid.UUID, # Pega do path
-    service: GraduationService = Depends(get_graduation_service),
-    professor: dict = Depends(get_professor) # Valida o professor
+    if_match: Optional[str] = Header(None),
+    service: GraduationService = Depends(get_graduation_service)
 ):
-    # O professor_id aqui serve para validar o path e a existência do professor.
+    """Com `If-Match: "v{versão}"`, só grava se a versão ainda for a mesma (senão 412)."""
     graduation_update = GraduationUpdate(**request.model_dump())
-    return service.update_graduation(graduation_id, graduation_update)
+    updated = await service.update_graduation(
+        professor_id, graduation_id, graduation_update, expected_version=parse_if_match(if_match)
+    )
+    return ORJSONModelResponse(updated, headers=version_etag_headers(updated))
 
 # DELETE - /api/v1/professors/{professor_id}/graduations/{graduation_id}
 @router.delete(
@@ -76,14 +131,12 @@ def update_graduation(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Excluir uma graduação"
 )
-def delete_graduation(
+async def delete_graduation(
     graduation_id: uuid.UUID,
     professor_id: uuid.UUID, # Pega do path
-    service: GraduationService = Depends(get_graduation_service),
-    professor: dict = Depends(get_professor) # Valida o professor
+    service: GraduationService = Depends(get_graduation_service)
 ):
-    # Valida o professor antes de tentar deletar
-    service.delete_graduation(graduation_id)
+    await service.delete_graduation(professor_id, graduation_id)
 
 
 # --- Endpoint Geral (Independente do Professor) ---
@@ -91,14 +144,80 @@ def delete_graduation(
 # GET ALL - /api/v1/graduations/
 @router.get(
     "/api/v1/graduations/",
-    response_model=List[GraduationResponse],
+    response_model=Union[List[GraduationResponse], Dict[str, List[GraduationResponse]]],
     summary="Listar todas as graduações do sistema"
 )
-def get_all_graduations(
+async def get_all_graduations(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Tamanho da página (ativa a paginação)"),
+    cursor: Optional[str] = Query(None, description="Cursor opaco da próxima página (header Link / X-Next-Cursor)"),
+    fields: Optional[str] = FIELDS_QUERY,
+    professor_ids: Optional[List[str]] = Query(
+        None, description="IDs de professores (separados por vírgula): graduações agrupadas por professor"
+    ),
     service: GraduationService = Depends(get_graduation_service)
 ):
     """
     Lista todas as graduações cadastradas no sistema,
     independentemente do professor.
+    Com `limit` e/ou `cursor`, a listagem é paginada (keyset, ordenada por id).
+    Com `fields=...`, somente essas colunas são lidas e retornadas.
+    Com `professor_ids=...`, retorna um objeto com uma chave por ID pedido (UUID em texto),
+    cada uma com a lista completa de graduações daquele professor (lista vazia se ele não
+    tiver graduações ou não existir): `{"<professor_id>": [{"id": ..., "degree": ...}], ...}`.
+    O lote inteiro é lido em uma única consulta (limitado a `LOOKUP_MAX_IDS`; tamanho no
+    header `X-Batch-Size`) e não aceita `fields`, `limit` nem `cursor` (400).
+    A resposta tem `ETag` e `Last-Modified` derivados da versão da tabela: com
+    `If-None-Match` / `If-Modified-Since` atualizados, retorna 304 sem ler as graduações.
+    Sem nenhum parâmetro, a listagem completa vem de um snapshot pré-serializado (e em gzip).
+    """
+    if professor_ids is not None:
+        if fields is not None or limit is not None or cursor is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="'professor_ids' cannot be combined with 'fields', 'limit' or 'cursor'."
+            )
+        ids = parse_id_list(professor_ids)
+        check_lookup_size(len(ids))
+
+    field_names = parse_fields(fields, GraduationResponse)
+
+    async def build() -> ORJSONModelResponse:
+        if professor_ids is not None:
+            grouped = await service.get_graduations_for_professors(ids)
+            return ORJSONModelResponse(
+                {str(professor_id): graduations for professor_id, graduations in grouped.items()},
+                headers={BATCH_SIZE_HEADER: str(len(ids))},
+            )
+        if limit is not None or cursor is not None:
+            page = await service.get_graduations_page(
+                limit or DEFAULT_PAGE_SIZE, decode_cursor(cursor), fields=field_names
+            )
+            response = ORJSONModelResponse(page.items)
+            add_pagination_headers(request, response, page)
+            return response
+        return ORJSONModelResponse(await service.get_all_graduations(fields=field_names))
+
+    # As versões são lidas antes dos dados (ver CollectionCache)
+    versions = await service.get_listing_versions()
+    snapshot = graduation_directory if not request.query_params else None
+    return await graduation_listings.respond(request, versions, build, snapshot=snapshot)
+
+# EXPORT - /api/v1/graduations/export
+@router.get(
+    "/api/v1/graduations/export",
+    summary="Exportar todas as graduações (streaming NDJSON ou CSV)"
+)
+async def export_graduations(
+    format: ExportFormat = Query(ExportFormat.ndjson, description="Formato: ndjson ou csv"),
+    service: GraduationService = Depends(get_graduation_service)
+):
+    """
+    Exporta todas as graduações em streaming, lendo o banco em lotes (cursor do servidor).
     """
-    return service.get_all_graduations()
\ No newline at end of file
+    return export_response(
+        service.export_graduations(settings.EXPORT_CHUNK_SIZE),
+        format,
+        fieldnames=["id", "professor_id", "degree", "course", "institution_name", "year"],
+        filename="graduations",
+    )
@@ -1,19 +1,51 @@
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Body, Header, Request, Response
+from pydantic import ValidationError
+from typing import Any, List, Optional, Union
 
 from professors.core.domain.professor_models import Professor, ProfessorCreate, ProfessorUpdate
 from professors.core.services.professor_service import ProfessorService
 from professors.adapters.api.schemas.professor_schemas import (
-    ProfessorResponse, ProfessorCreateRequest, ProfessorUpdateRequest
+    ProfessorResponse, ProfessorCreateRequest, ProfessorUpdateRequest,
+    BatchItemStatus, ProfessorBatchItemResult, ProfessorBatchResponse,
+    ProfessorBulkSelection, ProfessorBulkResponse,
+    ProfessorInclude, ProfessorWithGraduationsResponse,
+    ProfessorLookupRequest, ProfessorLookupResponse, ProfessorNameSuggestion
+)
+from professors.dependencies import (
+    get_professor_autocomplete_service, get_professor_service, get_professor_service_factory,
+    professor_directory
 )
-from professors.dependencies import get_professor_service
 from professors.adapters.api.auth import validate_token  # <-- Importado
+from professors.adapters.api.pagination import (
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, add_pagination_headers, decode_cursor
+)
+from professors.adapters.api.collection_cache import CollectionCache
+from professors.adapters.api.export import ExportFormat, export_response
+from professors.adapters.api.etag import (
+    attribute, etag_matches, parse_if_match, professor_etag, version_etag_headers, version_of
+)
+from professors.adapters.api.lookup import BATCH_SIZE_HEADER, check_lookup_size
+from professors.adapters.api.projection import FIELDS_QUERY, parse_fields
+from professors.adapters.api.responses import ORJSONModelResponse
+from professors.adapters.api.single_flight import SingleFlight, coalesced_json_response
+from professors.config import settings
 
+# As rotas retornam ORJSONModelResponse diretamente: o response_model fica só para a
+# documentação (OpenAPI), sem uma segunda validação dos modelos já construídos.
 router = APIRouter(
     prefix="/api/v1/professors",
     tags=["Professors"],
-    dependencies=[Depends(validate_token)]
+    dependencies=[Depends(validate_token)],
+    default_response_class=ORJSONModelResponse
+)
+
+# Leituras simultâneas do mesmo professor compartilham uma consulta e uma serialização
+professor_reads = SingleFlight("professor_detail")
+
+# Listagem: ETag / 304 pelas versões das tabelas e corpos serializados reaproveitados
+professor_listings = CollectionCache(
+    "professors", settings.COLLECTION_CACHE_MAX_ENTRIES, settings.COLLECTION_CACHE_TTL_SECONDS
 )
 
 # --- CRUD Principal ---
@@ -24,14 +56,14 @@ router = APIRouter(
     status_code=status.HTTP_201_CREATED,
     summary="Create a new professor"
 )
-def create_professor(
+async def create_professor(
     professor_data: ProfessorCreateRequest,
     service: ProfessorService = Depends(get_professor_service)
 ):
     try:
         professor_create = ProfessorCreate(**professor_data.model_dump())
-        created_professor = service.create_professor(professor_create)
-        return created_professor
+        created_professor = await service.create_professor(professor_create)
+        return ORJSONModelResponse(created_professor, status_code=status.HTTP_201_CREATED)
         
     except HTTPException as e:
         raise e
@@ -41,33 +73,307 @@ def create_professor(
             detail=f"Erro ao criar professor: {str(e)}"
         )
 
+@router.post(
+    "/batch",
+    response_model=ProfessorBatchResponse,
+    summary="Create professors in batch"
+)
+async def create_professors_batch(
+    items: List[Any] = Body(..., description="Array de professores (mesmo formato do POST /)"),
+    service: ProfessorService = Depends(get_professor_service)
+):
+    """
+    Cria vários professores com INSERTs multi-linha.
+    Cada item recebe um resultado: `created`, `conflict` (registration_number ou
+    e-mail já existentes / repetidos no lote) ou `invalid` (erros de validação).
+    """
+    if len(items) > settings.PROFESSOR_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch too large: {len(items)} items (max {settings.PROFESSOR_BATCH_MAX_SIZE})."
+        )
+
+    results: List[Optional[ProfessorBatchItemResult]] = [None] * len(items)
+    valid_indexes: List[int] = []
+    to_create: List[ProfessorCreate] = []
+    for index, item in enumerate(items):
+        try:
+            request = ProfessorCreateRequest.model_validate(item)
+        except ValidationError as e:
+            results[index] = ProfessorBatchItemResult(
+                index=index,
+                status=BatchItemStatus.invalid,
+                errors=e.errors(include_url=False, include_context=False),
+            )
+            continue
+        valid_indexes.append(index)
+        to_create.append(ProfessorCreate(**request.model_dump()))
+
+    created = await service.create_professors(to_create) if to_create else []
+    for index, professor in zip(valid_indexes, created):
+        if professor is None:
+            results[index] = ProfessorBatchItemResult(index=index, status=BatchItemStatus.conflict)
+        else:
+            results[index] = ProfessorBatchItemResult(
+                index=index, status=BatchItemStatus.created, professor=professor
+            )
+
+    return ORJSONModelResponse(ProfessorBatchResponse(
+        created=sum(1 for r in results if r.status == BatchItemStatus.created),
+        conflicts=sum(1 for r in results if r.status == BatchItemStatus.conflict),
+        invalid=sum(1 for r in results if r.status == BatchItemStatus.invalid),
+        results=results,
+    ))
+
+def _check_bulk_size(selection: ProfessorBulkSelection) -> None:
+    if selection.ids is not None and len(selection.ids) > settings.PROFESSOR_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Too many ids: {len(selection.ids)} (max {settings.PROFESSOR_BATCH_MAX_SIZE})."
+        )
+
+@router.post(
+    "/bulk/delete",
+    response_model=ProfessorBulkResponse,
+    summary="Delete professors by ids and/or status"
+)
+async def delete_professors_bulk(
+    selection: ProfessorBulkSelection,
+    service: ProfessorService = Depends(get_professor_service)
+):
+    """
+    Remove, em um único DELETE, os professores selecionados por `ids` e/ou `status`
+    (as graduações são removidas pelo ON DELETE CASCADE).
+    """
+    _check_bulk_size(selection)
+    affected = await service.delete_professors(ids=selection.ids, status_filter=selection.status)
+    return ORJSONModelResponse(ProfessorBulkResponse(affected=affected))
+
+@router.post(
+    "/bulk/deactivate",
+    response_model=ProfessorBulkResponse,
+    summary="Deactivate professors by ids and/or status"
+)
+async def deactivate_professors_bulk(
+    selection: ProfessorBulkSelection,
+    service: ProfessorService = Depends(get_professor_service)
+):
+    """Marca como `inactive`, em um único UPDATE, os professores selecionados por `ids` e/ou `status`."""
+    _check_bulk_size(selection)
+    affected = await service.deactivate_professors(ids=selection.ids, status_filter=selection.status)
+    return ORJSONModelResponse(ProfessorBulkResponse(affected=affected))
+
+@router.post(
+    "/lookup",
+    response_model=ProfessorLookupResponse,
+    summary="Look up professors by a list of ids"
+)
+async def lookup_professors(
+    lookup: ProfessorLookupRequest,
+    fields: Optional[str] = FIELDS_QUERY,
+    service: ProfessorService = Depends(get_professor_service)
+):
+    """
+    Resolve um lote de IDs em uma única consulta (`WHERE id = ANY(...)`), no lugar de um
+    `GET /{id}` por professor. O lote é limitado a `LOOKUP_MAX_IDS` IDs distintos; o
+    tamanho consultado vem em `requested` e no header `X-Batch-Size`.
+    """
+    ids = list(dict.fromkeys(lookup.ids))
+    check_lookup_size(len(ids))
+    professors = await service.lookup_professors(ids, fields=parse_fields(fields))
+    found = {p["id"] if isinstance(p, dict) else p.id for p in professors}
+    return ORJSONModelResponse(
+        {
+            "requested": len(ids),
+            "found": len(professors),
+            "missing": [professor_id for professor_id in ids if professor_id not in found],
+            "professors": professors,
+        },
+        headers={BATCH_SIZE_HEADER: str(len(ids))},
+    )
+
+AUTOCOMPLETE_DEFAULT_LIMIT = 10
+AUTOCOMPLETE_MAX_LIMIT = 50
+
+INCLUDE_QUERY = Query(None, description="Recursos relacionados a embutir (ex: graduations)")
+
 @router.get(
     "/",
-    response_model=List[Professor],
+    response_model=Union[List[ProfessorWithGraduationsResponse], List[Professor]],
     summary="Search for professors" 
 )
 async def search_professors(
+    request: Request,
     name: Optional[str] = Query(None, description="Filtrar por nome (parcial)"),
     status: Optional[str] = Query(None, description="Filtrar por status (exato)"),
+    degree: Optional[str] = Query(None, description="Com graduação neste grau (exato, ex: Doutorado)"),
+    course: Optional[str] = Query(None, description="Com graduação neste curso (exato)"),
+    institution_name: Optional[str] = Query(None, description="Com graduação nesta instituição (exato)"),
+    year_min: Optional[int] = Query(None, description="Com graduação concluída a partir deste ano"),
+    year_max: Optional[int] = Query(None, description="Com graduação concluída até este ano"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Tamanho da página (ativa a paginação)"),
+    cursor: Optional[str] = Query(None, description="Cursor opaco da próxima página (header Link / X-Next-Cursor)"),
+    include: Optional[ProfessorInclude] = INCLUDE_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
+    service: ProfessorService = Depends(get_professor_service)
+):
+    """
+    Busca todos os professores ou filtra por critérios.
+    Com `limit` e/ou `cursor`, a listagem é paginada (keyset, ordenada por id) e o
+    link para a próxima página vem nos headers `Link` (rel="next") e `X-Next-Cursor`.
+    Com `include=graduations`, as graduações de todos os professores retornados são
+    carregadas em uma única consulta e embutidas em cada professor.
+    Com `fields=id,name`, somente essas colunas são lidas do banco e retornadas.
+    Os filtros de graduação (`degree`, `course`, `institution_name`, `year_min`,
+    `year_max`) selecionam os professores com ao menos uma graduação que atenda a todos
+    eles (ex: `?degree=Doutorado&institution_name=USP&year_min=2016`).
+    A resposta tem `ETag` e `Last-Modified` derivados das versões das tabelas lidas: com
+    `If-None-Match` / `If-Modified-Since` atualizados, retorna 304 sem ler os professores.
+    Sem nenhum parâmetro, a listagem completa vem de um snapshot pré-serializado (e em gzip).
+    """ 
+    params = {
+        "name": name, "status": status,
+        "degree": degree, "course": course, "institution_name": institution_name,
+        "year_min": year_min, "year_max": year_max,
+    }
+    field_names = parse_fields(fields)
+    embed = include == ProfessorInclude.graduations
+
+    async def build() -> ORJSONModelResponse:
+        page = None
+        if limit is not None or cursor is not None:
+            page = await service.get_professors_page(
+                params, limit or DEFAULT_PAGE_SIZE, decode_cursor(cursor), fields=field_names
+            )
+            professors = page.items
+        elif any(value is not None for value in params.values()):
+            professors = await service.search_professors(params, fields=field_names)
+        else:
+            professors = await service.get_all_professors(fields=field_names)
+
+        if embed:
+            professors = await service.include_graduations(professors)
+
+        response = ORJSONModelResponse(professors)
+        if page is not None:
+            add_pagination_headers(request, response, page)
+        return response
+
+    # As versões são lidas antes dos dados (ver CollectionCache)
+    versions = await service.get_listing_versions(params, include_graduations=embed)
+    snapshot = professor_directory if not request.query_params else None
+    return await professor_listings.respond(request, versions, build, snapshot=snapshot)
+
+@router.get(
+    "/search",
+    response_model=List[Professor],
+    summary="Fuzzy search professors by name"
+)
+async def search_professors_by_name(
+    q: str = Query(..., min_length=1, description="Trecho do nome (tolera erros de digitação)"),
+    limit: int = Query(
+        settings.PROFESSOR_SEARCH_DEFAULT_LIMIT, ge=1, le=settings.PROFESSOR_SEARCH_MAX_LIMIT,
+        description="Quantidade máxima de resultados"
+    ),
+    accent_insensitive: bool = Query(False, description="Ignorar acentos (ex: 'joao' encontra 'João')"),
+    fields: Optional[str] = FIELDS_QUERY,
     service: ProfessorService = Depends(get_professor_service)
 ):
-    """Busca todos os professores ou filtra por critérios.""" 
-    if name or status:
-        params = {"name": name, "status": status}
-        return service.search_professors(params)
-    return service.get_all_professors()
+    """
+    Busca aproximada por nome para autocompletar/pesquisa: usa o índice de trigramas
+    (pg_trgm) em vez de varrer a tabela, e retorna os nomes mais parecidos primeiro.
+    """
+    professors = await service.search_professors_by_name(
+        q, limit, accent_insensitive=accent_insensitive, fields=parse_fields(fields)
+    )
+    return ORJSONModelResponse(professors)
+
+@router.get(
+    "/autocomplete",
+    response_model=List[ProfessorNameSuggestion],
+    summary="Autocomplete professor names"
+)
+async def autocomplete_professors(
+    q: str = Query(..., min_length=1, description="Início do nome ou de qualquer palavra do nome"),
+    limit: int = Query(AUTOCOMPLETE_DEFAULT_LIMIT, ge=1, le=AUTOCOMPLETE_MAX_LIMIT, description="Máximo de sugestões"),
+    service: ProfessorService = Depends(get_professor_autocomplete_service)
+):
+    """
+    Sugestões para o campo de busca (typeahead), servidas de um índice de prefixos em
+    memória, sem acesso ao banco. Ignora maiúsculas e acentos ('jo' encontra 'João').
+    """
+    return ORJSONModelResponse(service.autocomplete_professors(q, limit))
+
+@router.get(
+    "/export",
+    summary="Export all professors (streaming NDJSON or CSV)"
+)
+async def export_professors(
+    format: ExportFormat = Query(ExportFormat.ndjson, description="Formato: ndjson ou csv"),
+    service: ProfessorService = Depends(get_professor_service)
+):
+    """
+    Exporta todos os professores em streaming, lendo o banco em lotes (cursor do servidor).
+    O uso de memória não depende do tamanho da tabela.
+    """
+    return export_response(
+        service.export_professors(settings.EXPORT_CHUNK_SIZE),
+        format,
+        fieldnames=["id", "name", "registration_number", "institucional_email", "status"],
+        filename="professors",
+    )
 
 @router.get(
     "/{id}",
-    response_model=Professor,
+    response_model=Union[ProfessorWithGraduationsResponse, Professor],
     summary="Search for a specific professor"
 )
 async def get_professor(
     id: uuid.UUID,
-    service: ProfessorService = Depends(get_professor_service)
+    include: Optional[ProfessorInclude] = INCLUDE_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
+    if_none_match: Optional[str] = Header(None),
+    service: ProfessorService = Depends(get_professor_service),
+    open_service=Depends(get_professor_service_factory)
 ):
-    """Busca um professor específico pelo seu id (UUID)."""
-    return service.get_professor_by_id(id)
+    """
+    Busca um professor específico pelo seu id (UUID). Aceita `include=graduations` e `fields=...`.
+    A resposta tem um ETag forte; com `If-None-Match` igual, retorna 304 consultando só as versões.
+    Requisições simultâneas idênticas são atendidas por uma única leitura (single-flight).
+    """
+    field_names = parse_fields(fields)
+    embed = include == ProfessorInclude.graduations
+
+    async def current_etag(service: ProfessorService) -> str:
+        version = await service.get_professor_version(id)
+        graduations = await service.get_graduation_versions(id) if embed else None
+        return professor_etag(version, graduations, field_names)
+
+    if if_none_match is not None:
+        etag = await current_etag(service)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    async def load(service: ProfessorService):
+        # Projeção sem `version`: o ETag é lido antes da linha. Se ela mudar no meio, o
+        # ETag fica mais antigo que o corpo e o cliente apenas recebe o corpo de novo.
+        etag = None
+        if field_names and "version" not in field_names:
+            etag = await current_etag(service)
+        professor = await service.get_professor_by_id(id, fields=field_names)
+        if embed:
+            [professor] = await service.include_graduations([professor])
+        version = version_of(professor)
+        if etag is None and version is not None:
+            graduations = (
+                [(attribute(g, "id"), attribute(g, "version")) for g in attribute(professor, "graduations")]
+                if embed else None
+            )
+            etag = professor_etag(version, graduations, field_names)
+        return professor, etag
+
+    key = (id, include, tuple(field_names) if field_names else None)
+    return await coalesced_json_response(professor_reads, key, load, open_service)
 
 @router.put(
     "/{id}",
@@ -77,11 +383,16 @@ async def get_professor(
 async def update_professor(
     id: uuid.UUID,
     professor_in: ProfessorUpdateRequest,
+    if_match: Optional[str] = Header(None),
     service: ProfessorService = Depends(get_professor_service)
 ):
-    """Atualiza um professor (substituição completa - PUT).""" 
+    """
+    Atualiza um professor (substituição completa - PUT).
+    Com `If-Match: "v{versão}"`, só grava se a versão ainda for a mesma (senão 412).
+    """
     professor_data = ProfessorUpdate(**professor_in.model_dump())
-    return service.update_professor(id, professor_data)
+    updated = await service.update_professor(id, professor_data, expected_version=parse_if_match(if_match))
+    return ORJSONModelResponse(updated, headers=version_etag_headers(updated))
 
 @router.delete(
     "/{id}",
@@ -93,5 +404,5 @@ async def delete_professor(
     service: ProfessorService = Depends(get_professor_service)
 ):
     """Deleta um professor específico."""
-    service.delete_professor(id)
+    await service.delete_professor(id)
     return
@@ -15,6 +15,7 @@ class GraduationUpdateRequest(GraduationBase):
 
 class GraduationResponse(GraduationBase):
     id: uuid.UUID
+    version: int = Field(1, description="Versão do registro (usada no ETag / If-Match)")
 
     class Config:
         from_attributes = True
@@ -1,6 +1,9 @@
 import uuid
+from enum import Enum
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict
+
+from professors.adapters.api.schemas.graduation_schemas import GraduationResponse
 
 # Campos base do professor
 class ProfessorBase(BaseModel):
@@ -16,11 +19,61 @@ class ProfessorCreateRequest(ProfessorBase):
 # Schema para o Response Body (GET, POST, PUT)
 class ProfessorResponse(ProfessorBase):
     id: uuid.UUID = Field(..., description="ID único do registro no banco (UUID)")
+    version: int = Field(1, description="Versão do registro (usada no ETag / If-Match)")
     
     model_config = ConfigDict(
         from_attributes=True,
     )
 
+# Schema para o Response Body com ?include=graduations
+class ProfessorWithGraduationsResponse(ProfessorResponse):
+    graduations: List[GraduationResponse] = Field(default_factory=list)
+
+# Valores aceitos em ?include=
+class ProfessorInclude(str, Enum):
+    graduations = "graduations"
+
 # Schema para o Request Body do PUT
 class ProfessorUpdateRequest(ProfessorBase):
-    pass
\ No newline at end of file
+    pass
+
+# Resultado por item do POST /batch
+class BatchItemStatus(str, Enum):
+    created = "created"
+    conflict = "conflict"
+    invalid = "invalid"
+
+class ProfessorBatchItemResult(BaseModel):
+    index: int = Field(..., description="Posição do item no array enviado")
+    status: BatchItemStatus
+    professor: Optional[ProfessorResponse] = None
+    errors: Optional[List[Dict[str, Any]]] = Field(None, description="Erros de validação (status = invalid)")
+
+class ProfessorBatchResponse(BaseModel):
+    created: int
+    conflicts: int
+    invalid: int
+    results: List[ProfessorBatchItemResult]
+
+# Seleção para as operações em lote (POST /bulk/delete, POST /bulk/deactivate)
+class ProfessorBulkSelection(BaseModel):
+    ids: Optional[List[uuid.UUID]] = Field(None, description="IDs dos professores")
+    status: Optional[str] = Field(None, description="Seleciona os professores com este status")
+
+class ProfessorBulkResponse(BaseModel):
+    affected: int = Field(..., description="Quantidade de professores afetados")
+
+# POST /lookup: resolução de um lote de IDs
+class ProfessorLookupRequest(BaseModel):
+    ids: List[uuid.UUID] = Field(..., description="IDs dos professores")
+
+class ProfessorLookupResponse(BaseModel):
+    requested: int = Field(..., description="Quantidade de IDs distintos pedidos")
+    found: int = Field(..., description="Quantidade de professores encontrados")
+    missing: List[uuid.UUID] = Field(..., description="IDs pedidos que não existem")
+    professors: List[ProfessorResponse]
+
+# Sugestão do autocompletar de nomes (GET /api/v1/professors/autocomplete)
+class ProfessorNameSuggestion(BaseModel):
+    id: uuid.UUID
+    name: str
@@ -0,0 +1,137 @@
+import asyncio
+from collections import OrderedDict
+from typing import (
+    Any, AsyncContextManager, Awaitable, Callable, Dict, Hashable, Iterator, List, Optional, Tuple, TypeVar
+)
+import weakref
+
+from prometheus_client import Counter
+from prometheus_client.core import GaugeMetricFamily, REGISTRY
+from prometheus_client.registry import Collector
+from starlette.responses import Response
+
+from professors.adapters.api.responses import ORJSONModelResponse
+from professors.adapters.cache.stale import mark_stale, start_tracking
+
+T = TypeVar("T")
+S = TypeVar("S")
+
+SINGLE_FLIGHT_CALLS = Counter(
+    "professors_single_flight_calls",
+    "Execuções reais (líderes) das leituras coalescidas, por leitura.",
+    ["name"],
+)
+SINGLE_FLIGHT_COALESCED = Counter(
+    "professors_single_flight_coalesced",
+    "Requisições que aguardaram uma leitura idêntica já em andamento, por leitura.",
+    ["name"],
+)
+
+
+class SingleFlight:
+    """
+    Coalescência de chamadas idênticas simultâneas (single-flight).
+
+    A primeira chamada com uma chave executa `fn`; as que chegam enquanto ela está em
+    andamento aguardam o mesmo resultado (ou a mesma exceção). Nada fica guardado depois
+    que a chamada termina: isto não é um cache.
+
+    Os contadores do Prometheus são por leitura (`name`), para não criar uma série por
+    chave; a contagem por chave fica em memória (`hot_keys`), limitada às
+    `max_tracked_keys` chaves coalescidas mais recentemente, e só as `exported_hot_keys`
+    mais coalescidas são expostas (SingleFlightHotKeysCollector).
+    """
+
+    def __init__(self, name: str, max_tracked_keys: int = 1000, exported_hot_keys: int = 10):
+        self.name = name
+        self.max_tracked_keys = max_tracked_keys
+        self.exported_hot_keys = exported_hot_keys
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._coalesced: "OrderedDict[Hashable, int]" = OrderedDict()
+        _flights.add(self)
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+            SINGLE_FLIGHT_CALLS.labels(name=self.name).inc()
+        else:
+            SINGLE_FLIGHT_COALESCED.labels(name=self.name).inc()
+            self._record(key)
+
+        # shield: o cancelamento de uma requisição não cancela a leitura compartilhada
+        return await asyncio.shield(future)
+
+    def hot_keys(self, limit: int = 10) -> List[Tuple[Hashable, int]]:
+        """Chaves com mais requisições coalescidas (entre as rastreadas)."""
+        return sorted(self._coalesced.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+    def _record(self, key: Hashable) -> None:
+        self._coalesced[key] = self._coalesced.get(key, 0) + 1
+        self._coalesced.move_to_end(key)
+        while len(self._coalesced) > self.max_tracked_keys:
+            self._coalesced.popitem(last=False)
+
+    def _forget(self, key: Hashable, done: "asyncio.Future[Any]") -> None:
+        if self._inflight.get(key) is done:
+            del self._inflight[key]
+        # Evita o aviso de exceção não lida quando todos os interessados foram cancelados
+        if not done.cancelled():
+            done.exception()
+
+
+# Instâncias vivas, lidas pelo coletor a cada scrape
+_flights: "weakref.WeakSet[SingleFlight]" = weakref.WeakSet()
+
+
+class SingleFlightHotKeysCollector(Collector):
+    """Expõe, a cada coleta, as chaves mais coalescidas de cada leitura (top-N limitado)."""
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        hot_keys = GaugeMetricFamily(
+            "professors_single_flight_hot_key_coalesced",
+            "Requisições coalescidas das chaves mais disputadas, por leitura e chave.",
+            labels=["name", "key"],
+        )
+        for flight in list(_flights):
+            for key, count in flight.hot_keys(flight.exported_hot_keys):
+                hot_keys.add_metric([flight.name, str(key)], count)
+        yield hot_keys
+
+
+REGISTRY.register(SingleFlightHotKeysCollector())
+
+
+async def coalesced_json_response(
+    flight: SingleFlight,
+    key: Hashable,
+    load: Callable[[S], Awaitable[Tuple[Any, Optional[str]]]],
+    open_service: Callable[[], AsyncContextManager[S]],
+) -> Response:
+    """
+    Executa `load` via single-flight e serializa o resultado uma única vez: as requisições
+    coalescidas recebem o mesmo corpo JSON (e o mesmo ETag, se `load` retornar um). Entradas
+    vencidas do cache usadas pela leitura compartilhada também marcam cada requisição
+    (header Warning).
+
+    `load` recebe um serviço aberto por `open_service`, com sessão própria: a leitura
+    compartilhada sobrevive ao cancelamento da requisição líder (shield), e a sessão da
+    líder é fechada no teardown dela enquanto as demais ainda aguardam.
+    """
+    async def render() -> Tuple[bytes, Optional[str], List[str]]:
+        # Roda em uma task própria: o rastreamento não se mistura com o da requisição líder
+        stale_keys = start_tracking()
+        async with open_service() as service:
+            content, etag = await load(service)
+        return ORJSONModelResponse(content).body, etag, stale_keys
+
+    body, etag, stale_keys = await flight.run(key, render)
+    for stale_key in stale_keys:
+        mark_stale(stale_key)
+    headers = {"ETag": etag} if etag else None
+    return Response(body, media_type=ORJSONModelResponse.media_type, headers=headers)
@@ -0,0 +1,128 @@
+import asyncio
+import gzip
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+
+from prometheus_client import Counter, Gauge
+from starlette.requests import Request
+from starlette.responses import Response
+
+from professors.adapters.api.responses import ORJSONModelResponse
+from professors.core.domain.table_version import TableVersion
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_REBUILDS = Counter(
+    "professors_directory_snapshot_rebuilds",
+    "Reconstruções do snapshot das listagens completas, por listagem e resultado.",
+    ["name", "result"],
+)
+SNAPSHOT_BYTES = Gauge(
+    "professors_directory_snapshot_bytes",
+    "Tamanho do snapshot atual (JSON, sem compressão), por listagem.",
+    ["name"],
+)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    for coding in accept_encoding.lower().split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip() in ("gzip", "*"):
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+@dataclass(frozen=True)
+class SnapshotBody:
+    """Listagem completa já serializada (e comprimida), na versão `version` da tabela."""
+    version: int
+    body: bytes
+    gzip_body: Optional[bytes] = None
+
+    def response(self, request: Request, headers: Dict[str, str]) -> Response:
+        if self.gzip_body is not None and _accepts_gzip(request.headers.get("accept-encoding", "")):
+            # Mesmo conteúdo em outra codificação: o ETag vira fraco (o If-None-Match compara fraco)
+            etag = headers.get("ETag")
+            gzip_headers = {**headers, "Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+            if etag is not None:
+                gzip_headers["ETag"] = f"W/{etag}"
+            return Response(self.gzip_body, media_type=ORJSONModelResponse.media_type, headers=gzip_headers)
+        headers = {**headers, "Vary": "Accept-Encoding"} if self.gzip_body is not None else headers
+        return Response(self.body, media_type=ORJSONModelResponse.media_type, headers=headers)
+
+
+class DirectorySnapshot:
+    """
+    Snapshot em memória de uma listagem completa (sem filtros, projeção ou paginação).
+
+    `load` retorna a versão de `table` (lida antes dos dados) e todos os itens; o snapshot
+    guarda o JSON pronto e, opcionalmente, o gzip dele. Só é servido enquanto a versão da
+    tabela for a mesma: uma versão diferente (escrita local ou de outra instância) agenda
+    uma reconstrução depois de `debounce_seconds`, que junta as escritas em rajada, e a
+    requisição segue pelo caminho normal. Carregado na inicialização (main.py).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        table: str,
+        load: Callable[[], Awaitable[Tuple[TableVersion, List[Any]]]],
+        debounce_seconds: float = 1.0,
+        compress: bool = True,
+    ):
+        self.name = name
+        self.table = table
+        self.debounce_seconds = debounce_seconds
+        self.compress = compress
+        self._load = load
+        self._current: Optional[SnapshotBody] = None
+        self._refresh_task: Optional["asyncio.Task[None]"] = None
+
+    def _serialize(self, items: List[Any]) -> Tuple[bytes, Optional[bytes]]:
+        body = ORJSONModelResponse(items).body
+        return body, gzip.compress(body, 6) if self.compress else None
+
+    async def refresh(self) -> None:
+        version, items = await self._load()
+        # Serialização e compressão (a parte cara com muitos itens) fora do event loop
+        body, gzip_body = await asyncio.to_thread(self._serialize, items)
+        self._current = SnapshotBody(version.version, body, gzip_body)
+        SNAPSHOT_BYTES.labels(name=self.name).set(len(body))
+
+    def clear(self) -> None:
+        self._current = None
+
+    def get(self, versions: Mapping[str, TableVersion]) -> Optional[SnapshotBody]:
+        """O snapshot, se ele estiver na versão atual da tabela; senão agenda a reconstrução."""
+        version = versions.get(self.table)
+        if version is None:
+            return None
+        current = self._current
+        if current is not None and current.version == version.version:
+            return current
+        self.schedule_refresh()
+        return None
+
+    def schedule_refresh(self) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.get_running_loop().create_task(self._debounced_refresh())
+
+    async def _debounced_refresh(self) -> None:
+        await asyncio.sleep(self.debounce_seconds)
+        try:
+            await self.refresh()
+        except Exception:
+            SNAPSHOT_REBUILDS.labels(name=self.name, result="error").inc()
+            logger.exception("Falha ao reconstruir o snapshot de %s", self.name)
+        else:
+            SNAPSHOT_REBUILDS.labels(name=self.name, result="ok").inc()
+
+    async def close(self) -> None:
+        task, self._refresh_task = self._refresh_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
@@ -0,0 +1,31 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from professors.adapters.cache.stale import start_tracking
+
+# RFC 7234, 5.5.1: "110 Response is Stale"
+STALE_WARNING = '110 - "Response is Stale"'
+
+
+class StaleCacheWarningMiddleware:
+    """
+    Middleware ASGI que adiciona o header `Warning: 110` quando a resposta usou entradas
+    vencidas do cache porque o banco estava indisponível.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stale_keys = start_tracking()
+
+        async def send_with_warning(message: Message) -> None:
+            if message["type"] == "http.response.start" and stale_keys:
+                MutableHeaders(scope=message).append("Warning", STALE_WARNING)
+            await send(message)
+
+        await self.app(scope, receive, send_with_warning)
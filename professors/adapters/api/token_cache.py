@@ -0,0 +1,87 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from prometheus_client import Counter
+
+TOKEN_CACHE_HITS = Counter(
+    "professors_auth_token_cache_hits",
+    "Validações de token atendidas pelo cache local.",
+)
+TOKEN_CACHE_MISSES = Counter(
+    "professors_auth_token_cache_misses",
+    "Validações de token que precisaram consultar o serviço de OAuth.",
+)
+TOKEN_CACHE_EVICTIONS = Counter(
+    "professors_auth_token_cache_evictions",
+    "Entradas removidas do cache de tokens.",
+    ["reason"],
+)
+
+
+class TokenCache:
+    """
+    Cache LRU em memória para o resultado da introspecção de tokens.
+
+    As entradas são indexadas pelo SHA-256 do token (o token em si nunca é
+    guardado) e expiram no `exp` do token ou após `ttl_seconds`, o que
+    ocorrer primeiro.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    @staticmethod
+    def key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            TOKEN_CACHE_MISSES.inc()
+            return None
+
+        expires_at, claims = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            TOKEN_CACHE_EVICTIONS.labels(reason="expired").inc()
+            TOKEN_CACHE_MISSES.inc()
+            return None
+
+        self._entries.move_to_end(key)
+        TOKEN_CACHE_HITS.inc()
+        return claims
+
+    def set(self, key: str, claims: Dict[str, Any]) -> None:
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+
+        ttl = self.ttl_seconds
+        exp = claims.get("exp") if isinstance(claims, dict) else None
+        if isinstance(exp, (int, float)):
+            ttl = min(ttl, exp - self._wall_clock())
+        if ttl <= 0:
+            return
+
+        self._entries[key] = (self._clock() + ttl, claims)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            TOKEN_CACHE_EVICTIONS.labels(reason="capacity").inc()
+
+    def clear(self) -> None:
+        self._entries.clear()
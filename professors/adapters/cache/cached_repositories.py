@@ -0,0 +1,336 @@
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from prometheus_client import Counter
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError, TimeoutError as PoolTimeoutError
+
+from professors.core.domain.errors import ProfessorNotFoundError
+from professors.core.domain.graduation_models import Graduation, GraduationCreate, GraduationUpdate
+from professors.core.domain.pagination import Keyset, Page
+from professors.core.domain.professor_models import Professor, ProfessorCreate
+from professors.core.domain.projection import Projection
+from professors.core.ports.cache_port import NOT_FOUND, CachePort
+from professors.core.ports.graduation_repository_port import GraduationRepositoryPort
+from professors.core.ports.professor_repository_port import ProfessorRepositoryPort
+from .memory_cache import InMemoryCache
+from .redis_cache import RedisCache
+from .stale import mark_stale
+
+logger = logging.getLogger(__name__)
+
+CACHE_LOOKUPS = Counter(
+    "professors_repository_cache_lookups",
+    "Leituras do repositório passando pelo cache, por entidade e resultado.",
+    ["entity", "result"],
+)
+
+# Falhas de acesso ao banco que permitem servir uma entrada vencida do cache. Erros da
+# consulta em si (IntegrityError, ProgrammingError, ...) continuam sendo propagados.
+DATABASE_UNAVAILABLE = (OperationalError, InterfaceError, PoolTimeoutError, OSError, asyncio.TimeoutError)
+
+
+def is_database_unavailable(error: BaseException) -> bool:
+    if isinstance(error, DATABASE_UNAVAILABLE):
+        return True
+    # Outros erros do driver só contam se a conexão caiu junto
+    return isinstance(error, DBAPIError) and error.connection_invalidated
+
+
+def professor_key(professor_id: uuid.UUID) -> str:
+    return f"professor:{professor_id}"
+
+def registration_key(registration_number: int) -> str:
+    return f"professor:registration:{registration_number}"
+
+def graduations_key(professor_id: uuid.UUID) -> str:
+    return f"graduations:{professor_id}"
+
+
+def _project(item: Any, fields: Optional[List[str]]) -> Any:
+    """Aplica a projeção (?fields=) sobre um modelo lido do cache."""
+    if not fields:
+        return item
+    values = item.__dict__
+    return {name: values[name] for name in fields}
+
+
+@dataclass
+class CacheTTL:
+    """TTLs do cache: entradas encontradas e consultas negativas (404)."""
+    ttl: float
+    negative_ttl: float
+
+
+async def _read_through(
+    cache: CachePort, key: str, entity: str, load: Callable[[], Awaitable[Any]], ttls: CacheTTL
+) -> Any:
+    """
+    Busca `key` no cache; na falta, chama `load` e guarda o resultado (None vira uma
+    entrada negativa, com TTL menor). Se o banco estiver fora e houver uma entrada
+    vencida ainda retida, ela é servida e a requisição é marcada como desatualizada.
+    """
+    cached = await cache.get(key)
+    if cached is not None:
+        CACHE_LOOKUPS.labels(entity=entity, result="negative_hit" if cached.value is NOT_FOUND else "hit").inc()
+        return None if cached.value is NOT_FOUND else cached.value
+
+    CACHE_LOOKUPS.labels(entity=entity, result="miss").inc()
+    try:
+        value = await load()
+    except Exception as e:
+        if not is_database_unavailable(e):
+            raise
+        stale = await cache.get(key, allow_stale=True)
+        if stale is None:
+            raise
+        logger.warning("Banco indisponível: servindo entrada vencida do cache (%s).", key)
+        CACHE_LOOKUPS.labels(entity=entity, result="stale").inc()
+        mark_stale(key)
+        return None if stale.value is NOT_FOUND else stale.value
+
+    if value is None:
+        await cache.set(key, NOT_FOUND, ttls.negative_ttl)
+    else:
+        await cache.set(key, value, ttls.ttl)
+    return value
+
+
+class CachedProfessorRepository(ProfessorRepositoryPort):
+    """
+    Decorator de `ProfessorRepositoryPort` com cache read-through de `get_by_id` e
+    `get_by_registration_number`. As escritas passam para o repositório e invalidam
+    exatamente as chaves afetadas (inclusive as graduações de professores removidos).
+    Os demais métodos são repassados sem cache.
+    """
+
+    def __init__(self, repository: ProfessorRepositoryPort, cache: CachePort, ttls: CacheTTL):
+        self.repository = repository
+        self.cache = cache
+        self.ttls = ttls
+
+    async def add(self, professor_data: ProfessorCreate) -> Optional[Professor]:
+        created = await self.repository.add(professor_data)
+        if created is not None:
+            await self.cache.delete(registration_key(created.registration_number))
+        return created
+
+    async def add_many(self, professors_data: List[ProfessorCreate]) -> List[Optional[Professor]]:
+        created = await self.repository.add_many(professors_data)
+        keys = [registration_key(p.registration_number) for p in created if p is not None]
+        await self.cache.delete(*keys)
+        return created
+
+    async def get_by_id(
+        self, professor_uuid: uuid.UUID, fields: Optional[List[str]] = None
+    ) -> Optional[Union[Professor, Projection]]:
+        # O cache guarda o professor completo; a projeção é aplicada na saída
+        professor = await _read_through(
+            self.cache, professor_key(professor_uuid), "professor",
+            lambda: self.repository.get_by_id(professor_uuid), self.ttls,
+        )
+        return None if professor is None else _project(professor, fields)
+
+    async def get_many(
+        self, ids: List[uuid.UUID], fields: Optional[List[str]] = None
+    ) -> List[Union[Professor, Projection]]:
+        return await self.repository.get_many(ids, fields=fields)
+
+    async def get_version(self, professor_uuid: uuid.UUID) -> Optional[int]:
+        # A versão vem sempre do banco (só a coluna): o cache pode ser por processo, e outra
+        # instância pode ter alterado o professor. Uma entrada em outra versão é descartada,
+        # para que a leitura seguinte não sirva o corpo antigo com o ETag antigo.
+        key = professor_key(professor_uuid)
+        version = await self.repository.get_version(professor_uuid)
+        cached = await self.cache.get(key)
+        if cached is not None and (None if cached.value is NOT_FOUND else cached.value.version) != version:
+            await self.cache.delete(key)
+        return version
+
+    async def get_by_registration_number(self, reg_number: int) -> Optional[Professor]:
+        # A matrícula aponta para o id; o professor vem da entrada por id (invalidada nas
+        # escritas). Se a matrícula mudou desde então, a entrada é descartada.
+        key = registration_key(reg_number)
+
+        async def load() -> Optional[uuid.UUID]:
+            professor = await self.repository.get_by_registration_number(reg_number)
+            if professor is not None:
+                await self.cache.set(professor_key(professor.id), professor, self.ttls.ttl)
+            return None if professor is None else professor.id
+
+        professor_id = await _read_through(self.cache, key, "registration", load, self.ttls)
+        if professor_id is None:
+            return None
+        professor = await self.get_by_id(professor_id)
+        if professor is not None and professor.registration_number == reg_number:
+            return professor
+
+        await self.cache.delete(key)
+        return await self.repository.get_by_registration_number(reg_number)
+
+    async def get_all(self, fields: Optional[List[str]] = None) -> List[Union[Professor, Projection]]:
+        return await self.repository.get_all(fields=fields)
+
+    async def search(
+        self, params: Dict[str, Any], fields: Optional[List[str]] = None
+    ) -> List[Union[Professor, Projection]]:
+        return await self.repository.search(params, fields=fields)
+
+    async def search_by_name(
+        self, query: str, limit: int, accent_insensitive: bool = False,
+        fields: Optional[List[str]] = None
+    ) -> List[Union[Professor, Projection]]:
+        return await self.repository.search_by_name(
+            query, limit, accent_insensitive=accent_insensitive, fields=fields
+        )
+
+    async def get_page(
+        self, params: Dict[str, Any], limit: int, after: Optional[Keyset] = None,
+        fields: Optional[List[str]] = None
+    ) -> Page[Union[Professor, Projection]]:
+        return await self.repository.get_page(params, limit, after, fields=fields)
+
+    def stream_all(self, chunk_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        return self.repository.stream_all(chunk_size)
+
+    async def update(
+        self, professor_uuid: uuid.UUID, professor_data: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> Optional[Professor]:
+        updated = await self.repository.update(professor_uuid, professor_data, expected_version=expected_version)
+        keys = [professor_key(professor_uuid)]
+        if updated is not None:
+            # Uma consulta negativa pela nova matrícula deixa de valer
+            keys.append(registration_key(updated.registration_number))
+        await self.cache.delete(*keys)
+        return updated
+
+    async def delete(self, professor_uuid: uuid.UUID) -> bool:
+        deleted = await self.repository.delete(professor_uuid)
+        if deleted:
+            await self.cache.delete(professor_key(professor_uuid), graduations_key(professor_uuid))
+        return deleted
+
+    async def delete_many(
+        self, ids: Optional[List[uuid.UUID]] = None, status: Optional[str] = None
+    ) -> List[uuid.UUID]:
+        deleted = await self.repository.delete_many(ids=ids, status=status)
+        await self.cache.delete(*(
+            key for professor_id in deleted
+            for key in (professor_key(professor_id), graduations_key(professor_id))
+        ))
+        return deleted
+
+    async def update_status_many(
+        self, new_status: str, ids: Optional[List[uuid.UUID]] = None, status: Optional[str] = None
+    ) -> List[uuid.UUID]:
+        updated = await self.repository.update_status_many(new_status, ids=ids, status=status)
+        await self.cache.delete(*(professor_key(professor_id) for professor_id in updated))
+        return updated
+
+
+class CachedGraduationRepository(GraduationRepositoryPort):
+    """
+    Decorator de `GraduationRepositoryPort` com cache read-through das graduações de um
+    professor (`get_all_for_professor`), inclusive da resposta negativa (professor
+    inexistente). Criar, alterar ou remover uma graduação invalida a lista do professor.
+    """
+
+    def __init__(self, repository: GraduationRepositoryPort, cache: CachePort, ttls: CacheTTL):
+        self.repository = repository
+        self.cache = cache
+        self.ttls = ttls
+
+    # As escritas invalidam mesmo quando falham: a alteração pode ter sido aplicada
+    # (ex: conexão perdida depois do COMMIT).
+
+    async def add(self, professor_id: uuid.UUID, graduation_data: GraduationCreate) -> Graduation:
+        try:
+            return await self.repository.add(professor_id, graduation_data)
+        finally:
+            await self.cache.delete(graduations_key(professor_id))
+
+    async def get_by_id(self, graduation_id: uuid.UUID) -> Optional[Graduation]:
+        return await self.repository.get_by_id(graduation_id)
+
+    async def get_all_for_professor(
+        self, professor_id: uuid.UUID, fields: Optional[List[str]] = None
+    ) -> List[Union[Graduation, Projection]]:
+        async def load() -> Optional[List[Graduation]]:
+            try:
+                return await self.repository.get_all_for_professor(professor_id)
+            except ProfessorNotFoundError:
+                return None
+
+        graduations = await _read_through(
+            self.cache, graduations_key(professor_id), "graduations", load, self.ttls
+        )
+        if graduations is None:
+            raise ProfessorNotFoundError(professor_id)
+        return [_project(graduation, fields) for graduation in graduations]
+
+    async def get_versions_for_professor(self, professor_id: uuid.UUID) -> List[Tuple[uuid.UUID, int]]:
+        # Sempre do banco, como CachedProfessorRepository.get_version; uma lista em cache com
+        # outras versões (ou outro resultado do professor) é descartada
+        key = graduations_key(professor_id)
+        try:
+            versions: Optional[List[Tuple[uuid.UUID, int]]] = (
+                await self.repository.get_versions_for_professor(professor_id)
+            )
+        except ProfessorNotFoundError:
+            versions = None
+        cached = await self.cache.get(key)
+        if cached is not None:
+            cached_versions = (
+                None if cached.value is NOT_FOUND
+                else {graduation.id: graduation.version for graduation in cached.value}
+            )
+            if cached_versions != (None if versions is None else dict(versions)):
+                await self.cache.delete(key)
+        if versions is None:
+            raise ProfessorNotFoundError(professor_id)
+        return versions
+
+    async def get_all_for_professors(self, professor_ids: List[uuid.UUID]) -> Dict[uuid.UUID, List[Graduation]]:
+        return await self.repository.get_all_for_professors(professor_ids)
+
+    async def get_all(self, fields: Optional[List[str]] = None) -> List[Union[Graduation, Projection]]:
+        return await self.repository.get_all(fields=fields)
+
+    async def get_page(
+        self, limit: int, after: Optional[Keyset] = None, fields: Optional[List[str]] = None
+    ) -> Page[Union[Graduation, Projection]]:
+        return await self.repository.get_page(limit, after, fields=fields)
+
+    def stream_all(self, chunk_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        return self.repository.stream_all(chunk_size)
+
+    async def update(
+        self, professor_id: uuid.UUID, graduation_id: uuid.UUID, graduation_data: GraduationUpdate,
+        expected_version: Optional[int] = None
+    ) -> Optional[Graduation]:
+        try:
+            return await self.repository.update(
+                professor_id, graduation_id, graduation_data, expected_version=expected_version
+            )
+        finally:
+            await self.cache.delete(graduations_key(professor_id))
+
+    async def delete(self, professor_id: uuid.UUID, graduation_id: uuid.UUID) -> bool:
+        try:
+            return await self.repository.delete(professor_id, graduation_id)
+        finally:
+            await self.cache.delete(graduations_key(professor_id))
+
+
+def build_cache(backend: str, max_size: int, stale_ttl: float, redis_url: Optional[str] = None) -> Optional[CachePort]:
+    """Backend configurado em CACHE_BACKEND (`memory`, `redis` ou `none`)."""
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return InMemoryCache(max_size=max_size, stale_ttl=stale_ttl)
+    if backend == "redis":
+        return RedisCache(url=redis_url, stale_ttl=stale_ttl)
+    raise ValueError(f"Unknown CACHE_BACKEND: {backend!r} (expected memory, redis or none).")
@@ -0,0 +1,62 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+from professors.core.ports.cache_port import CachePort, CachedValue
+
+
+class InMemoryCache(CachePort):
+    """
+    Cache LRU em memória (por processo).
+
+    Cada entrada fica fresca por `ttl` segundos e é mantida por mais `stale_ttl` segundos
+    para ser servida se o banco estiver fora. Acima de `max_size` entradas, as usadas há
+    mais tempo são descartadas.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        stale_ttl: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max_size
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        # chave -> (fresca até, retida até, valor)
+        self._entries: "OrderedDict[str, Tuple[float, float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str, allow_stale: bool = False) -> Optional[CachedValue]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        fresh_until, expires_at, value = entry
+        now = self._clock()
+        if expires_at <= now:
+            del self._entries[key]
+            return None
+        if fresh_until <= now and not allow_stale:
+            return None
+
+        self._entries.move_to_end(key)
+        return CachedValue(value, stale=fresh_until <= now)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        if self.max_size <= 0 or ttl <= 0:
+            return
+        now = self._clock()
+        self._entries[key] = (now + ttl, now + ttl + self.stale_ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
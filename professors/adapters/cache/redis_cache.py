@@ -0,0 +1,133 @@
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import uuid
+
+import orjson
+from pydantic import TypeAdapter
+
+from professors.core.domain.graduation_models import Graduation
+from professors.core.domain.professor_models import Professor
+from professors.core.ports.cache_port import NOT_FOUND, CachePort, CachedValue
+
+logger = logging.getLogger(__name__)
+
+# Tipos guardados pelos repositórios com cache; o resto vai como JSON puro
+_ADAPTERS: Dict[str, TypeAdapter] = {
+    "professor": TypeAdapter(Professor),
+    "graduations": TypeAdapter(List[Graduation]),
+    "uuid": TypeAdapter(uuid.UUID),
+}
+
+
+def _kind(value: Any) -> str:
+    if value is NOT_FOUND:
+        return "not_found"
+    if isinstance(value, Professor):
+        return "professor"
+    if isinstance(value, uuid.UUID):
+        return "uuid"
+    if isinstance(value, list) and value and all(isinstance(item, Graduation) for item in value):
+        return "graduations"
+    return "json"
+
+
+def _encode(fresh_until: float, value: Any) -> bytes:
+    kind = _kind(value)
+    adapter = _ADAPTERS.get(kind)
+    if kind == "not_found":
+        value = None
+    elif adapter is not None:
+        value = adapter.dump_python(value, mode="json")
+    return orjson.dumps({"fresh_until": fresh_until, "kind": kind, "value": value})
+
+
+def _decode(raw: bytes) -> Tuple[float, Any]:
+    entry = orjson.loads(raw)
+    kind = entry["kind"]
+    if kind == "not_found":
+        return float(entry["fresh_until"]), NOT_FOUND
+    adapter = _ADAPTERS.get(kind)
+    value = entry["value"] if adapter is None else adapter.validate_python(entry["value"])
+    return float(entry["fresh_until"]), value
+
+
+class RedisCache(CachePort):
+    """
+    Cache compartilhado entre processos/instâncias, em um servidor compatível com Redis.
+
+    Recebe qualquer cliente com a interface assíncrona do `redis.asyncio` (`get`, `set` com
+    `ex`, `delete`, `aclose`), o que permite trocar o servidor por um substituto local. Sem
+    cliente, cria um a partir de `url` (o pacote `redis` é uma dependência opcional).
+    Os valores são gravados em JSON (nunca pickle: o conteúdo do servidor não é confiável).
+    As entradas guardam o instante em que deixam de ser frescas; o TTL da chave no
+    servidor inclui a janela `stale_ttl`, usada quando o banco está fora.
+    Falhas do servidor de cache não derrubam as leituras: viram falta (miss) e são logadas.
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        url: Optional[str] = None,
+        stale_ttl: float = 0.0,
+        prefix: str = "professors:",
+        clock: Callable[[], float] = time.time,
+    ):
+        if client is None:
+            if url is None:
+                raise ValueError("RedisCache requires a client or a url.")
+            try:
+                import redis.asyncio as redis
+            except ImportError as e:
+                raise RuntimeError(
+                    "CACHE_BACKEND=redis requires the 'redis' package (poetry install -E redis)."
+                ) from e
+            client = redis.from_url(url)
+        self.client = client
+        self.stale_ttl = stale_ttl
+        self.prefix = prefix
+        self._clock = clock
+
+    async def get(self, key: str, allow_stale: bool = False) -> Optional[CachedValue]:
+        try:
+            raw = await self.client.get(self.prefix + key)
+        except Exception as e:
+            logger.warning("Cache indisponível ao ler %s: %s", key, e)
+            return None
+        if raw is None:
+            return None
+        try:
+            fresh_until, value = _decode(raw)
+        except (KeyError, TypeError, ValueError) as e:
+            # Entrada corrompida ou de outro formato: trata como falta
+            logger.warning("Entrada inválida no cache (%s): %s", key, e)
+            return None
+        stale = fresh_until <= self._clock()
+        if stale and not allow_stale:
+            return None
+        return CachedValue(value, stale=stale)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        try:
+            raw = _encode(self._clock() + ttl, value)
+        except TypeError as e:
+            logger.warning("Valor não serializável para o cache (%s): %s", key, e)
+            return
+        try:
+            await self.client.set(self.prefix + key, raw, ex=max(1, int(ttl + self.stale_ttl + 0.5)))
+        except Exception as e:
+            logger.warning("Cache indisponível ao gravar %s: %s", key, e)
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            await self.client.delete(*(self.prefix + key for key in keys))
+        except Exception as e:
+            # A entrada antiga pode sobreviver até o fim do TTL
+            logger.error("Falha ao invalidar o cache (%s): %s", ", ".join(keys), e)
+
+    async def close(self) -> None:
+        await self.client.aclose()
@@ -0,0 +1,19 @@
+from contextvars import ContextVar
+from typing import List, Optional
+
+# Chaves servidas vencidas (banco fora) durante a requisição atual. A lista é criada pelo
+# middleware no início da requisição e compartilhada, então vale mesmo se o valor for lido
+# em outra task/contexto copiado.
+_stale_keys: ContextVar[Optional[List[str]]] = ContextVar("stale_cache_keys", default=None)
+
+
+def start_tracking() -> List[str]:
+    keys: List[str] = []
+    _stale_keys.set(keys)
+    return keys
+
+
+def mark_stale(key: str) -> None:
+    keys = _stale_keys.get()
+    if keys is not None:
+        keys.append(key)
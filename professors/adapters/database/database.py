@@ -1,18 +1,117 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+import logging
+
+from sqlalchemy import Column, ColumnElement, Connection, Table, any_, bindparam, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from typing import AsyncGenerator, Sequence, Union
 
 from professors.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+logger = logging.getLogger(__name__)
+
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_pre_ping=True,
+)
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
-def get_db() -> Generator[Session, None, None]:
-    """Dependency para obter uma sessão de banco de dados."""
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency para obter uma sessão (assíncrona) de banco de dados."""
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
+
+def dialect_insert(db: AsyncSession, table: Table) -> Union[postgresql.Insert, sqlite.Insert]:
+    """INSERT do dialeto em uso, com suporte a ON CONFLICT (PostgreSQL; SQLite em testes locais)."""
+    if db.bind.dialect.name == "sqlite":
+        return sqlite.insert(table)
+    return postgresql.insert(table)
+
+def in_ids(db: AsyncSession, column: Column, ids: Sequence) -> ColumnElement[bool]:
+    """
+    `column = ANY(:ids)` no PostgreSQL: um único parâmetro array, então o texto da consulta
+    (e o prepared statement em cache) é o mesmo para qualquer quantidade de IDs.
+    Nos demais dialetos (SQLite em testes locais), `column IN (...)`.
+    """
+    if db.bind.dialect.name == "postgresql":
+        return column == any_(bindparam(None, list(ids), type_=postgresql.ARRAY(column.type)))
+    return column.in_(list(ids))
+
+# Caractere de escape dos padrões LIKE/ILIKE montados a partir de texto do usuário
+LIKE_ESCAPE = "\\"
+
+def escape_like(value: str) -> str:
+    """Escapa `\\`, `%` e `_` para que o valor seja comparado literalmente (escape=LIKE_ESCAPE)."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+# Bancos criados antes do ON DELETE CASCADE: troca a FK de graduations.professor_id
+# (somente se ainda não for CASCADE, para não revalidar a tabela a cada inicialização).
+_GRADUATIONS_FK_CASCADE = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conname = 'graduations_professor_id_fkey' AND confdeltype <> 'c'
+    ) THEN
+        ALTER TABLE graduations
+            DROP CONSTRAINT graduations_professor_id_fkey,
+            ADD CONSTRAINT graduations_professor_id_fkey
+                FOREIGN KEY (professor_id) REFERENCES professors (id) ON DELETE CASCADE;
+    END IF;
+END $$;
+"""
+
+# Busca por nome (pg_trgm): índices GIN de trigramas em professors.name, usados pelos
+# operadores de similaridade e também por ILIKE '%...%'. `unaccent` não é IMMUTABLE, então
+# a versão sem acentos passa por um wrapper imutável para poder ser indexada.
+_NAME_SEARCH_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    """
+    CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        AS $$ SELECT public.unaccent('public.unaccent', $1) $$
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_professors_name_trgm ON professors USING gin (name gin_trgm_ops)",
+    """
+    CREATE INDEX IF NOT EXISTS ix_professors_name_unaccent_trgm
+        ON professors USING gin (f_unaccent(name) gin_trgm_ops)
+    """,
+)
+
+def _create_name_search_indexes(connection: Connection) -> None:
+    # Savepoint: sem permissão para criar as extensões, a inicialização continua
+    # (a busca por nome passa a falhar, mas o restante do serviço não).
+    try:
+        with connection.begin_nested():
+            for statement in _NAME_SEARCH_DDL:
+                connection.execute(text(statement))
+    except DBAPIError as e:
+        logger.warning("Índices de busca por nome (pg_trgm/unaccent) não criados: %s", e)
+
+# Coluna de versão (ETag / If-Match) em tabelas criadas antes dela
+_VERSION_COLUMNS = (
+    "ALTER TABLE professors ADD COLUMN IF NOT EXISTS version integer NOT NULL DEFAULT 1",
+    "ALTER TABLE graduations ADD COLUMN IF NOT EXISTS version integer NOT NULL DEFAULT 1",
+)
+
+def upgrade_schema(connection: Connection) -> None:
+    """
+    Ajusta tabelas já existentes ao modelo atual (o `create_all` só cria tabelas novas).
+    Executado na inicialização via `run_sync`, depois do `create_all`.
+    """
+    if connection.dialect.name == "postgresql":
+        connection.execute(text(_GRADUATIONS_FK_CASCADE))
+        for statement in _VERSION_COLUMNS:
+            connection.execute(text(statement))
+        _create_name_search_indexes(connection)
+
+    # Índices declarados nos modelos que ainda não existem no banco
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
@@ -1,57 +1,207 @@
 import uuid
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+from pydantic import TypeAdapter
+from sqlalchemy import delete, exists, insert, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from professors.core.domain.graduation_models import Graduation, GraduationCreate, GraduationUpdate
 from professors.core.ports.graduation_repository_port import GraduationRepositoryPort
+from professors.core.domain.errors import ProfessorNotFoundError, VersionConflictError
+from professors.core.domain.pagination import Keyset, Page
+from professors.core.domain.projection import Projection
+from professors.core.domain.table_version import GRADUATIONS_TABLE
+from .database import in_ids
 from .models import Graduation as GraduationTableModel
+from .models import Professor as ProfessorTableModel
+from .table_version_repository import bump_table_versions
+
+# Validadores em cache para converter linhas em modelos de domínio. Para os tipos simples
+# de Graduation, o validador compilado é mais rápido que `model_construct`.
+_graduation_adapter = TypeAdapter(Graduation)
+_graduation_list_adapter = TypeAdapter(List[Graduation])
 
 class SQLAlchemyGraduationRepository(GraduationRepositoryPort):
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def _to_domain(self, db_graduation: GraduationTableModel) -> Graduation:
-        return Graduation.model_validate(db_graduation)
+    def _to_domain(self, row: Mapping[str, Any]) -> Graduation:
+        return _graduation_adapter.validate_python(row)
+
+    def _to_domain_list(self, rows: Sequence[Mapping[str, Any]]) -> List[Graduation]:
+        # Uma única chamada ao validador (em Rust) para a lista inteira
+        return _graduation_list_adapter.validate_python(rows)
+
+    def _columns(self, fields: Optional[List[str]] = None) -> List[Any]:
+        """Colunas do SELECT: todas, ou somente as da projeção (?fields=)."""
+        table = GraduationTableModel.__table__
+        return [table.c[name] for name in fields] if fields else list(table.c)
+
+    def _to_items(self, rows: Sequence[Mapping[str, Any]], fields: Optional[List[str]]) -> List[Any]:
+        # Com projeção, as linhas viram dicts simples: o modelo completo não é construído
+        if fields:
+            return [dict(row) for row in rows]
+        return self._to_domain_list(rows)
+
+    async def _professor_exists(self, professor_id: uuid.UUID) -> bool:
+        result = await self.db.execute(
+            select(exists().where(ProfessorTableModel.id == professor_id))
+        )
+        return bool(result.scalar())
 
-    def add(self, professor_id: uuid.UUID, graduation_data: GraduationCreate) -> Graduation:
-        db_graduation = GraduationTableModel(
-            **graduation_data.model_dump(),
-            professor_id=professor_id
+    async def add(self, professor_id: uuid.UUID, graduation_data: GraduationCreate) -> Graduation:
+        table = GraduationTableModel.__table__
+        professors = ProfessorTableModel.__table__
+        data = graduation_data.model_dump()
+        # INSERT ... SELECT FROM professors ... RETURNING: a linha só é inserida se o
+        # professor existir, sem uma consulta prévia.
+        source = select(
+            literal(uuid.uuid4(), type_=table.c.id.type).label("id"),
+            professors.c.id.label("professor_id"),
+            *(literal(value, type_=table.c[key].type).label(key) for key, value in data.items()),
+        ).where(professors.c.id == professor_id)
+        stmt = (
+            insert(table)
+            .from_select(["id", "professor_id", *data.keys()], source)
+            .returning(*table.c)
         )
-        self.db.add(db_graduation)
-        self.db.commit()
-        self.db.refresh(db_graduation)
-        return self._to_domain(db_graduation)
+        result = await self.db.execute(stmt)
+        row = result.mappings().first()
+        if row is not None:
+            await bump_table_versions(self.db, GRADUATIONS_TABLE)
+        await self.db.commit()
+        if row is None:
+            raise ProfessorNotFoundError(professor_id)
+        return self._to_domain(row)
+
+    async def get_by_id(self, graduation_id: uuid.UUID) -> Optional[Graduation]:
+        table = GraduationTableModel.__table__
+        result = await self.db.execute(select(*table.c).where(table.c.id == graduation_id))
+        row = result.mappings().first()
+        return self._to_domain(row) if row else None
 
-    def get_by_id(self, graduation_id: uuid.UUID) -> Optional[Graduation]:
-        db_graduation = self.db.query(GraduationTableModel).filter(GraduationTableModel.id == graduation_id).first()
-        return self._to_domain(db_graduation) if db_graduation else None
+    async def get_all_for_professor(
+        self, professor_id: uuid.UUID, fields: Optional[List[str]] = None
+    ) -> List[Union[Graduation, Projection]]:
+        graduations = GraduationTableModel.__table__
+        professors = ProfessorTableModel.__table__
+        # LEFT JOIN a partir de professors: nenhuma linha => professor inexistente;
+        # uma linha com colunas nulas => professor sem graduações.
+        query = (
+            select(*self._columns(fields))
+            .select_from(professors.outerjoin(graduations, graduations.c.professor_id == professors.c.id))
+            .where(professors.c.id == professor_id)
+        )
+        rows = (await self.db.execute(query)).mappings().all()
+        if not rows:
+            raise ProfessorNotFoundError(professor_id)
+        return self._to_items([row for row in rows if row["id"] is not None], fields)
+
+    async def get_versions_for_professor(self, professor_id: uuid.UUID) -> List[Tuple[uuid.UUID, int]]:
+        graduations = GraduationTableModel.__table__
+        professors = ProfessorTableModel.__table__
+        # Mesmo LEFT JOIN de get_all_for_professor, lendo só (id, versão) das graduações
+        query = (
+            select(graduations.c.id, graduations.c.version)
+            .select_from(professors.outerjoin(graduations, graduations.c.professor_id == professors.c.id))
+            .where(professors.c.id == professor_id)
+        )
+        rows = (await self.db.execute(query)).all()
+        if not rows:
+            raise ProfessorNotFoundError(professor_id)
+        return [(graduation_id, version) for graduation_id, version in rows if graduation_id is not None]
 
-    def get_all_for_professor(self, professor_id: uuid.UUID) -> List[Graduation]:
-        db_graduations = self.db.query(GraduationTableModel).filter(GraduationTableModel.professor_id == professor_id).all()
-        return [self._to_domain(g) for g in db_graduations]
+    async def get_all_for_professors(self, professor_ids: List[uuid.UUID]) -> Dict[uuid.UUID, List[Graduation]]:
+        grouped: Dict[uuid.UUID, List[Graduation]] = {professor_id: [] for professor_id in professor_ids}
+        if not grouped:
+            return grouped
+        table = GraduationTableModel.__table__
+        # Um único SELECT ... WHERE professor_id = ANY(...) para a página inteira (estilo selectin)
+        result = await self.db.execute(select(*table.c).where(in_ids(self.db, table.c.professor_id, list(grouped))))
+        for graduation in self._to_domain_list(result.mappings().all()):
+            grouped[graduation.professor_id].append(graduation)
+        return grouped
 
     # NOVO MÉTODO
-    def get_all(self) -> List[Graduation]:
-        db_graduations = self.db.query(GraduationTableModel).all()
-        return [self._to_domain(g) for g in db_graduations]
-
-    def update(self, graduation_id: uuid.UUID, graduation_data: GraduationUpdate) -> Optional[Graduation]:
-        db_graduation = self.db.query(GraduationTableModel).filter(GraduationTableModel.id == graduation_id).first()
-        if not db_graduation:
-            return None
-        
-        update_data = graduation_data.model_dump()
-        for key, value in update_data.items():
-            setattr(db_graduation, key, value)
-            
-        self.db.commit()
-        self.db.refresh(db_graduation)
-        return self._to_domain(db_graduation)
-
-    def delete(self, graduation_id: uuid.UUID) -> bool:
-        db_graduation = self.db.query(GraduationTableModel).filter(GraduationTableModel.id == graduation_id).first()
-        if db_graduation:
-            self.db.delete(db_graduation)
-            self.db.commit()
-            return True
-        return False
\ No newline at end of file
+    async def get_all(self, fields: Optional[List[str]] = None) -> List[Union[Graduation, Projection]]:
+        result = await self.db.execute(select(*self._columns(fields)))
+        return self._to_items(result.mappings().all(), fields)
+
+    async def get_page(
+        self, limit: int, after: Optional[Keyset] = None, fields: Optional[List[str]] = None
+    ) -> Page[Union[Graduation, Projection]]:
+        # Paginação keyset pelo id (um item a mais indica que há próxima página)
+        table = GraduationTableModel.__table__
+        query = select(*self._columns(fields)).order_by(table.c.id).limit(limit + 1)
+        if after is not None:
+            query = query.where(table.c.id > after.id)
+
+        result = await self.db.execute(query)
+        rows = result.mappings().all()
+
+        next_keyset = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_keyset = Keyset(id=rows[-1]["id"])
+        return Page.model_construct(items=self._to_items(rows, fields), next_keyset=next_keyset)
+
+    async def stream_all(self, chunk_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        table = GraduationTableModel.__table__
+        query = (
+            select(table.c.id, table.c.professor_id, table.c.degree, table.c.course,
+                   table.c.institution_name, table.c.year)
+            .order_by(table.c.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        # Conexão dedicada para o cursor do servidor durante o streaming
+        async with self.db.bind.connect() as conn:
+            result = await conn.stream(query)
+            async for rows in result.mappings().partitions(chunk_size):
+                yield rows
+
+    async def update(
+        self, professor_id: uuid.UUID, graduation_id: uuid.UUID, graduation_data: GraduationUpdate,
+        expected_version: Optional[int] = None
+    ) -> Optional[Graduation]:
+        table = GraduationTableModel.__table__
+        # UPDATE ... RETURNING restrito ao professor dono da graduação (e à versão esperada)
+        conditions = [table.c.id == graduation_id, table.c.professor_id == professor_id]
+        if expected_version is not None:
+            conditions.append(table.c.version == expected_version)
+        stmt = (
+            update(table)
+            .where(*conditions)
+            .values(**graduation_data.model_dump(), version=table.c.version + 1)
+            .returning(*table.c)
+        )
+        result = await self.db.execute(stmt)
+        row = result.mappings().first()
+        if row is not None:
+            await bump_table_versions(self.db, GRADUATIONS_TABLE)
+        await self.db.commit()
+        if row is not None:
+            return self._to_domain(row)
+        # Só no caminho de erro: distingue professor inexistente, graduação inexistente
+        # e graduação alterada por outra requisição
+        if not await self._professor_exists(professor_id):
+            raise ProfessorNotFoundError(professor_id)
+        if expected_version is not None:
+            current = await self.db.execute(
+                select(table.c.id).where(table.c.id == graduation_id, table.c.professor_id == professor_id)
+            )
+            if current.first() is not None:
+                raise VersionConflictError(expected_version)
+        return None
+
+    async def delete(self, professor_id: uuid.UUID, graduation_id: uuid.UUID) -> bool:
+        table = GraduationTableModel.__table__
+        result = await self.db.execute(
+            delete(table)
+            .where(table.c.id == graduation_id, table.c.professor_id == professor_id)
+            .returning(table.c.id)
+        )
+        deleted = result.first() is not None
+        if deleted:
+            await bump_table_versions(self.db, GRADUATIONS_TABLE)
+        await self.db.commit()
+        if not deleted and not await self._professor_exists(professor_id):
+            raise ProfessorNotFoundError(professor_id)
+        return deleted
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Uuid, Integer, ForeignKey
+from sqlalchemy import BigInteger, Column, DateTime, String, Uuid, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from .database import Base
 
@@ -13,9 +13,14 @@ class Professor(Base):
     registration_number = Column(Integer, unique=True, index=True, nullable=False)
     institucional_email = Column(String, unique=True, index=True, nullable=False)
     status = Column(String, nullable=False, default="active")
+    # Incrementada a cada UPDATE: ETag das leituras e controle de concorrência otimista
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
-    # Relacionamento com Graduation
-    graduations = relationship("Graduation", back_populates="professor", cascade="all, delete-orphan")
+    # Relacionamento com Graduation. O cascade de exclusão fica no banco (ON DELETE CASCADE);
+    # passive_deletes evita que o ORM carregue as graduações só para apagá-las.
+    graduations = relationship(
+        "Graduation", back_populates="professor", cascade="all, delete-orphan", passive_deletes=True
+    )
 
 class Graduation(Base):
     """Modelo da tabela Graduations no banco de dados."""
@@ -27,6 +32,26 @@ class Graduation(Base):
     course = Column(String, nullable=False)
     institution_name = Column(String, nullable=False)
     year = Column(Integer, nullable=False)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
-    professor_id = Column(Uuid(as_uuid=True), ForeignKey("professors.id"), nullable=False)
+    professor_id = Column(
+        Uuid(as_uuid=True), ForeignKey("professors.id", ondelete="CASCADE"), index=True, nullable=False
+    )
     professor = relationship("Professor", back_populates="graduations")
+
+    # Busca de professores por atributos da graduação: filtros de igualdade primeiro, o
+    # intervalo de ano depois, e professor_id no fim para o semi-join ler só o índice.
+    __table_args__ = (
+        Index("ix_graduations_degree_institution_year", "degree", "institution_name", "year", "professor_id"),
+        Index("ix_graduations_institution_year", "institution_name", "year", "professor_id"),
+        Index("ix_graduations_course_year", "course", "year", "professor_id"),
+    )
+
+class TableVersion(Base):
+    """Contador de alterações por tabela (ETag / Last-Modified das listagens)."""
+
+    __tablename__ = "table_versions"
+
+    name = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
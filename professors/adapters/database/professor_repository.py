@@ -1,87 +1,326 @@
 import uuid
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
+from typing import AsyncIterator, Iterable, List, Mapping, Optional, Dict, Any, Union
+from sqlalchemy import Select, and_, delete, exists, func, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from professors.core.ports.professor_repository_port import ProfessorRepositoryPort
+from professors.core.domain.errors import VersionConflictError
 from professors.core.domain.professor_models import Professor, ProfessorCreate
-from .models import Professor as ProfessorTableModel
+from professors.core.domain.pagination import Keyset, Page
+from professors.core.domain.projection import Projection
+from professors.core.domain.table_version import GRADUATIONS_TABLE, PROFESSORS_TABLE
+from professors.config import settings
+from .database import LIKE_ESCAPE, dialect_insert, escape_like, in_ids
+from .models import Graduation as GraduationTableModel, Professor as ProfessorTableModel
+from .table_version_repository import bump_table_versions
 
 class SQLAlchemyProfessorRepository(ProfessorRepositoryPort):
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def _to_domain(self, db_professor: ProfessorTableModel) -> Professor:
-        """Converte o modelo SQLAlchemy para o modelo de domínio Pydantic."""
-        
-        professor_data = {
-            "id": db_professor.id,
-            "name": db_professor.name,
-            "registration_number": db_professor.registration_number,
-            "institucional_email": db_professor.institucional_email,
-            "status": db_professor.status
-        }
-        
-        return Professor.model_validate(professor_data)
+    def _to_domain(self, row: Mapping[str, Any]) -> Professor:
+        """
+        Converte uma linha do banco para o modelo de domínio Pydantic.
+        Os valores já vêm tipados (e foram validados na escrita), então o modelo é construído
+        sem revalidação: validar o EmailStr de novo domina o custo por item.
+        """
+        return Professor.model_construct(**row)
+
+    def _columns(self, fields: Optional[List[str]] = None) -> List[Any]:
+        """Colunas do SELECT: todas, ou somente as da projeção (?fields=)."""
+        table = ProfessorTableModel.__table__
+        return [table.c[name] for name in fields] if fields else list(table.c)
+
+    def _to_items(self, rows: Iterable[Mapping[str, Any]], fields: Optional[List[str]]) -> List[Any]:
+        # Com projeção, as linhas viram dicts simples: o modelo completo não é construído
+        if fields:
+            return [dict(row) for row in rows]
+        return [self._to_domain(row) for row in rows]
 
-    def add(self, professor_data: ProfessorCreate) -> Professor:
+    async def _get_row(self, *conditions: Any, fields: Optional[List[str]] = None) -> Optional[Any]:
+        result = await self.db.execute(select(*self._columns(fields)).where(*conditions))
+        row = result.mappings().first()
+        if row is None:
+            return None
+        return dict(row) if fields else self._to_domain(row)
+
+    async def add(self, professor_data: ProfessorCreate) -> Optional[Professor]:
+        table = ProfessorTableModel.__table__
+        # Um único INSERT ... ON CONFLICT DO NOTHING ... RETURNING: sem SELECT prévio
+        # nem refresh. Conflito em qualquer chave única (matrícula ou e-mail) => nenhuma linha.
+        stmt = (
+            dialect_insert(self.db, table)
+            .values(id=uuid.uuid4(), **professor_data.model_dump())
+            .on_conflict_do_nothing()
+            .returning(*table.c)
+        )
         try:
-            db_professor = ProfessorTableModel(**professor_data.model_dump())
-            self.db.add(db_professor)
-            self.db.commit()
-            self.db.refresh(db_professor)
-            return self._to_domain(db_professor)
+            result = await self.db.execute(stmt)
+            row = result.mappings().first()
+            if row is not None:
+                await bump_table_versions(self.db, PROFESSORS_TABLE)
+            await self.db.commit()
         except IntegrityError as e:
-            self.db.rollback()
+            await self.db.rollback()
             raise ValueError(f"Database integrity error: {e.orig}")
+        return self._to_domain(row) if row else None
 
-    def get_by_id(self, professor_uuid: uuid.UUID) -> Optional[Professor]:
-        db_professor = self.db.query(ProfessorTableModel).filter(ProfessorTableModel.id == professor_uuid).first()
-        return self._to_domain(db_professor) if db_professor else None
+    async def add_many(self, professors_data: List[ProfessorCreate]) -> List[Optional[Professor]]:
+        table = ProfessorTableModel.__table__
+        chunk_size = settings.PROFESSOR_BATCH_CHUNK_SIZE
+        results: List[Optional[Professor]] = [None] * len(professors_data)
+
+        try:
+            for start in range(0, len(professors_data), chunk_size):
+                # Os ids são gerados aqui para identificar quais linhas o RETURNING devolveu
+                rows = [
+                    {"id": uuid.uuid4(), **professor.model_dump()}
+                    for professor in professors_data[start:start + chunk_size]
+                ]
+                # Um único INSERT ... ON CONFLICT DO NOTHING ... RETURNING por lote
+                stmt = (
+                    dialect_insert(self.db, table)
+                    .values(rows)
+                    .on_conflict_do_nothing()
+                    .returning(*table.c)
+                )
+                result = await self.db.execute(stmt)
+                created = {row["id"]: row for row in result.mappings()}
 
-    def get_by_registration_number(self, reg_number: int) -> Optional[Professor]:
-        db_professor = self.db.query(ProfessorTableModel).filter(ProfessorTableModel.registration_number == reg_number).first()
-        return self._to_domain(db_professor) if db_professor else None
+                for offset, row in enumerate(rows):
+                    db_row = created.get(row["id"])
+                    if db_row is not None:
+                        results[start + offset] = self._to_domain(db_row)
 
-    def get_all(self) -> List[Professor]:
-        db_professors = self.db.query(ProfessorTableModel).all()
-        return [self._to_domain(p) for p in db_professors]
+            if any(professor is not None for professor in results):
+                await bump_table_versions(self.db, PROFESSORS_TABLE)
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        return results
+
+    async def get_by_id(
+        self, professor_uuid: uuid.UUID, fields: Optional[List[str]] = None
+    ) -> Optional[Union[Professor, Projection]]:
+        return await self._get_row(ProfessorTableModel.__table__.c.id == professor_uuid, fields=fields)
+
+    async def get_many(
+        self, ids: List[uuid.UUID], fields: Optional[List[str]] = None
+    ) -> List[Union[Professor, Projection]]:
+        if not ids:
+            return []
+        table = ProfessorTableModel.__table__
+        # Uma única consulta WHERE id = ANY(:ids) para todo o lote
+        result = await self.db.execute(select(*self._columns(fields)).where(in_ids(self.db, table.c.id, ids)))
+        return self._to_items(result.mappings(), fields)
+
+    async def get_version(self, professor_uuid: uuid.UUID) -> Optional[int]:
+        table = ProfessorTableModel.__table__
+        result = await self.db.execute(select(table.c.version).where(table.c.id == professor_uuid))
+        return result.scalar()
+
+    async def get_by_registration_number(self, reg_number: int) -> Optional[Professor]:
+        return await self._get_row(ProfessorTableModel.__table__.c.registration_number == reg_number)
+
+    async def get_all(self, fields: Optional[List[str]] = None) -> List[Union[Professor, Projection]]:
+        result = await self.db.execute(select(*self._columns(fields)))
+        return self._to_items(result.mappings(), fields)
     
-    def search(self, params: Dict[str, Any]) -> List[Professor]:
-        query = self.db.query(ProfessorTableModel)
+    def _filtered_query(self, params: Dict[str, Any], fields: Optional[List[str]] = None) -> Select:
+        # Seleciona colunas (e não entidades ORM): sem identity map nem objetos intermediários
+        query = select(*self._columns(fields))
         
         if "name" in params:
-            query = query.filter(ProfessorTableModel.name.ilike(f"%{params['name']}%"))
+            query = query.where(
+                ProfessorTableModel.name.ilike(f"%{escape_like(params['name'])}%", escape=LIKE_ESCAPE)
+            )
         if "status" in params:
-            query = query.filter(ProfessorTableModel.status == params['status'])
+            query = query.where(ProfessorTableModel.status == params['status'])
+
+        graduation_filter = self._graduation_filter(params)
+        if graduation_filter is not None:
+            query = query.where(graduation_filter)
         # Adicione outros filtros conforme necessário
-            
-        db_professors = query.all()
-        return [self._to_domain(p) for p in db_professors]
+        return query
 
-    def update(self, professor_uuid: uuid.UUID, professor_data: Dict[str, Any]) -> Optional[Professor]:
-        db_professor = self.db.query(ProfessorTableModel).filter(ProfessorTableModel.id == professor_uuid).first()
-        
-        if not db_professor:
+    def _graduation_filter(self, params: Dict[str, Any]) -> Optional[Any]:
+        """
+        EXISTS (graduação do professor que atende a todos os filtros de graduação).
+        Um semi-join: cada professor aparece uma única vez, sem DISTINCT, e a paginação
+        keyset por id continua valendo. Usa os índices compostos de `graduations`.
+        """
+        graduations = GraduationTableModel.__table__
+        conditions = [
+            graduations.c[column] == params[column]
+            for column in ("degree", "course", "institution_name")
+            if column in params
+        ]
+        if "year_min" in params:
+            conditions.append(graduations.c.year >= params["year_min"])
+        if "year_max" in params:
+            conditions.append(graduations.c.year <= params["year_max"])
+        if not conditions:
             return None
-        
-        for key, value in professor_data.items():
-            setattr(db_professor, key, value)
-        
+        return exists().where(
+            graduations.c.professor_id == ProfessorTableModel.__table__.c.id, and_(*conditions)
+        )
+
+    async def search(
+        self, params: Dict[str, Any], fields: Optional[List[str]] = None
+    ) -> List[Union[Professor, Projection]]:
+        result = await self.db.execute(self._filtered_query(params, fields))
+        return self._to_items(result.mappings(), fields)
+
+    async def search_by_name(
+        self, query: str, limit: int, accent_insensitive: bool = False,
+        fields: Optional[List[str]] = None
+    ) -> List[Union[Professor, Projection]]:
+        table = ProfessorTableModel.__table__
+        statement = select(*self._columns(fields)).limit(limit)
+
+        if self.db.bind.dialect.name != "postgresql":
+            # Fallback portável (SQLite em testes locais): substring sem diferenciar
+            # maiúsculas, ordenado por nome. Aqui a busca não ignora acentos.
+            result = await self.db.execute(
+                statement
+                .where(table.c.name.ilike(f"%{escape_like(query)}%", escape=LIKE_ESCAPE))
+                .order_by(table.c.name, table.c.id)
+            )
+            return self._to_items(result.mappings(), fields)
+
+        # pg_trgm: `:q <% name` (similaridade com alguma parte do nome, tolera erros de
+        # digitação) ou substring via ILIKE (com `%` e `_` do termo escapados); ambos usam
+        # o índice GIN de trigramas. Os mais parecidos primeiro.
+        name = func.f_unaccent(table.c.name) if accent_insensitive else table.c.name
+        term = func.f_unaccent(literal(query)) if accent_insensitive else literal(query)
+        like_term = literal(escape_like(query))
+        if accent_insensitive:
+            like_term = func.f_unaccent(like_term)
+        rank = func.word_similarity(term, name)
+        statement = (
+            statement
+            .where(term.op("<%")(name) | name.ilike(func.concat("%", like_term, "%"), escape=LIKE_ESCAPE))
+            .order_by(rank.desc(), table.c.name, table.c.id)
+        )
+        result = await self.db.execute(statement)
+        return self._to_items(result.mappings(), fields)
+
+    async def get_page(
+        self, params: Dict[str, Any], limit: int, after: Optional[Keyset] = None,
+        fields: Optional[List[str]] = None
+    ) -> Page[Union[Professor, Projection]]:
+        # Paginação keyset: ordena pelo id e continua a partir do último id visto.
+        # Busca um item a mais para saber se existe uma próxima página.
+        query = self._filtered_query(params, fields).order_by(ProfessorTableModel.id).limit(limit + 1)
+        if after is not None:
+            query = query.where(ProfessorTableModel.id > after.id)
+
+        result = await self.db.execute(query)
+        rows = result.mappings().all()
+
+        next_keyset = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_keyset = Keyset(id=rows[-1]["id"])
+        return Page.model_construct(items=self._to_items(rows, fields), next_keyset=next_keyset)
+
+    async def stream_all(self, chunk_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        table = ProfessorTableModel.__table__
+        query = (
+            select(table.c.id, table.c.name, table.c.registration_number,
+                   table.c.institucional_email, table.c.status)
+            .order_by(table.c.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        # Conexão dedicada: o cursor do servidor vive enquanto a resposta é transmitida,
+        # independente da sessão da requisição.
+        async with self.db.bind.connect() as conn:
+            result = await conn.stream(query)
+            async for rows in result.mappings().partitions(chunk_size):
+                yield rows
+
+    async def update(
+        self, professor_uuid: uuid.UUID, professor_data: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> Optional[Professor]:
+        table = ProfessorTableModel.__table__
+        # UPDATE ... RETURNING: nenhuma linha retornada significa que o professor não existe
+        # (ou, com `expected_version`, que ele foi alterado por outra requisição)
+        conditions = [table.c.id == professor_uuid]
+        if expected_version is not None:
+            conditions.append(table.c.version == expected_version)
+        stmt = (
+            update(table)
+            .where(*conditions)
+            .values(**professor_data, version=table.c.version + 1)
+            .returning(*table.c)
+        )
         try:
-            self.db.commit()
-            self.db.refresh(db_professor)
-            return self._to_domain(db_professor)
+            result = await self.db.execute(stmt)
+            row = result.mappings().first()
+            if row is not None:
+                await bump_table_versions(self.db, PROFESSORS_TABLE)
+            await self.db.commit()
         except IntegrityError:
-            self.db.rollback()
+            await self.db.rollback()
             return None
+        if row is not None:
+            return self._to_domain(row)
+        if expected_version is not None and await self.get_version(professor_uuid) is not None:
+            raise VersionConflictError(expected_version)
+        return None
 
-    def delete(self, professor_uuid: uuid.UUID) -> bool:
-        db_professor = self.db.query(ProfessorTableModel).filter(ProfessorTableModel.id == professor_uuid).first()
-        
-        if db_professor:
-            self.db.delete(db_professor)
-            self.db.commit()
-            return True
-        return False
\ No newline at end of file
+    async def delete(self, professor_uuid: uuid.UUID) -> bool:
+        table = ProfessorTableModel.__table__
+        # Um único DELETE: as graduações são removidas pelo ON DELETE CASCADE do banco
+        result = await self.db.execute(
+            delete(table).where(table.c.id == professor_uuid).returning(table.c.id)
+        )
+        deleted = result.first() is not None
+        if deleted:
+            # O cascade também pode ter removido graduações
+            await bump_table_versions(self.db, PROFESSORS_TABLE, GRADUATIONS_TABLE)
+        await self.db.commit()
+        return deleted
+
+    def _selection(self, ids: Optional[List[uuid.UUID]], status: Optional[str]) -> List[Any]:
+        """Condições WHERE da seleção em lote (IDs e/ou status, combinados com AND)."""
+        table = ProfessorTableModel.__table__
+        conditions = []
+        if ids is not None:
+            conditions.append(in_ids(self.db, table.c.id, ids))
+        if status is not None:
+            conditions.append(table.c.status == status)
+        return conditions
+
+    async def delete_many(
+        self, ids: Optional[List[uuid.UUID]] = None, status: Optional[str] = None
+    ) -> List[uuid.UUID]:
+        table = ProfessorTableModel.__table__
+        result = await self.db.execute(
+            delete(table).where(*self._selection(ids, status)).returning(table.c.id)
+        )
+        deleted = list(result.scalars())
+        if deleted:
+            await bump_table_versions(self.db, PROFESSORS_TABLE, GRADUATIONS_TABLE)
+        await self.db.commit()
+        return deleted
+
+    async def update_status_many(
+        self, new_status: str, ids: Optional[List[uuid.UUID]] = None, status: Optional[str] = None
+    ) -> List[uuid.UUID]:
+        table = ProfessorTableModel.__table__
+        result = await self.db.execute(
+            update(table)
+            .where(*self._selection(ids, status), table.c.status != new_status)
+            .values(status=new_status, version=table.c.version + 1)
+            .returning(table.c.id)
+        )
+        updated = list(result.scalars())
+        if updated:
+            await bump_table_versions(self.db, PROFESSORS_TABLE)
+        await self.db.commit()
+        return updated
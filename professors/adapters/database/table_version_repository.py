@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+from typing import Dict, Sequence
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from professors.core.domain.table_version import TableVersion
+from professors.core.ports.table_version_port import TableVersionPort
+from .database import dialect_insert
+from .models import TableVersion as TableVersionTableModel
+
+
+async def bump_table_versions(db: AsyncSession, *tables: str) -> None:
+    """
+    Incrementa o contador de alterações das tabelas. Deve rodar na mesma transação da
+    escrita (antes do commit): quem lê uma versão nova sempre enxerga os dados dela.
+    """
+    table = TableVersionTableModel.__table__
+    now = datetime.now(timezone.utc)
+    # Um único INSERT ... ON CONFLICT DO UPDATE: cria a linha na primeira escrita. Nomes em
+    # ordem fixa, para que escritas simultâneas travem as linhas na mesma ordem.
+    stmt = dialect_insert(db, table).values(
+        [{"name": name, "version": 1, "updated_at": now} for name in sorted(set(tables))]
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[table.c.name],
+            set_={"version": table.c.version + 1, "updated_at": now},
+        )
+    )
+
+
+class SQLAlchemyTableVersionRepository(TableVersionPort):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_versions(self, tables: Sequence[str]) -> Dict[str, TableVersion]:
+        table = TableVersionTableModel.__table__
+        result = await self.db.execute(
+            select(table.c.name, table.c.version, table.c.updated_at).where(table.c.name.in_(list(tables)))
+        )
+        versions = {name: TableVersion() for name in tables}
+        for name, version, updated_at in result:
+            # SQLite (testes locais) devolve datas sem fuso: são gravadas em UTC
+            if updated_at.tzinfo is None:
+                updated_at = updated_at.replace(tzinfo=timezone.utc)
+            versions[name] = TableVersion(version=version, updated_at=updated_at)
+        return versions
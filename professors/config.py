@@ -1,6 +1,7 @@
 from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic import Field, model_validator
 from functools import lru_cache
+from typing import List, Optional
 
 class Settings(BaseSettings):
     # Configurações do Banco de Dados (lidas do .env principal)
@@ -11,15 +12,99 @@ class Settings(BaseSettings):
     
     PROFESSORS_POSTGRESQL_DB: str = Field(..., env="PROFESSORS_POSTGRESQL_DB")
 
+    # Pool de conexões do engine assíncrono (asyncpg)
+    DB_POOL_SIZE: int = Field(10, env="DB_POOL_SIZE")
+    DB_MAX_OVERFLOW: int = Field(20, env="DB_MAX_OVERFLOW")
+    DB_POOL_TIMEOUT_SECONDS: float = Field(30.0, env="DB_POOL_TIMEOUT_SECONDS")
+
     OAUTH_INTERNAL_PROTOCOL: str = Field(..., env="OAUTH_INTERNAL_PROTOCOL")
     OAUTH_INTERNAL_HOST: str = Field(..., env="OAUTH_INTERNAL_HOST")
     OAUTH_INTERNAL_API_PORT: int = Field(..., env="OAUTH_INTERNAL_API_PORT")
 
+    # Cache local das introspecções de token (validate_token)
+    OAUTH_TOKEN_CACHE_TTL_SECONDS: float = Field(60.0, env="OAUTH_TOKEN_CACHE_TTL_SECONDS")
+    OAUTH_TOKEN_CACHE_MAX_SIZE: int = Field(10000, env="OAUTH_TOKEN_CACHE_MAX_SIZE")
+
+    # Cliente HTTP compartilhado com o serviço de OAuth (pool de conexões)
+    OAUTH_HTTP_MAX_CONNECTIONS: int = Field(100, env="OAUTH_HTTP_MAX_CONNECTIONS")
+    OAUTH_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = Field(20, env="OAUTH_HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    OAUTH_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = Field(30.0, env="OAUTH_HTTP_KEEPALIVE_EXPIRY_SECONDS")
+    OAUTH_HTTP_CONNECT_TIMEOUT_SECONDS: float = Field(2.0, env="OAUTH_HTTP_CONNECT_TIMEOUT_SECONDS")
+    OAUTH_HTTP_READ_TIMEOUT_SECONDS: float = Field(5.0, env="OAUTH_HTTP_READ_TIMEOUT_SECONDS")
+    OAUTH_HTTP_POOL_TIMEOUT_SECONDS: float = Field(2.0, env="OAUTH_HTTP_POOL_TIMEOUT_SECONDS")
+
+    # Circuit breaker da chamada ao /validate do serviço de OAuth
+    OAUTH_CIRCUIT_CALL_TIMEOUT_SECONDS: float = Field(3.0, env="OAUTH_CIRCUIT_CALL_TIMEOUT_SECONDS")
+    OAUTH_CIRCUIT_FAILURE_THRESHOLD: int = Field(5, env="OAUTH_CIRCUIT_FAILURE_THRESHOLD")
+    OAUTH_CIRCUIT_RECOVERY_SECONDS: float = Field(30.0, env="OAUTH_CIRCUIT_RECOVERY_SECONDS")
+    OAUTH_CIRCUIT_HALF_OPEN_MAX_CALLS: int = Field(1, env="OAUTH_CIRCUIT_HALF_OPEN_MAX_CALLS")
+
+    # Modo de autenticação: "introspection" (chama o /validate do OAuth a cada token)
+    # ou "jwt" (verifica localmente a assinatura do JWT com as chaves do JWKS do Keycloak)
+    AUTH_MODE: str = Field("introspection", env="AUTH_MODE")
+    OAUTH_JWKS_URL: Optional[str] = Field(None, env="OAUTH_JWKS_URL")
+    OAUTH_JWKS_FILE: Optional[str] = Field(None, env="OAUTH_JWKS_FILE")
+    OAUTH_JWKS_REFRESH_SECONDS: float = Field(300.0, env="OAUTH_JWKS_REFRESH_SECONDS")
+    OAUTH_JWT_ISSUER: Optional[str] = Field(None, env="OAUTH_JWT_ISSUER")
+    OAUTH_JWT_AUDIENCE: Optional[str] = Field(None, env="OAUTH_JWT_AUDIENCE")
+    OAUTH_JWT_ALGORITHMS: str = Field("RS256", env="OAUTH_JWT_ALGORITHMS")
+    OAUTH_JWT_LEEWAY_SECONDS: int = Field(30, env="OAUTH_JWT_LEEWAY_SECONDS")
+
+    # Exportação em streaming (linhas lidas do cursor do servidor por lote)
+    EXPORT_CHUNK_SIZE: int = Field(1000, env="EXPORT_CHUNK_SIZE")
+
+    # Criação de professores em lote (POST /api/v1/professors/batch)
+    PROFESSOR_BATCH_MAX_SIZE: int = Field(5000, env="PROFESSOR_BATCH_MAX_SIZE")
+    PROFESSOR_BATCH_CHUNK_SIZE: int = Field(1000, env="PROFESSOR_BATCH_CHUNK_SIZE")
+
+    # Busca aproximada por nome (GET /api/v1/professors/search)
+    PROFESSOR_SEARCH_DEFAULT_LIMIT: int = Field(20, env="PROFESSOR_SEARCH_DEFAULT_LIMIT")
+    PROFESSOR_SEARCH_MAX_LIMIT: int = Field(100, env="PROFESSOR_SEARCH_MAX_LIMIT")
+
+    # Índice do autocompletar: intervalo da conferência da versão da tabela (recarga em segundo plano)
+    PROFESSOR_NAME_INDEX_REFRESH_SECONDS: float = Field(5.0, env="PROFESSOR_NAME_INDEX_REFRESH_SECONDS")
+
+    # Consultas em lote por IDs (POST /professors/lookup, GET /graduations?professor_ids=...)
+    LOOKUP_MAX_IDS: int = Field(1000, env="LOOKUP_MAX_IDS")
+
+    # Cache de leituras (professor por id/matrícula, graduações por professor):
+    # "memory" (por processo), "redis" (compartilhado, requer o extra `redis`) ou "none"
+    CACHE_BACKEND: str = Field("memory", env="CACHE_BACKEND")
+    CACHE_REDIS_URL: Optional[str] = Field(None, env="CACHE_REDIS_URL")
+    CACHE_MAX_SIZE: int = Field(10000, env="CACHE_MAX_SIZE")
+    CACHE_TTL_SECONDS: float = Field(30.0, env="CACHE_TTL_SECONDS")
+    CACHE_NEGATIVE_TTL_SECONDS: float = Field(5.0, env="CACHE_NEGATIVE_TTL_SECONDS")
+    # Por quanto tempo, depois do TTL, uma entrada ainda pode ser servida com o banco fora
+    CACHE_STALE_TTL_SECONDS: float = Field(300.0, env="CACHE_STALE_TTL_SECONDS")
+
+    # Corpos serializados das listagens (GET /professors/, GET /graduations/), por
+    # parâmetros e versão das tabelas; 0 desativa (ETag / 304 continuam valendo)
+    COLLECTION_CACHE_MAX_ENTRIES: int = Field(64, env="COLLECTION_CACHE_MAX_ENTRIES")
+    COLLECTION_CACHE_TTL_SECONDS: float = Field(600.0, env="COLLECTION_CACHE_TTL_SECONDS")
+
+    # Snapshot pré-serializado (e em gzip) das listagens completas, carregado na
+    # inicialização e reconstruído depois das escritas (agrupadas pelo debounce)
+    DIRECTORY_SNAPSHOT_ENABLED: bool = Field(True, env="DIRECTORY_SNAPSHOT_ENABLED")
+    DIRECTORY_SNAPSHOT_DEBOUNCE_SECONDS: float = Field(1.0, env="DIRECTORY_SNAPSHOT_DEBOUNCE_SECONDS")
+    DIRECTORY_SNAPSHOT_GZIP: bool = Field(True, env="DIRECTORY_SNAPSHOT_GZIP")
+
+    # Watchdog do event loop (opcional): mede o atraso do loop e registra travamentos
+    LOOP_WATCHDOG_ENABLED: bool = Field(False, env="LOOP_WATCHDOG_ENABLED")
+    LOOP_WATCHDOG_INTERVAL_SECONDS: float = Field(0.1, env="LOOP_WATCHDOG_INTERVAL_SECONDS")
+    LOOP_WATCHDOG_THRESHOLD_SECONDS: float = Field(0.25, env="LOOP_WATCHDOG_THRESHOLD_SECONDS")
+
+    @model_validator(mode="after")
+    def _check_jwt_settings(self) -> "Settings":
+        # Sem iss/aud, qualquer token assinado pelo realm (de outro cliente) seria aceito
+        if self.AUTH_MODE == "jwt" and not (self.OAUTH_JWT_ISSUER and self.OAUTH_JWT_AUDIENCE):
+            raise ValueError("AUTH_MODE=jwt requires OAUTH_JWT_ISSUER and OAUTH_JWT_AUDIENCE.")
+        return self
+
     @property
     def DATABASE_URL(self) -> str:
         """URL de conexão com o banco de dados SQLAlchemy."""
         return (
-            f"postgresql+psycopg2://{self.POSTGRESQL_USERNAME}:{self.POSTGRESQL_PASSWORD}@"
+            f"postgresql+asyncpg://{self.POSTGRESQL_USERNAME}:{self.POSTGRESQL_PASSWORD}@"
             f"{self.POSTGRESQL_INTERNAL_HOST}:{self.POSTGRESQL_INTERNAL_PORT}/"
             f"{self.PROFESSORS_POSTGRESQL_DB}"
         )
@@ -29,6 +114,11 @@ class Settings(BaseSettings):
         """URL completa para o endpoint de validação de token."""
         return f"{self.OAUTH_INTERNAL_PROTOCOL}://{self.OAUTH_INTERNAL_HOST}:{self.OAUTH_INTERNAL_API_PORT}/validate"
 
+    @property
+    def JWT_ALGORITHMS(self) -> List[str]:
+        """Algoritmos aceitos na verificação local de JWTs."""
+        return [alg.strip() for alg in self.OAUTH_JWT_ALGORITHMS.split(",") if alg.strip()]
+
     class Config:
         env_file = "../../.env"
         env_file_encoding = "utf-8"
@@ -0,0 +1,27 @@
+import uuid
+from typing import List
+
+
+class ProfessorNotFoundError(Exception):
+    """O professor informado não existe (operações de graduação escopadas pelo professor)."""
+
+    def __init__(self, professor_id: uuid.UUID):
+        super().__init__(f"Professor {professor_id} not found.")
+        self.professor_id = professor_id
+
+
+class VersionConflictError(Exception):
+    """O registro existe, mas não está na versão esperada (If-Match / concorrência otimista)."""
+
+    def __init__(self, expected_version: int):
+        super().__init__(f"Record is not at version {expected_version}.")
+        self.expected_version = expected_version
+
+
+class UnknownFieldsError(ValueError):
+    """Campos pedidos em uma projeção (?fields=) que não existem no modelo de domínio."""
+
+    def __init__(self, unknown: List[str], allowed: List[str]):
+        super().__init__(f"Unknown field(s): {', '.join(unknown)}. Allowed: {', '.join(allowed)}.")
+        self.unknown = unknown
+        self.allowed = allowed
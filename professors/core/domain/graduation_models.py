@@ -16,5 +16,6 @@ class GraduationUpdate(GraduationBase):
 class Graduation(GraduationBase):
     id: uuid.UUID
     professor_id: uuid.UUID
+    version: int = Field(1, description="Versão do registro, incrementada a cada alteração")
 
     model_config = ConfigDict(from_attributes=True)
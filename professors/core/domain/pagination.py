@@ -0,0 +1,14 @@
+import uuid
+from typing import Generic, List, Optional, TypeVar
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+class Keyset(BaseModel):
+    """Posição em uma listagem ordenada por uma chave estável (paginação keyset)."""
+    id: uuid.UUID = Field(..., description="ID do último item da página anterior")
+
+class Page(BaseModel, Generic[T]):
+    """Uma página de resultados e a posição para buscar a próxima (se houver)."""
+    items: List[T]
+    next_keyset: Optional[Keyset] = None
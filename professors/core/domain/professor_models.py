@@ -1,6 +1,11 @@
 import uuid
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
-from typing import Optional
+from typing import List, Optional
+
+from professors.core.domain.graduation_models import Graduation
+
+# Status atribuído pela desativação em lote
+INACTIVE_STATUS = "inactive"
 
 # Modelo base com os campos comuns
 class ProfessorBase(BaseModel):
@@ -19,7 +24,12 @@ class ProfessorUpdate(ProfessorBase):
 
 class Professor(ProfessorBase):
     id: uuid.UUID = Field(..., description="ID único do registro no banco (UUID)")
+    version: int = Field(1, description="Versão do registro, incrementada a cada alteração")
 
     model_config = ConfigDict(
         from_attributes=True
-    )
\ No newline at end of file
+    )
+
+# Professor com as graduações embutidas (listagens/detalhe com ?include=graduations)
+class ProfessorWithGraduations(Professor):
+    graduations: List[Graduation] = Field(default_factory=list, description="Graduações do professor")
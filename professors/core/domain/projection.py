@@ -0,0 +1,22 @@
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from pydantic import BaseModel
+
+from professors.core.domain.errors import UnknownFieldsError
+
+# Linha projetada (?fields=): somente as colunas pedidas, sem construir o modelo completo
+Projection = Dict[str, Any]
+
+
+def resolve_fields(model: Type[BaseModel], fields: Optional[Sequence[str]]) -> Optional[List[str]]:
+    """
+    Valida os campos pedidos contra o modelo de domínio e devolve a lista de colunas a ler.
+    `id` é sempre incluído (identifica o item e é usado no cursor da paginação).
+    Retorna None quando não há projeção (todos os campos).
+    """
+    if not fields:
+        return None
+    unknown = [name for name in fields if name not in model.model_fields]
+    if unknown:
+        raise UnknownFieldsError(unknown, list(model.model_fields))
+    return list(dict.fromkeys(["id", *fields]))
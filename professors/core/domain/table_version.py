@@ -0,0 +1,12 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, Field
+
+# Nomes das tabelas com contador de alterações
+PROFESSORS_TABLE = "professors"
+GRADUATIONS_TABLE = "graduations"
+
+class TableVersion(BaseModel):
+    """Contador de alterações de uma tabela: incrementado por toda escrita que a modifica."""
+    version: int = Field(0, description="Número de escritas (0 se a tabela nunca foi alterada)")
+    updated_at: Optional[datetime] = Field(None, description="Instante (UTC) da última escrita")
@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Optional
+
+class CacheMiss:
+    """Marcador de consulta negativa em cache (ex: professor inexistente => 404)."""
+
+    def __repr__(self) -> str:
+        return "NOT_FOUND"
+
+NOT_FOUND = CacheMiss()
+
+@dataclass
+class CachedValue:
+    """Valor lido do cache. `stale` indica que o TTL já passou (só servido se o banco falhar)."""
+    value: Any
+    stale: bool = False
+
+class CachePort(ABC):
+    """Porta de interface (assíncrona) para o cache de leituras do repositório."""
+
+    @abstractmethod
+    async def get(self, key: str, allow_stale: bool = False) -> Optional[CachedValue]:
+        """
+        Busca uma entrada. Entradas vencidas só são retornadas com `allow_stale=True`
+        (marcadas como `stale`), enquanto ainda estiverem na janela de retenção.
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        """Grava uma entrada, válida (fresca) por `ttl` segundos."""
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Remove as entradas (invalidação nas escritas)."""
+        pass
+
+    async def close(self) -> None:
+        """Libera recursos do backend (conexões), se houver."""
+        return None
@@ -1,29 +1,64 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 from professors.core.domain.graduation_models import Graduation, GraduationCreate, GraduationUpdate
+from professors.core.domain.pagination import Keyset, Page
+from professors.core.domain.projection import Projection
 
 class GraduationRepositoryPort(ABC):
     @abstractmethod
-    def add(self, professor_id: uuid.UUID, graduation_data: GraduationCreate) -> Graduation:
+    async def add(self, professor_id: uuid.UUID, graduation_data: GraduationCreate) -> Graduation:
+        """Cria a graduação. Lança ProfessorNotFoundError se o professor não existir."""
         pass
 
     @abstractmethod
-    def get_by_id(self, graduation_id: uuid.UUID) -> Optional[Graduation]:
+    async def get_by_id(self, graduation_id: uuid.UUID) -> Optional[Graduation]:
         pass
 
     @abstractmethod
-    def get_all_for_professor(self, professor_id: uuid.UUID) -> List[Graduation]:
+    async def get_all_for_professor(
+        self, professor_id: uuid.UUID, fields: Optional[List[str]] = None
+    ) -> List[Union[Graduation, Projection]]:
+        """Graduações do professor. Lança ProfessorNotFoundError se o professor não existir."""
         pass
 
     @abstractmethod
-    def get_all(self) -> List[Graduation]:
+    async def get_versions_for_professor(self, professor_id: uuid.UUID) -> List[Tuple[uuid.UUID, int]]:
+        """Somente (id, versão) das graduações do professor (ETag). Lança ProfessorNotFoundError."""
         pass
 
     @abstractmethod
-    def update(self, graduation_id: uuid.UUID, graduation_data: GraduationUpdate) -> Optional[Graduation]:
+    async def get_all_for_professors(self, professor_ids: List[uuid.UUID]) -> Dict[uuid.UUID, List[Graduation]]:
+        """Graduações de vários professores em uma única consulta, agrupadas por professor."""
         pass
 
     @abstractmethod
-    def delete(self, graduation_id: uuid.UUID) -> bool:
+    async def get_all(self, fields: Optional[List[str]] = None) -> List[Union[Graduation, Projection]]:
+        pass
+
+    @abstractmethod
+    async def get_page(
+        self, limit: int, after: Optional[Keyset] = None, fields: Optional[List[str]] = None
+    ) -> Page[Union[Graduation, Projection]]:
+        pass
+
+    @abstractmethod
+    def stream_all(self, chunk_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        pass
+
+    @abstractmethod
+    async def update(
+        self, professor_id: uuid.UUID, graduation_id: uuid.UUID, graduation_data: GraduationUpdate,
+        expected_version: Optional[int] = None
+    ) -> Optional[Graduation]:
+        """
+        Atualiza a graduação do professor e incrementa sua versão. Retorna None se ela não
+        existir (ou for de outro professor); lança ProfessorNotFoundError se o professor não
+        existir e VersionConflictError se ela não estiver em `expected_version`.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, professor_id: uuid.UUID, graduation_id: uuid.UUID) -> bool:
+        """Mesmas regras do `update`: False para graduação inexistente ou de outro professor."""
         pass
\ No newline at end of file
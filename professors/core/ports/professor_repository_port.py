@@ -1,42 +1,113 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Union
 from professors.core.domain.professor_models import Professor, ProfessorCreate, ProfessorUpdate
+from professors.core.domain.pagination import Keyset, Page
+from professors.core.domain.projection import Projection
 
 class ProfessorRepositoryPort(ABC):
-    """Porta de interface para o repositório de professores."""
+    """Porta de interface (assíncrona) para o repositório de professores."""
 
     @abstractmethod
-    def add(self, professor_data: ProfessorCreate) -> Professor:
-        """Cria um novo professor no banco."""
+    async def add(self, professor_data: ProfessorCreate) -> Optional[Professor]:
+        """Cria um novo professor no banco. Retorna None se a matrícula ou o e-mail já existirem."""
         pass
 
     @abstractmethod
-    def get_by_id(self, professor_uuid: uuid.UUID) -> Optional[Professor]:
-        """Busca um professor pelo seu _id (UUID)."""
+    async def add_many(self, professors_data: List[ProfessorCreate]) -> List[Optional[Professor]]:
+        """
+        Cria vários professores de uma vez. Retorna, na mesma ordem da entrada,
+        o professor criado ou None quando o item conflita com um registro existente.
+        """
         pass
 
     @abstractmethod
-    def get_by_registration_number(self, reg_number: int) -> Optional[Professor]:
+    async def get_by_id(
+        self, professor_uuid: uuid.UUID, fields: Optional[List[str]] = None
+    ) -> Optional[Union[Professor, Projection]]:
+        """Busca um professor pelo seu _id (UUID). Com `fields`, retorna só essas colunas (dict)."""
+        pass
+
+    @abstractmethod
+    async def get_many(
+        self, ids: List[uuid.UUID], fields: Optional[List[str]] = None
+    ) -> List[Union[Professor, Projection]]:
+        """Busca vários professores pelos IDs em uma única consulta (IDs inexistentes são ignorados)."""
+        pass
+
+    @abstractmethod
+    async def get_version(self, professor_uuid: uuid.UUID) -> Optional[int]:
+        """Somente a versão do professor (ETag), ou None se ele não existir."""
+        pass
+
+    @abstractmethod
+    async def get_by_registration_number(self, reg_number: int) -> Optional[Professor]:
         """Busca um professor pelo seu registration_number."""
         pass
 
     @abstractmethod
-    def get_all(self) -> List[Professor]:
+    async def get_all(self, fields: Optional[List[str]] = None) -> List[Union[Professor, Projection]]:
         """Retorna todos os professores."""
         pass
     
     @abstractmethod
-    def search(self, params: Dict[str, Any]) -> List[Professor]:
+    async def search(
+        self, params: Dict[str, Any], fields: Optional[List[str]] = None
+    ) -> List[Union[Professor, Projection]]:
         """Busca professores com base em critérios (filtros)."""
         pass
 
     @abstractmethod
-    def update(self, professor_uuid: uuid.UUID, professor_data: Dict[str, Any]) -> Optional[Professor]:
-        """Atualiza um professor (parcial ou completo)."""
+    async def search_by_name(
+        self, query: str, limit: int, accent_insensitive: bool = False,
+        fields: Optional[List[str]] = None
+    ) -> List[Union[Professor, Projection]]:
+        """
+        Busca aproximada por nome, ordenada por similaridade (mais parecidos primeiro),
+        limitada a `limit` resultados. Com `accent_insensitive`, ignora acentos.
+        """
+        pass
+
+    @abstractmethod
+    async def get_page(
+        self, params: Dict[str, Any], limit: int, after: Optional[Keyset] = None,
+        fields: Optional[List[str]] = None
+    ) -> Page[Union[Professor, Projection]]:
+        """Retorna uma página de professores (filtrados por `params`) ordenada por id, após `after`."""
         pass
 
     @abstractmethod
-    def delete(self, professor_uuid: uuid.UUID) -> bool:
+    def stream_all(self, chunk_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Percorre todos os professores em lotes de linhas (dicts), sem carregar a tabela em memória."""
+        pass
+
+    @abstractmethod
+    async def update(
+        self, professor_uuid: uuid.UUID, professor_data: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> Optional[Professor]:
+        """
+        Atualiza um professor (parcial ou completo) e incrementa sua versão. Com
+        `expected_version`, só aplica se a versão atual for essa; senão lança
+        VersionConflictError. Retorna None se o professor não existir.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, professor_uuid: uuid.UUID) -> bool:
         """Deleta um professor pelo seu _id (UUID)."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def delete_many(
+        self, ids: Optional[List[uuid.UUID]] = None, status: Optional[str] = None
+    ) -> List[uuid.UUID]:
+        """Deleta os professores selecionados por IDs e/ou status. Retorna os IDs removidos."""
+        pass
+
+    @abstractmethod
+    async def update_status_many(
+        self, new_status: str, ids: Optional[List[uuid.UUID]] = None, status: Optional[str] = None
+    ) -> List[uuid.UUID]:
+        """Altera o status dos professores selecionados por IDs e/ou status. Retorna os IDs alterados."""
+        pass
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Sequence
+from professors.core.domain.table_version import TableVersion
+
+class TableVersionPort(ABC):
+    @abstractmethod
+    async def get_versions(self, tables: Sequence[str]) -> Dict[str, TableVersion]:
+        """Versão atual de cada tabela pedida (tabelas nunca alteradas: versão 0)."""
+        pass
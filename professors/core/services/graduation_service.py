@@ -1,34 +1,108 @@
 import uuid
-from typing import List
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
 from fastapi import HTTPException, status
 from professors.core.ports.graduation_repository_port import GraduationRepositoryPort
+from professors.core.ports.table_version_port import TableVersionPort
 from professors.core.domain.graduation_models import Graduation, GraduationCreate, GraduationUpdate
+from professors.core.domain.errors import ProfessorNotFoundError, UnknownFieldsError, VersionConflictError
+from professors.core.domain.pagination import Keyset, Page
+from professors.core.domain.projection import Projection, resolve_fields
+from professors.core.domain.table_version import GRADUATIONS_TABLE, TableVersion
+
+
+def _professor_not_found() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Professor not found.")
+
+def _version_conflict() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail="Graduation was modified by another request (If-Match does not match)."
+    )
+
+def _resolve_fields(fields: Optional[Sequence[str]]) -> Optional[List[str]]:
+    """Valida a projeção (?fields=) contra o modelo de domínio Graduation."""
+    try:
+        return resolve_fields(Graduation, fields)
+    except UnknownFieldsError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
 
 class GraduationService:
-    def __init__(self, repository: GraduationRepositoryPort):
+    def __init__(self, repository: GraduationRepositoryPort, table_versions: Optional[TableVersionPort] = None):
         self.repository = repository
+        self.table_versions = table_versions
 
-    def create_graduation(self, professor_id: uuid.UUID, graduation_data: GraduationCreate) -> Graduation:
-        return self.repository.add(professor_id, graduation_data)
+    async def create_graduation(self, professor_id: uuid.UUID, graduation_data: GraduationCreate) -> Graduation:
+        try:
+            return await self.repository.add(professor_id, graduation_data)
+        except ProfessorNotFoundError:
+            raise _professor_not_found()
 
-    def get_graduation_by_id(self, graduation_id: uuid.UUID) -> Graduation:
-        graduation = self.repository.get_by_id(graduation_id)
+    async def get_graduation_by_id(self, graduation_id: uuid.UUID) -> Graduation:
+        graduation = await self.repository.get_by_id(graduation_id)
         if not graduation:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Graduation not found.")
         return graduation
 
-    def get_all_graduations_for_professor(self, professor_id: uuid.UUID) -> List[Graduation]:
-        return self.repository.get_all_for_professor(professor_id)
+    async def get_all_graduations_for_professor(
+        self, professor_id: uuid.UUID, fields: Optional[Sequence[str]] = None
+    ) -> List[Union[Graduation, Projection]]:
+        columns = _resolve_fields(fields)
+        try:
+            return await self.repository.get_all_for_professor(professor_id, fields=columns)
+        except ProfessorNotFoundError:
+            raise _professor_not_found()
+
+    async def get_listing_versions(self) -> Optional[Dict[str, TableVersion]]:
+        """Versão da tabela de graduações (cache HTTP da listagem geral); None sem o contador."""
+        if self.table_versions is None:
+            return None
+        return await self.table_versions.get_versions([GRADUATIONS_TABLE])
 
-    def get_all_graduations(self) -> List[Graduation]:
-        return self.repository.get_all()
+    async def get_graduation_versions(self, professor_id: uuid.UUID) -> List[Tuple[uuid.UUID, int]]:
+        """(id, versão) das graduações do professor, sem ler as linhas completas (ETag)."""
+        try:
+            return await self.repository.get_versions_for_professor(professor_id)
+        except ProfessorNotFoundError:
+            raise _professor_not_found()
 
-    def update_graduation(self, graduation_id: uuid.UUID, graduation_data: GraduationUpdate) -> Graduation:
-        updated = self.repository.update(graduation_id, graduation_data)
+    async def get_graduations_for_professors(
+        self, professor_ids: Sequence[uuid.UUID]
+    ) -> Dict[uuid.UUID, List[Graduation]]:
+        """Graduações de um lote de professores, em uma única consulta, agrupadas por professor."""
+        return await self.repository.get_all_for_professors(list(dict.fromkeys(professor_ids)))
+
+    async def get_all_graduations(self, fields: Optional[Sequence[str]] = None) -> List[Union[Graduation, Projection]]:
+        return await self.repository.get_all(fields=_resolve_fields(fields))
+
+    async def get_graduations_page(
+        self, limit: int, after: Optional[Keyset] = None, fields: Optional[Sequence[str]] = None
+    ) -> Page[Union[Graduation, Projection]]:
+        return await self.repository.get_page(limit, after, fields=_resolve_fields(fields))
+
+    def export_graduations(self, chunk_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        return self.repository.stream_all(chunk_size)
+
+    async def update_graduation(
+        self, professor_id: uuid.UUID, graduation_id: uuid.UUID, graduation_data: GraduationUpdate,
+        expected_version: Optional[int] = None
+    ) -> Graduation:
+        try:
+            updated = await self.repository.update(
+                professor_id, graduation_id, graduation_data, expected_version=expected_version
+            )
+        except ProfessorNotFoundError:
+            raise _professor_not_found()
+        except VersionConflictError:
+            raise _version_conflict()
         if not updated:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Graduation not found.")
         return updated
 
-    def delete_graduation(self, graduation_id: uuid.UUID) -> None:
-        if not self.repository.delete(graduation_id):
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Graduation not found.")
\ No newline at end of file
+    async def delete_graduation(self, professor_id: uuid.UUID, graduation_id: uuid.UUID) -> None:
+        try:
+            deleted = await self.repository.delete(professor_id, graduation_id)
+        except ProfessorNotFoundError:
+            raise _professor_not_found()
+        if not deleted:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Graduation not found.")
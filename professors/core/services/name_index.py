@@ -0,0 +1,149 @@
+import asyncio
+import bisect
+import logging
+import unicodedata
+import uuid
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from professors.core.domain.projection import Projection
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_name(value: str) -> str:
+    """Forma de busca de um nome: sem acentos, casefold e com espaços colapsados."""
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.casefold().split())
+
+
+class ProfessorNameIndex:
+    """
+    Índice de prefixos em memória para o autocompletar de nomes de professores.
+
+    Cada nome normalizado gera uma entrada por palavra (o restante do nome a partir dela),
+    guardadas em um array ordenado: "joão da silva" => "joao da silva", "da silva", "silva".
+    A busca por prefixo é um `bisect` seguido de uma varredura contígua, sem acesso ao banco.
+    O índice é por processo e reflete na hora as escritas do ProfessorService deste
+    processo. Com `load` (versão da tabela de professores e pares (id, nome)), uma tarefa
+    em segundo plano (`start`) confere a versão da tabela (`load_version`) a cada
+    `refresh_interval_seconds` e recarrega o índice quando ela muda (escritas de outras
+    instâncias) ou se a carga anterior falhou. As buscas nunca consultam o banco.
+    """
+
+    def __init__(
+        self,
+        load: Optional[Callable[[], Awaitable[Tuple[int, Iterable[Tuple[uuid.UUID, str]]]]]] = None,
+        load_version: Optional[Callable[[], Awaitable[int]]] = None,
+        refresh_interval_seconds: float = 5.0,
+    ) -> None:
+        self._entries: List[Tuple[str, uuid.UUID]] = []
+        self._names: Dict[uuid.UUID, str] = {}
+        self.ready = False
+        # Versão da tabela de professores refletida pela última carga
+        self.version: Optional[int] = None
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._load = load
+        self._load_version = load_version
+        self._poll_task: Optional["asyncio.Task[None]"] = None
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @staticmethod
+    def _keys(name: str) -> List[str]:
+        words = normalize_name(name).split(" ")
+        return [" ".join(words[i:]) for i in range(len(words)) if words[i]]
+
+    def build(self, professors: Iterable[Tuple[uuid.UUID, str]], version: Optional[int] = None) -> None:
+        """Reconstrói o índice a partir de pares (id, nome)."""
+        names = {professor_id: name for professor_id, name in professors}
+        self._entries = sorted(
+            (key, professor_id) for professor_id, name in names.items() for key in self._keys(name)
+        )
+        self._names = names
+        self.version = version
+        self.ready = True
+
+    async def refresh(self) -> None:
+        """Recarrega o índice inteiro com `load` (a versão é lida antes dos nomes)."""
+        if self._load is None:
+            return
+        version, professors = await self._load()
+        self.build(professors, version)
+
+    async def refresh_if_stale(self) -> bool:
+        """
+        Recarrega o índice se ele não foi carregado ou está em outra versão da tabela.
+        As escritas locais também mudam a versão: o índice já as reflete, e a recarga só
+        confirma o estado (as escritas de um intervalo viram uma recarga).
+        """
+        if self._load is None:
+            return False
+        if self.ready and self._load_version is not None:
+            if await self._load_version() == self.version:
+                return False
+        await self.refresh()
+        return True
+
+    def start(self) -> None:
+        """Inicia a conferência periódica da versão da tabela (no event loop atual)."""
+        if self._load is None:
+            return
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = asyncio.get_running_loop().create_task(self._poll())
+
+    async def _poll(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval_seconds)
+            try:
+                await self.refresh_if_stale()
+            except Exception:
+                logger.exception("Falha ao recarregar o índice do autocompletar")
+
+    async def close(self) -> None:
+        task, self._poll_task = self._poll_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def add(self, professor_id: uuid.UUID, name: str) -> None:
+        """Insere (ou substitui) o nome de um professor."""
+        self.remove(professor_id)
+        self._names[professor_id] = name
+        for key in self._keys(name):
+            bisect.insort(self._entries, (key, professor_id))
+
+    def remove(self, professor_id: uuid.UUID) -> None:
+        name = self._names.pop(professor_id, None)
+        if name is None:
+            return
+        for key in self._keys(name):
+            position = bisect.bisect_left(self._entries, (key, professor_id))
+            if position < len(self._entries) and self._entries[position] == (key, professor_id):
+                del self._entries[position]
+
+    def search(self, prefix: str, limit: int) -> List[Projection]:
+        """
+        Professores com alguma palavra do nome começando por `prefix` (ou com o nome
+        começando pela sequência de palavras), em ordem alfabética do trecho encontrado.
+        """
+        term = normalize_name(prefix)
+        if not term:
+            return []
+
+        results: List[Projection] = []
+        seen = set()
+        position = bisect.bisect_left(self._entries, (term,))
+        while position < len(self._entries) and len(results) < limit:
+            key, professor_id = self._entries[position]
+            if not key.startswith(term):
+                break
+            if professor_id not in seen:
+                seen.add(professor_id)
+                results.append({"id": professor_id, "name": self._names[professor_id]})
+            position += 1
+        return results
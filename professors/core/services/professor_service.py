@@ -1,26 +1,91 @@
 import uuid
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Sequence, Tuple, Union
 from fastapi import Depends, HTTPException, status
 from professors.core.ports.professor_repository_port import ProfessorRepositoryPort
-from professors.core.domain.professor_models import Professor, ProfessorCreate, ProfessorUpdate
+from professors.core.ports.graduation_repository_port import GraduationRepositoryPort
+from professors.core.ports.table_version_port import TableVersionPort
+from professors.core.domain.professor_models import (
+    INACTIVE_STATUS, Professor, ProfessorCreate, ProfessorUpdate, ProfessorWithGraduations
+)
+from professors.core.domain.errors import UnknownFieldsError, VersionConflictError
+from professors.core.domain.pagination import Keyset, Page
+from professors.core.domain.projection import Projection, resolve_fields
+from professors.core.domain.table_version import GRADUATIONS_TABLE, PROFESSORS_TABLE, TableVersion
+from professors.core.services.name_index import ProfessorNameIndex
+
+# Filtros da listagem que consultam a tabela de graduações
+GRADUATION_FILTERS = ("degree", "course", "institution_name", "year_min", "year_max")
 
 class ProfessorService:
     """Serviço com a lógica de negócios para professores."""
     
-    def __init__(self, repository: ProfessorRepositoryPort):
+    def __init__(
+        self,
+        repository: ProfessorRepositoryPort,
+        graduation_repository: Optional[GraduationRepositoryPort] = None,
+        name_index: Optional[ProfessorNameIndex] = None,
+        table_versions: Optional[TableVersionPort] = None
+    ):
         self.repository = repository
+        self.graduation_repository = graduation_repository
+        # Índice em memória do autocompletar, mantido a cada escrita feita por este serviço
+        self.name_index = name_index
+        self.table_versions = table_versions
 
-    def create_professor(self, professor_data: ProfessorCreate) -> Professor:
-        if self.repository.get_by_registration_number(professor_data.registration_number):
+    async def create_professor(self, professor_data: ProfessorCreate) -> Professor:
+        # O conflito é detectado pelo próprio INSERT (ON CONFLICT), sem consulta prévia
+        created = await self.repository.add(professor_data)
+        if created is None:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
-                detail=f"Professor with registration_number '{professor_data.registration_number}' already exists."
+                detail=(
+                    f"Professor with registration_number '{professor_data.registration_number}' "
+                    f"or institucional_email '{professor_data.institucional_email}' already exists."
+                )
             )
-            
-        return self.repository.add(professor_data)
+        if self.name_index is not None:
+            self.name_index.add(created.id, created.name)
+        return created
+
+    async def create_professors(self, professors_data: List[ProfessorCreate]) -> List[Optional[Professor]]:
+        """
+        Cria professores em lote. O resultado segue a ordem da entrada: o professor
+        criado, ou None para itens em conflito (com o banco ou repetidos no próprio lote).
+        """
+        seen_registration_numbers = set()
+        seen_emails = set()
+        unique_indexes: List[int] = []
+        to_create: List[ProfessorCreate] = []
+
+        for index, professor in enumerate(professors_data):
+            if (professor.registration_number in seen_registration_numbers
+                    or professor.institucional_email in seen_emails):
+                continue
+            seen_registration_numbers.add(professor.registration_number)
+            seen_emails.add(professor.institucional_email)
+            unique_indexes.append(index)
+            to_create.append(professor)
+
+        results: List[Optional[Professor]] = [None] * len(professors_data)
+        if to_create:
+            created = await self.repository.add_many(to_create)
+            for index, professor in zip(unique_indexes, created):
+                results[index] = professor
+                if professor is not None and self.name_index is not None:
+                    self.name_index.add(professor.id, professor.name)
+        return results
+
+    def _resolve_fields(self, fields: Optional[Sequence[str]]) -> Optional[List[str]]:
+        """Valida a projeção (?fields=) contra o modelo de domínio Professor."""
+        try:
+            return resolve_fields(Professor, fields)
+        except UnknownFieldsError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-    def get_professor_by_id(self, professor_uuid: uuid.UUID) -> Professor:
-        professor = self.repository.get_by_id(professor_uuid)
+    async def get_professor_by_id(
+        self, professor_uuid: uuid.UUID, fields: Optional[Sequence[str]] = None
+    ) -> Union[Professor, Projection]:
+        professor = await self.repository.get_by_id(professor_uuid, fields=self._resolve_fields(fields))
         if not professor:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -28,30 +93,169 @@ class ProfessorService:
             ) 
         return professor
 
-    def get_all_professors(self) -> List[Professor]:
-        return self.repository.get_all()
+    async def get_listing_versions(
+        self, params: Dict[str, Any], include_graduations: bool = False
+    ) -> Optional[Dict[str, TableVersion]]:
+        """
+        Versões das tabelas lidas pela listagem com estes filtros (cache HTTP das coleções).
+        None quando o serviço não tem acesso ao contador de alterações.
+        """
+        if self.table_versions is None:
+            return None
+        tables = [PROFESSORS_TABLE]
+        if include_graduations or any(params.get(name) is not None for name in GRADUATION_FILTERS):
+            tables.append(GRADUATIONS_TABLE)
+        return await self.table_versions.get_versions(tables)
 
-    def search_professors(self, params: Dict[str, Any]) -> List[Professor]:
+    async def get_professor_version(self, professor_uuid: uuid.UUID) -> int:
+        """Somente a versão do professor (ETag das requisições condicionais)."""
+        version = await self.repository.get_version(professor_uuid)
+        if version is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Professor not found."
+            )
+        return version
+
+    async def get_graduation_versions(self, professor_uuid: uuid.UUID) -> List[Tuple[uuid.UUID, int]]:
+        """(id, versão) das graduações do professor (ETag do detalhe com ?include=graduations)."""
+        return await self.graduation_repository.get_versions_for_professor(professor_uuid)
+
+    async def lookup_professors(
+        self, ids: Sequence[uuid.UUID], fields: Optional[Sequence[str]] = None
+    ) -> List[Union[Professor, Projection]]:
+        """
+        Resolve um lote de IDs em uma única consulta. IDs repetidos são consultados uma vez;
+        o resultado segue a ordem dos IDs pedidos e omite os que não existem.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        found = await self.repository.get_many(unique_ids, fields=self._resolve_fields(fields))
+        by_id = {(p["id"] if isinstance(p, dict) else p.id): p for p in found}
+        return [by_id[professor_id] for professor_id in unique_ids if professor_id in by_id]
+
+    async def get_all_professors(self, fields: Optional[Sequence[str]] = None) -> List[Union[Professor, Projection]]:
+        return await self.repository.get_all(fields=self._resolve_fields(fields))
+
+    async def search_professors(
+        self, params: Dict[str, Any], fields: Optional[Sequence[str]] = None
+    ) -> List[Union[Professor, Projection]]:
         search_params = {k: v for k, v in params.items() if v is not None}
-        return self.repository.search(search_params)
+        return await self.repository.search(search_params, fields=self._resolve_fields(fields))
 
-    def update_professor(self, professor_uuid: uuid.UUID, professor_data: ProfessorUpdate) -> Professor:
-        updated_professor = self.repository.update(
-            professor_uuid, 
-            professor_data.model_dump()
+    async def search_professors_by_name(
+        self, query: str, limit: int, accent_insensitive: bool = False,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Union[Professor, Projection]]:
+        """Busca aproximada por nome (trigramas), com os resultados mais parecidos primeiro."""
+        term = query.strip()
+        if not term:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Search query must not be empty."
+            )
+        return await self.repository.search_by_name(
+            term, limit, accent_insensitive=accent_insensitive, fields=self._resolve_fields(fields)
         )
+
+    def autocomplete_professors(self, prefix: str, limit: int) -> List[Projection]:
+        """
+        Sugestões (id e nome) para o autocompletar, servidas só do índice em memória, sem
+        acesso ao banco. O índice é mantido pelas escritas deste serviço e recarregado em
+        segundo plano quando a tabela muda (ver ProfessorNameIndex.start).
+        """
+        if self.name_index is None or not self.name_index.ready:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Autocomplete index is not ready."
+            )
+        return self.name_index.search(prefix, limit)
+
+    async def get_professors_page(
+        self, params: Dict[str, Any], limit: int, after: Optional[Keyset] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> Page[Union[Professor, Projection]]:
+        search_params = {k: v for k, v in params.items() if v is not None}
+        return await self.repository.get_page(search_params, limit, after, fields=self._resolve_fields(fields))
+
+    async def include_graduations(
+        self, professors: List[Union[Professor, Projection]]
+    ) -> List[Union[ProfessorWithGraduations, Projection]]:
+        """Embute as graduações nos professores, carregadas em uma única consulta para todos."""
+        ids = [p["id"] if isinstance(p, dict) else p.id for p in professors]
+        graduations = await self.graduation_repository.get_all_for_professors(ids)
+        return [
+            # Itens projetados (?fields=) continuam dicts, acrescidos das graduações
+            {**professor, "graduations": graduations.get(professor_id, [])}
+            if isinstance(professor, dict)
+            else ProfessorWithGraduations.model_construct(
+                **professor.__dict__, graduations=graduations.get(professor_id, [])
+            )
+            for professor_id, professor in zip(ids, professors)
+        ]
+
+    def export_professors(self, chunk_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Lotes de linhas de todos os professores, para exportação em streaming."""
+        return self.repository.stream_all(chunk_size)
+
+    async def update_professor(
+        self, professor_uuid: uuid.UUID, professor_data: ProfessorUpdate,
+        expected_version: Optional[int] = None
+    ) -> Professor:
+        try:
+            updated_professor = await self.repository.update(
+                professor_uuid, 
+                professor_data.model_dump(),
+                expected_version=expected_version
+            )
+        except VersionConflictError:
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="Professor was modified by another request (If-Match does not match)."
+            )
         if not updated_professor:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Professor not found."
             ) 
+        if self.name_index is not None:
+            self.name_index.add(updated_professor.id, updated_professor.name)
         return updated_professor
 
-    def delete_professor(self, professor_uuid: uuid.UUID) -> None:
-        success = self.repository.delete(professor_uuid)
+    async def delete_professor(self, professor_uuid: uuid.UUID) -> None:
+        success = await self.repository.delete(professor_uuid)
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Professor not found."
             ) 
+        if self.name_index is not None:
+            self.name_index.remove(professor_uuid)
         return
+
+    # --- Operações em lote (por IDs e/ou status) ---
+
+    def _check_selection(self, ids: Optional[List[uuid.UUID]], status_filter: Optional[str]) -> None:
+        if ids is None and status_filter is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Provide 'ids' and/or 'status' to select professors."
+            )
+
+    async def delete_professors(
+        self, ids: Optional[List[uuid.UUID]] = None, status_filter: Optional[str] = None
+    ) -> int:
+        self._check_selection(ids, status_filter)
+        deleted_ids = await self.repository.delete_many(ids=ids, status=status_filter)
+        if self.name_index is not None:
+            for professor_id in deleted_ids:
+                self.name_index.remove(professor_id)
+        return len(deleted_ids)
+
+    async def deactivate_professors(
+        self, ids: Optional[List[uuid.UUID]] = None, status_filter: Optional[str] = None
+    ) -> int:
+        self._check_selection(ids, status_filter)
+        updated_ids = await self.repository.update_status_many(INACTIVE_STATUS, ids=ids, status=status_filter)
+        # O índice do autocompletar guarda só (id, nome), de professores em qualquer status:
+        # desativar não muda o nome nem remove o professor, então não há o que atualizar
+        return len(updated_ids)
@@ -1,29 +1,144 @@
-from sqlalchemy.orm import Session
+from contextlib import asynccontextmanager
+from typing import Any, AsyncContextManager, AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
 
-from professors.adapters.database.database import get_db
+from professors.adapters.api.snapshot import DirectorySnapshot
+from professors.adapters.database.database import SessionLocal, get_db
+from professors.adapters.cache.cached_repositories import (
+    CacheTTL, CachedGraduationRepository, CachedProfessorRepository, build_cache
+)
+from professors.config import settings
 from professors.adapters.database.professor_repository import SQLAlchemyProfessorRepository
 from professors.core.ports.professor_repository_port import ProfessorRepositoryPort
 from professors.core.services.professor_service import ProfessorService
+from professors.core.services.name_index import ProfessorNameIndex
 
 from professors.adapters.database.graduation_repository import SQLAlchemyGraduationRepository
+from professors.adapters.database.table_version_repository import SQLAlchemyTableVersionRepository
+from professors.core.ports.table_version_port import TableVersionPort
+from professors.core.domain.table_version import GRADUATIONS_TABLE, PROFESSORS_TABLE, TableVersion
 from professors.core.ports.graduation_repository_port import GraduationRepositoryPort
 from professors.core.services.graduation_service import GraduationService
 
+# Cache de leituras compartilhado pelas requisições (None com CACHE_BACKEND=none)
+repository_cache = build_cache(
+    settings.CACHE_BACKEND,
+    max_size=settings.CACHE_MAX_SIZE,
+    stale_ttl=settings.CACHE_STALE_TTL_SECONDS,
+    redis_url=settings.CACHE_REDIS_URL,
+)
+cache_ttls = CacheTTL(ttl=settings.CACHE_TTL_SECONDS, negative_ttl=settings.CACHE_NEGATIVE_TTL_SECONDS)
+
+# --- Índice do autocompletar e snapshots das listagens completas ---
+# Carregados na inicialização (main.py) e recarregados quando a versão da tabela muda.
+# Usam uma sessão própria (a recarga roda fora de uma requisição) e leem direto do
+# banco, sem o cache de leituras. A versão da tabela é lida antes dos itens.
+async def _load_professor_names() -> Tuple[int, List[Tuple[Any, str]]]:
+    async with SessionLocal() as db:
+        service = ProfessorService(
+            SQLAlchemyProfessorRepository(db), table_versions=SQLAlchemyTableVersionRepository(db)
+        )
+        versions = await service.get_listing_versions({})
+        professors = await service.get_all_professors(fields=["id", "name"])
+        return versions[PROFESSORS_TABLE].version, [(p["id"], p["name"]) for p in professors]
+
+async def _load_professors_version() -> int:
+    async with SessionLocal() as db:
+        versions = await SQLAlchemyTableVersionRepository(db).get_versions([PROFESSORS_TABLE])
+        return versions[PROFESSORS_TABLE].version
+
+# Único por processo
+professor_name_index = ProfessorNameIndex(
+    _load_professor_names, _load_professors_version,
+    refresh_interval_seconds=settings.PROFESSOR_NAME_INDEX_REFRESH_SECONDS,
+)
+
+async def _load_all_professors() -> Tuple[TableVersion, List[Any]]:
+    async with SessionLocal() as db:
+        service = ProfessorService(
+            SQLAlchemyProfessorRepository(db), table_versions=SQLAlchemyTableVersionRepository(db)
+        )
+        versions = await service.get_listing_versions({})
+        return versions[PROFESSORS_TABLE], await service.get_all_professors()
+
+async def _load_all_graduations() -> Tuple[TableVersion, List[Any]]:
+    async with SessionLocal() as db:
+        service = GraduationService(
+            SQLAlchemyGraduationRepository(db), table_versions=SQLAlchemyTableVersionRepository(db)
+        )
+        versions = await service.get_listing_versions()
+        return versions[GRADUATIONS_TABLE], await service.get_all_graduations()
+
+def _directory_snapshot(
+    name: str, table: str, load: Callable[[], Awaitable[Tuple[TableVersion, List[Any]]]]
+) -> Optional[DirectorySnapshot]:
+    if not settings.DIRECTORY_SNAPSHOT_ENABLED:
+        return None
+    return DirectorySnapshot(
+        name, table, load,
+        debounce_seconds=settings.DIRECTORY_SNAPSHOT_DEBOUNCE_SECONDS,
+        compress=settings.DIRECTORY_SNAPSHOT_GZIP,
+    )
+
+professor_directory = _directory_snapshot("professors", PROFESSORS_TABLE, _load_all_professors)
+graduation_directory = _directory_snapshot("graduations", GRADUATIONS_TABLE, _load_all_graduations)
+
 # --- Providers para Professor ---
-def get_professor_repository(db: Session = Depends(get_db)) -> ProfessorRepositoryPort:
-    return SQLAlchemyProfessorRepository(db)
+def get_professor_repository(db: AsyncSession = Depends(get_db)) -> ProfessorRepositoryPort:
+    repository = SQLAlchemyProfessorRepository(db)
+    if repository_cache is None:
+        return repository
+    return CachedProfessorRepository(repository, repository_cache, cache_ttls)
+
+# --- Providers para Graduation (NOVOS) ---
+def get_graduation_repository(db: AsyncSession = Depends(get_db)) -> GraduationRepositoryPort:
+    repository = SQLAlchemyGraduationRepository(db)
+    if repository_cache is None:
+        return repository
+    return CachedGraduationRepository(repository, repository_cache, cache_ttls)
+
+# Contador de alterações por tabela (cache HTTP das listagens); nunca passa pelo cache
+def get_table_version_repository(db: AsyncSession = Depends(get_db)) -> TableVersionPort:
+    return SQLAlchemyTableVersionRepository(db)
 
 def get_professor_service(
-    repo: ProfessorRepositoryPort = Depends(get_professor_repository)
+    repo: ProfessorRepositoryPort = Depends(get_professor_repository),
+    graduation_repo: GraduationRepositoryPort = Depends(get_graduation_repository),
+    table_versions: TableVersionPort = Depends(get_table_version_repository)
 ) -> ProfessorService:
-    return ProfessorService(repo)
+    # O repositório de graduações é usado no ?include=graduations (mesma sessão da requisição)
+    return ProfessorService(
+        repo, graduation_repo, name_index=professor_name_index, table_versions=table_versions
+    )
 
-# --- Providers para Graduation (NOVOS) ---
-def get_graduation_repository(db: Session = Depends(get_db)) -> GraduationRepositoryPort:
-    return SQLAlchemyGraduationRepository(db)
+# Autocompletar: só o índice em memória. Sem get_db, a requisição não abre sessão no banco
+def get_professor_autocomplete_service() -> ProfessorService:
+    return ProfessorService(repository=None, name_index=professor_name_index)
 
 def get_graduation_service(
-    repo: GraduationRepositoryPort = Depends(get_graduation_repository)
+    repo: GraduationRepositoryPort = Depends(get_graduation_repository),
+    table_versions: TableVersionPort = Depends(get_table_version_repository)
 ) -> GraduationService:
-    return GraduationService(repo)
+    return GraduationService(repo, table_versions=table_versions)
+
+# --- Serviços com sessão própria (leituras coalescidas por single-flight) ---
+# A leitura compartilhada roda em uma task que pode sobreviver à requisição líder: ela não
+# usa a sessão da requisição (fechada no teardown), e sim uma aberta e fechada por ela.
+@asynccontextmanager
+async def _professor_service_session() -> AsyncIterator[ProfessorService]:
+    async with SessionLocal() as db:
+        yield get_professor_service(
+            get_professor_repository(db), get_graduation_repository(db), get_table_version_repository(db)
+        )
+
+@asynccontextmanager
+async def _graduation_service_session() -> AsyncIterator[GraduationService]:
+    async with SessionLocal() as db:
+        yield get_graduation_service(get_graduation_repository(db), get_table_version_repository(db))
+
+def get_professor_service_factory() -> Callable[[], AsyncContextManager[ProfessorService]]:
+    return _professor_service_session
+
+def get_graduation_service_factory() -> Callable[[], AsyncContextManager[GraduationService]]:
+    return _graduation_service_session
@@ -1,11 +1,43 @@
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
-import asyncio
 from prometheus_fastapi_instrumentator import Instrumentator  # <-- ADICIONE ESTA IMPORTAÇÃO
 
 from professors.config import get_settings
 from professors.adapters.api.routes import professors, classes, graduations  # Importa o módulo
-from professors.adapters.database.database import Base, engine
+from professors.adapters.database.database import Base, engine, upgrade_schema
+from professors.dependencies import (
+    graduation_directory, professor_directory, professor_name_index, repository_cache
+)
+from professors.adapters.api.oauth_client import start_oauth_client, close_oauth_client
+from professors.adapters.api.auth import jwks_cache
+from professors.adapters.api.loop_watchdog import EventLoopWatchdog, LoopWatchdogMiddleware
+from professors.adapters.api.stale_cache import StaleCacheWarningMiddleware
+
+async def warm_up_read_models() -> None:
+    """
+    Carrega o índice do autocompletar (e inicia a recarga periódica dele) e os snapshots
+    das listagens completas. Falhas não impedem a inicialização: cada um é recarregado
+    depois, em segundo plano.
+    """
+    print("Carregando índice de nomes do autocompletar...")
+    try:
+        await professor_name_index.refresh()
+        print(f"Índice do autocompletar pronto ({len(professor_name_index)} professores).")
+    except Exception as e:
+        # Recarregado pela tarefa periódica
+        print(f"Erro ao carregar o índice do autocompletar: {e}")
+    professor_name_index.start()
+
+    # Sem o snapshot (erro aqui), as listagens completas seguem pelo banco e ele é
+    # reconstruído na primeira leitura
+    for directory in (professor_directory, graduation_directory):
+        if directory is None:
+            continue
+        print(f"Carregando snapshot da listagem de {directory.name}...")
+        try:
+            await directory.refresh()
+        except Exception as e:
+            print(f"Erro ao carregar o snapshot de {directory.name}: {e}")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -14,13 +46,38 @@ async def lifespan(app: FastAPI):
 
     print("Verificando e criando tabelas (se não existirem)...")
     try:
-        await asyncio.to_thread(Base.metadata.create_all, bind=engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(upgrade_schema)
         print("Tabelas prontas.")
     except Exception as e:
         print(f"Erro ao criar tabelas: {e}")
 
+    await warm_up_read_models()
+
+    # Cliente HTTP compartilhado para o serviço de OAuth (pool de conexões keep-alive)
+    await start_oauth_client()
+
+    if get_settings().AUTH_MODE == "jwt":
+        print("Carregando chaves JWKS para verificação local de tokens...")
+        await jwks_cache.start()
+
+    if get_settings().LOOP_WATCHDOG_ENABLED:
+        print("Iniciando watchdog do event loop...")
+        loop_watchdog.start()
+
     yield
     print("Encerrando serviço Professors...")
+    await loop_watchdog.stop()
+    await professor_name_index.close()
+    for directory in (professor_directory, graduation_directory):
+        if directory is not None:
+            await directory.close()
+    await jwks_cache.stop()
+    await close_oauth_client()
+    if repository_cache is not None:
+        await repository_cache.close()
+    await engine.dispose()
 
 
 app = FastAPI(
@@ -35,6 +92,18 @@ app.include_router(classes.router)
 app.include_router(graduations.router)
 Instrumentator().instrument(app).expose(app)
 
+# Header Warning nas respostas servidas com entradas vencidas do cache (banco fora)
+app.add_middleware(StaleCacheWarningMiddleware)
+
+# Watchdog do event loop (LOOP_WATCHDOG_ENABLED): detecta chamadas bloqueantes dentro de rotas async
+loop_watchdog = EventLoopWatchdog(
+    app,
+    interval=get_settings().LOOP_WATCHDOG_INTERVAL_SECONDS,
+    threshold=get_settings().LOOP_WATCHDOG_THRESHOLD_SECONDS,
+)
+if get_settings().LOOP_WATCHDOG_ENABLED:
+    app.add_middleware(LoopWatchdogMiddleware, watchdog=loop_watchdog)
+
 @app.get("/health", tags=["Health Check"], summary="Verifica a saúde da API")
 def health_check():
     return {"status": "ok"}
\ No newline at end of file
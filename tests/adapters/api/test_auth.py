@@ -0,0 +1,273 @@
+import asyncio
+import json
+import time
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
+
+from pydantic import ValidationError
+
+from professors.adapters.api import auth
+from professors.adapters.api.jwt_verifier import JWKSCache, JWKSUnavailableError, JWTVerifier
+from professors.adapters.api.token_cache import TokenCache
+from professors.config import Settings
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return TokenCache(max_size=2, ttl_seconds=60, clock=clock, wall_clock=clock)
+
+
+@pytest.fixture(autouse=True)
+def reset_auth_state():
+    auth.token_cache.clear()
+    auth._inflight.clear()
+    yield
+    auth.token_cache.clear()
+    auth._inflight.clear()
+
+
+def test_token_cache_key_does_not_contain_token():
+    key = TokenCache.key("secret-token")
+
+    assert "secret-token" not in key
+    assert key == TokenCache.key("secret-token")
+
+def test_token_cache_hit_and_ttl_expiry(cache, clock):
+    cache.set("k", {"sub": "user"})
+
+    assert cache.get("k") == {"sub": "user"}
+
+    clock.now += 61
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+def test_token_cache_expires_at_token_exp(cache, clock):
+    cache.set("k", {"sub": "user", "exp": clock.now + 5})
+
+    clock.now += 6
+    assert cache.get("k") is None
+
+def test_token_cache_skips_already_expired_tokens(cache, clock):
+    cache.set("k", {"sub": "user", "exp": clock.now - 1})
+
+    assert len(cache) == 0
+
+def test_token_cache_evicts_least_recently_used(cache):
+    cache.set("a", {"sub": "a"})
+    cache.set("b", {"sub": "b"})
+    cache.get("a")
+    cache.set("c", {"sub": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"sub": "a"}
+    assert cache.get("c") == {"sub": "c"}
+
+def test_validate_token_shares_inflight_validation(monkeypatch):
+    calls = []
+
+    async def fake_introspect(token):
+        calls.append(token)
+        await asyncio.sleep(0.01)
+        return {"sub": "user"}
+
+    monkeypatch.setattr(auth, "_introspect", fake_introspect)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="abc")
+
+    async def run():
+        return await asyncio.gather(*(auth.validate_token(credentials) for _ in range(5)))
+
+    results = asyncio.run(run())
+
+    assert results == [{"sub": "user"}] * 5
+    assert calls == ["abc"]
+    assert auth._inflight == {}
+
+def test_validate_token_uses_cache_on_subsequent_calls(monkeypatch):
+    calls = []
+
+    async def fake_introspect(token):
+        calls.append(token)
+        return {"sub": "user"}
+
+    monkeypatch.setattr(auth, "_introspect", fake_introspect)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="abc")
+
+    asyncio.run(auth.validate_token(credentials))
+    asyncio.run(auth.validate_token(credentials))
+
+    assert calls == ["abc"]
+
+
+# --- Verificação local de JWT (AUTH_MODE=jwt) ---
+
+ISSUER = "http://keycloak/realms/test"
+AUDIENCE = "professors"
+
+private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+other_private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def make_token(key=private_key, kid="test-key", **overrides):
+    claims = {"sub": "user", "iss": ISSUER, "aud": AUDIENCE, "exp": int(time.time()) + 60}
+    claims.update(overrides)
+    claims = {name: value for name, value in claims.items() if value is not None}
+    return jwt.encode(claims, key, algorithm="RS256", headers={"kid": kid})
+
+
+@pytest.fixture
+def jwks_file(tmp_path):
+    jwk = jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    jwk.update({"kid": "test-key", "use": "sig", "alg": "RS256"})
+    path = tmp_path / "jwks.json"
+    path.write_text(json.dumps({"keys": [jwk]}))
+    return path
+
+
+@pytest.fixture
+def verifier(jwks_file):
+    jwks = JWKSCache(path=str(jwks_file))
+    return JWTVerifier(jwks, issuer=ISSUER, audience=AUDIENCE, algorithms=["RS256"])
+
+
+def test_jwt_verifier_accepts_valid_token(verifier):
+    claims = asyncio.run(verifier.verify(make_token()))
+
+    assert claims["sub"] == "user"
+
+@pytest.mark.parametrize("token_kwargs", [
+    {"exp": int(time.time()) - 120},
+    {"iss": "http://evil/realms/test"},
+    {"aud": "other-service"},
+    {"iss": None},
+    {"aud": None},
+    {"key": other_private_key},
+    {"kid": "unknown-key"},
+])
+def test_jwt_verifier_rejects_invalid_tokens(verifier, token_kwargs):
+    with pytest.raises(jwt.InvalidTokenError):
+        asyncio.run(verifier.verify(make_token(**token_kwargs)))
+
+def test_jwt_verifier_without_jwks_source_is_unavailable():
+    verifier = JWTVerifier(JWKSCache(), issuer=ISSUER, audience=AUDIENCE, algorithms=["RS256"])
+
+    with pytest.raises(JWKSUnavailableError):
+        asyncio.run(verifier.verify(make_token()))
+
+@pytest.mark.parametrize("overrides", [
+    {"OAUTH_JWT_AUDIENCE": AUDIENCE},
+    {"OAUTH_JWT_ISSUER": ISSUER},
+])
+def test_jwt_mode_requires_issuer_and_audience(overrides):
+    with pytest.raises(ValidationError):
+        Settings(AUTH_MODE="jwt", **overrides)
+
+def test_jwks_cache_throttles_failed_refreshes(monkeypatch, clock):
+    jwks = JWKSCache(url="http://keycloak/certs", min_refresh_interval=30, clock=clock)
+    calls = []
+
+    async def failing_fetch():
+        calls.append(clock.now)
+        await asyncio.sleep(0.01)
+        raise OSError("connection refused")
+
+    monkeypatch.setattr(jwks, "_fetch", failing_fetch)
+
+    async def run():
+        return await asyncio.gather(*(jwks.get_key("test-key") for _ in range(20)), return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert all(isinstance(result, JWKSUnavailableError) for result in results)
+
+    clock.now += 31
+    with pytest.raises(JWKSUnavailableError):
+        asyncio.run(jwks.get_key("test-key"))
+    assert len(calls) == 2
+
+def test_jwks_cache_unknown_kid_does_not_refetch_within_interval(jwks_file, clock):
+    jwks = JWKSCache(path=str(jwks_file), min_refresh_interval=30, clock=clock)
+    fetches = []
+    original_fetch = jwks._fetch
+
+    async def counting_fetch():
+        fetches.append(clock.now)
+        return await original_fetch()
+
+    jwks._fetch = counting_fetch
+
+    assert asyncio.run(jwks.get_key("test-key")) is not None
+    assert asyncio.run(jwks.get_key("unknown-key")) is None
+    assert len(fetches) == 1
+
+    clock.now += 31
+    assert asyncio.run(jwks.get_key("unknown-key")) is None
+    assert len(fetches) == 2
+
+def test_validate_token_jwt_mode_skips_introspection(monkeypatch, verifier):
+    async def fail_introspect(token):
+        raise AssertionError("introspecção remota não deveria ser chamada")
+
+    monkeypatch.setattr(auth.settings, "AUTH_MODE", "jwt")
+    monkeypatch.setattr(auth, "jwt_verifier", verifier)
+    monkeypatch.setattr(auth, "_introspect", fail_introspect)
+
+    claims = asyncio.run(auth.validate_token(
+        HTTPAuthorizationCredentials(scheme="Bearer", credentials=make_token())
+    ))
+
+    assert claims["sub"] == "user"
+
+def test_validate_token_jwt_mode_rejects_invalid_token(monkeypatch, verifier):
+    monkeypatch.setattr(auth.settings, "AUTH_MODE", "jwt")
+    monkeypatch.setattr(auth, "jwt_verifier", verifier)
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(auth.validate_token(
+            HTTPAuthorizationCredentials(scheme="Bearer", credentials=make_token(aud="other"))
+        ))
+
+    assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+def test_validate_token_jwt_mode_falls_back_to_introspection(monkeypatch):
+    async def fake_introspect(token):
+        return {"sub": "remote"}
+
+    monkeypatch.setattr(auth.settings, "AUTH_MODE", "jwt")
+    monkeypatch.setattr(auth, "jwt_verifier", JWTVerifier(
+        JWKSCache(), issuer=ISSUER, audience=AUDIENCE, algorithms=["RS256"]
+    ))
+    monkeypatch.setattr(auth, "_introspect", fake_introspect)
+
+    claims = asyncio.run(auth.validate_token(
+        HTTPAuthorizationCredentials(scheme="Bearer", credentials=make_token())
+    ))
+
+    assert claims == {"sub": "remote"}
+
+def test_introspect_fails_fast_when_circuit_is_open(monkeypatch):
+    breaker = auth.CircuitBreaker(name="test_auth_open", failure_threshold=1, recovery_timeout=30)
+    breaker.record_failure()
+    monkeypatch.setattr(auth, "oauth_circuit_breaker", breaker)
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(auth._introspect("abc"))
+
+    assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert "Retry-After" in exc_info.value.headers
@@ -0,0 +1,124 @@
+import asyncio
+import pytest
+from prometheus_client import REGISTRY
+
+from professors.adapters.api.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ServiceDown(Exception):
+    pass
+
+
+async def failing():
+    raise ServiceDown()
+
+async def succeeding():
+    return "ok"
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(
+        name="test",
+        failure_threshold=2,
+        recovery_timeout=10,
+        is_failure=lambda exc: isinstance(exc, ServiceDown),
+        clock=clock,
+    )
+
+
+def trip(breaker):
+    for _ in range(breaker.failure_threshold):
+        with pytest.raises(ServiceDown):
+            asyncio.run(breaker.call(failing))
+
+
+def test_circuit_opens_after_failure_threshold(breaker):
+    trip(breaker)
+
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError) as exc_info:
+        asyncio.run(breaker.call(succeeding))
+    assert exc_info.value.retry_after == 10
+
+def test_success_resets_failure_count(breaker):
+    with pytest.raises(ServiceDown):
+        asyncio.run(breaker.call(failing))
+    asyncio.run(breaker.call(succeeding))
+    with pytest.raises(ServiceDown):
+        asyncio.run(breaker.call(failing))
+
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_non_failure_exceptions_do_not_open_circuit(breaker):
+    async def rejected():
+        raise ValueError("401")
+
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            asyncio.run(breaker.call(rejected))
+
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_half_open_probe_success_closes_circuit(breaker, clock):
+    trip(breaker)
+    clock.now += 10
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert asyncio.run(breaker.call(succeeding)) == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_half_open_probe_failure_reopens_circuit(breaker, clock):
+    trip(breaker)
+    clock.now += 10
+
+    with pytest.raises(ServiceDown):
+        asyncio.run(breaker.call(failing))
+
+    assert breaker.state == CircuitBreaker.OPEN
+
+def test_half_open_allows_limited_probes(breaker, clock):
+    trip(breaker)
+    clock.now += 10
+
+    async def run():
+        async def slow():
+            await asyncio.sleep(0.01)
+            return "ok"
+        return await asyncio.gather(breaker.call(slow), breaker.call(slow), return_exceptions=True)
+
+    first, second = asyncio.run(run())
+
+    assert first == "ok"
+    assert isinstance(second, CircuitOpenError)
+
+def test_call_timeout_counts_as_failure(clock):
+    breaker = CircuitBreaker(name="timeout-test", failure_threshold=1, call_timeout=0.01, clock=clock)
+
+    async def hanging():
+        await asyncio.sleep(1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(breaker.call(hanging))
+
+    assert breaker.state == CircuitBreaker.OPEN
+
+def test_circuit_state_is_exported(breaker):
+    trip(breaker)
+
+    assert REGISTRY.get_sample_value(
+        "professors_circuit_breaker_state", {"name": "test", "professors_circuit_breaker_state": "open"}
+    ) == 1
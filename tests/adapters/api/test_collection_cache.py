@@ -0,0 +1,126 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import status
+
+from professors.adapters.api.routes.graduations import graduation_listings
+from professors.adapters.api.routes.professors import professor_listings
+from professors.core.domain.pagination import Keyset, Page
+from professors.core.domain.table_version import TableVersion
+from professors.dependencies import graduation_directory, professor_directory
+
+fake_professor = {
+    "id": str(uuid.uuid4()),
+    "name": "Dr. Test",
+    "registration_number": 12345,
+    "institucional_email": "test@pucrs.br",
+    "status": "active",
+}
+updated_at = datetime(2024, 5, 1, 12, 30, 15, 500000, tzinfo=timezone.utc)
+
+
+def versions(professors=1, graduations=None):
+    result = {"professors": TableVersion(version=professors, updated_at=updated_at)}
+    if graduations is not None:
+        result["graduations"] = TableVersion(version=graduations, updated_at=updated_at)
+    return result
+
+
+@pytest.fixture(autouse=True)
+def empty_listing_caches():
+    caches = (professor_listings, graduation_listings, professor_directory, graduation_directory)
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
+def test_listing_body_is_reused_until_table_version_changes(client, mock_professor_service):
+    # Arrange
+    mock_professor_service.get_listing_versions.return_value = versions(professors=1)
+    mock_professor_service.get_all_professors.return_value = [fake_professor]
+
+    # Act
+    first = client.get("/api/v1/professors/")
+    second = client.get("/api/v1/professors/")
+    mock_professor_service.get_listing_versions.return_value = versions(professors=2)
+    third = client.get("/api/v1/professors/")
+
+    # Assert
+    assert first.status_code == second.status_code == third.status_code == status.HTTP_200_OK
+    assert first.content == second.content
+    assert first.headers["ETag"] == second.headers["ETag"] != third.headers["ETag"]
+    assert first.headers["Last-Modified"] == "Wed, 01 May 2024 12:30:15 GMT"
+    assert mock_professor_service.get_all_professors.call_count == 2
+
+def test_listing_if_none_match_returns_304_without_reading(client, mock_professor_service):
+    # Arrange
+    mock_professor_service.get_listing_versions.return_value = versions(professors=1)
+    mock_professor_service.search_professors.return_value = [fake_professor]
+    mock_professor_service.get_all_professors.return_value = [fake_professor]
+    etag = client.get("/api/v1/professors/?status=active").headers["ETag"]
+    mock_professor_service.search_professors.reset_mock()
+
+    # Act
+    response = client.get("/api/v1/professors/?status=active", headers={"If-None-Match": etag})
+    other_query = client.get("/api/v1/professors/", headers={"If-None-Match": etag})
+
+    # Assert
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    mock_professor_service.search_professors.assert_not_called()
+    assert other_query.status_code == status.HTTP_200_OK
+
+def test_listing_if_modified_since(client, mock_professor_service):
+    # Arrange
+    mock_professor_service.get_listing_versions.return_value = versions(professors=1)
+    mock_professor_service.get_all_professors.return_value = [fake_professor]
+
+    # Act
+    not_modified = client.get(
+        "/api/v1/professors/", headers={"If-Modified-Since": "Wed, 01 May 2024 12:30:15 GMT"}
+    )
+    modified = client.get(
+        "/api/v1/professors/", headers={"If-Modified-Since": "Wed, 01 May 2024 12:30:14 GMT"}
+    )
+
+    # Assert
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert modified.status_code == status.HTTP_200_OK
+
+def test_listing_versions_follow_graduation_filters_and_include(client, mock_professor_service):
+    # Arrange
+    mock_professor_service.get_listing_versions.return_value = versions(professors=1, graduations=1)
+    mock_professor_service.search_professors.return_value = [fake_professor]
+    mock_professor_service.include_graduations.return_value = [{**fake_professor, "graduations": []}]
+
+    # Act
+    client.get("/api/v1/professors/?degree=Doutorado")
+    client.get("/api/v1/professors/?include=graduations")
+
+    # Assert
+    calls = mock_professor_service.get_listing_versions.call_args_list
+    assert calls[0].args[0]["degree"] == "Doutorado"
+    assert calls[0].kwargs == {"include_graduations": False}
+    assert calls[1].kwargs == {"include_graduations": True}
+
+def test_cached_page_keeps_pagination_headers(client, mock_graduation_service):
+    # Arrange
+    mock_graduation_service.get_listing_versions.return_value = {
+        "graduations": TableVersion(version=3, updated_at=updated_at)
+    }
+    mock_graduation_service.get_graduations_page.return_value = Page(
+        items=[], next_keyset=Keyset(id=uuid.uuid4())
+    )
+
+    # Act
+    first = client.get("/api/v1/graduations/?limit=1")
+    second = client.get("/api/v1/graduations/?limit=1")
+
+    # Assert
+    assert second.status_code == status.HTTP_200_OK
+    assert second.headers["Link"] == first.headers["Link"]
+    assert second.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+    mock_graduation_service.get_graduations_page.assert_called_once()
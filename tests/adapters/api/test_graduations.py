@@ -1,6 +1,9 @@
 import uuid
+import pytest
+from unittest.mock import MagicMock
 from fastapi import status, HTTPException
-from professors.core.domain.graduation_models import Graduation, GraduationCreate
+from professors.core.domain.graduation_models import Graduation, GraduationCreate, GraduationUpdate
+from professors.core.domain.pagination import Keyset, Page
 
 # Mock de dados
 fake_professor_id = uuid.uuid4()
@@ -22,8 +25,6 @@ fake_graduation_response_model = Graduation(
 
 def test_create_graduation_success(client, mock_graduation_service, mock_professor_service):
     # Arrange
-    # A rota valida o professor primeiro (mock_professor_service)
-    mock_professor_service.get_professor_by_id.return_value = {"id": fake_professor_id} 
     # O serviço de graduação é chamado e retorna o modelo Pydantic
     mock_graduation_service.create_graduation.return_value = fake_graduation_response_model
 
@@ -41,11 +42,13 @@ def test_create_graduation_success(client, mock_graduation_service, mock_profess
         fake_professor_id,
         GraduationCreate(**fake_graduation_request) # O serviço espera um objeto GraduationCreate
     )
+    # A existência do professor é verificada pela própria consulta do repositório
+    mock_professor_service.get_professor_by_id.assert_not_called()
 
-def test_create_graduation_professor_not_found(client, mock_professor_service):
+def test_create_graduation_professor_not_found(client, mock_graduation_service):
     # Arrange
-    # Simula o 'get_professor' (dependência da rota) falhando
-    mock_professor_service.get_professor_by_id.side_effect = HTTPException(
+    # O serviço de graduação sinaliza que o professor não existe
+    mock_graduation_service.create_graduation.side_effect = HTTPException(
         status_code=status.HTTP_404_NOT_FOUND, detail="Professor not found."
     )
 
@@ -57,10 +60,10 @@ def test_create_graduation_professor_not_found(client, mock_professor_service):
 
     # Assert
     assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["detail"] == "Professor not found."
 
-def test_get_graduations_for_professor(client, mock_graduation_service, mock_professor_service):
+def test_get_graduations_for_professor(client, mock_graduation_service):
     # Arrange
-    mock_professor_service.get_professor_by_id.return_value = {"id": fake_professor_id}
     mock_graduation_service.get_all_graduations_for_professor.return_value = [fake_graduation_response_model]
 
     # Act
@@ -70,7 +73,7 @@ def test_get_graduations_for_professor(client, mock_graduation_service, mock_pro
     assert response.status_code == status.HTTP_200_OK
     assert len(response.json()) == 1
     assert response.json()[0]["degree"] == "Mestrado"
-    mock_graduation_service.get_all_graduations_for_professor.assert_called_with(fake_professor_id)
+    mock_graduation_service.get_all_graduations_for_professor.assert_called_with(fake_professor_id, fields=None)
 
 
 def test_get_all_graduations(client, mock_graduation_service):
@@ -86,9 +89,8 @@ def test_get_all_graduations(client, mock_graduation_service):
     assert response.json()[0]["id"] == str(fake_graduation_id)
 
 
-def test_update_graduation_success(client, mock_graduation_service, mock_professor_service):
+def test_update_graduation_success(client, mock_graduation_service):
     # Arrange
-    mock_professor_service.get_professor_by_id.return_value = {"id": fake_professor_id}
     # O mock de update deve retornar o objeto atualizado
     mock_graduation_service.update_graduation.return_value = fake_graduation_response_model
 
@@ -102,11 +104,49 @@ def test_update_graduation_success(client, mock_graduation_service, mock_profess
     # Assert
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["course"] == "Engenharia de Software"
-    mock_graduation_service.update_graduation.assert_called_once()
+    mock_graduation_service.update_graduation.assert_called_once_with(
+        fake_professor_id, fake_graduation_id, GraduationUpdate(**fake_graduation_request),
+        expected_version=None
+    )
 
-def test_delete_graduation_success(client, mock_graduation_service, mock_professor_service):
+def test_get_graduations_for_professor_if_none_match_returns_304(client, mock_graduation_service):
+    # Arrange
+    mock_graduation_service.get_all_graduations_for_professor.return_value = [fake_graduation_response_model]
+    first = client.get(f"/api/v1/professors/{fake_professor_id}/graduations/")
+    mock_graduation_service.get_graduation_versions.return_value = [(fake_graduation_id, 1)]
+    mock_graduation_service.get_all_graduations_for_professor.reset_mock()
+
+    # Act
+    response = client.get(
+        f"/api/v1/professors/{fake_professor_id}/graduations/",
+        headers={"If-None-Match": first.headers["ETag"]}
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == first.headers["ETag"]
+    mock_graduation_service.get_all_graduations_for_professor.assert_not_called()
+
+def test_update_graduation_if_match_passes_expected_version(client, mock_graduation_service):
+    # Arrange
+    mock_graduation_service.update_graduation.return_value = fake_graduation_response_model.model_copy(
+        update={"version": 2}
+    )
+
+    # Act
+    response = client.put(
+        f"/api/v1/professors/{fake_professor_id}/graduations/{fake_graduation_id}",
+        json=fake_graduation_request,
+        headers={"If-Match": '"v1"'}
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] == '"v2"'
+    assert mock_graduation_service.update_graduation.call_args.kwargs == {"expected_version": 1}
+
+def test_delete_graduation_success(client, mock_graduation_service):
     # Arrange
-    mock_professor_service.get_professor_by_id.return_value = {"id": fake_professor_id}
     mock_graduation_service.delete_graduation.return_value = None
 
     # Act
@@ -117,4 +157,101 @@ def test_delete_graduation_success(client, mock_graduation_service, mock_profess
 
     # Assert
     assert response.status_code == status.HTTP_204_NO_CONTENT
-    mock_graduation_service.delete_graduation.assert_called_with(fake_graduation_id)
\ No newline at end of file
+    mock_graduation_service.delete_graduation.assert_called_with(fake_professor_id, fake_graduation_id)
+
+def test_get_all_graduations_paginated(client, mock_graduation_service):
+    # Arrange
+    mock_graduation_service.get_graduations_page.return_value = Page(
+        items=[fake_graduation_response_model], next_keyset=Keyset(id=fake_graduation_id)
+    )
+
+    # Act
+    response = client.get("/api/v1/graduations/?limit=1")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 1
+    assert 'rel="next"' in response.headers["Link"]
+    mock_graduation_service.get_graduations_page.assert_called_with(1, None, fields=None)
+    mock_graduation_service.get_all_graduations.assert_not_called()
+
+
+def test_export_graduations_ndjson(client, mock_graduation_service):
+    # Arrange
+    async def chunks():
+        yield [fake_graduation_response_model.model_dump()]
+
+    mock_graduation_service.export_graduations = MagicMock(return_value=chunks())
+
+    # Act
+    response = client.get("/api/v1/graduations/export")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["id"] == str(fake_graduation_id)
+
+def test_get_graduations_for_professor_with_fields(client, mock_graduation_service):
+    # Arrange
+    mock_graduation_service.get_all_graduations_for_professor.return_value = [
+        {"id": fake_graduation_id, "degree": "Mestrado"}
+    ]
+
+    # Act
+    response = client.get(f"/api/v1/professors/{fake_professor_id}/graduations/?fields=degree")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [{"id": str(fake_graduation_id), "degree": "Mestrado"}]
+    mock_graduation_service.get_all_graduations_for_professor.assert_called_with(
+        fake_professor_id, fields=["degree"]
+    )
+
+@pytest.mark.parametrize("path", [f"/api/v1/professors/{fake_professor_id}/graduations/", "/api/v1/graduations/"])
+def test_graduation_fields_follow_response_schema(client, mock_graduation_service, path):
+    # Act
+    # professor_id existe no domínio, mas não no GraduationResponse
+    response = client.get(f"{path}?fields=degree,professor_id")
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "professor_id" in response.json()["detail"]
+    mock_graduation_service.get_all_graduations_for_professor.assert_not_called()
+    mock_graduation_service.get_all_graduations.assert_not_called()
+
+def test_get_graduations_by_professor_ids(client, mock_graduation_service):
+    # Arrange
+    other_professor_id = uuid.uuid4()
+    mock_graduation_service.get_graduations_for_professors.return_value = {
+        fake_professor_id: [fake_graduation_response_model],
+        other_professor_id: [],
+    }
+
+    # Act
+    response = client.get(f"/api/v1/graduations/?professor_ids={fake_professor_id},{other_professor_id}")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["X-Batch-Size"] == "2"
+    body = response.json()
+    assert [g["id"] for g in body[str(fake_professor_id)]] == [str(fake_graduation_id)]
+    assert body[str(other_professor_id)] == []
+    mock_graduation_service.get_graduations_for_professors.assert_called_once_with(
+        [fake_professor_id, other_professor_id]
+    )
+
+def test_get_graduations_by_professor_ids_rejects_invalid_uuid(client, mock_graduation_service):
+    # Act
+    response = client.get("/api/v1/graduations/?professor_ids=abc")
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    mock_graduation_service.get_graduations_for_professors.assert_not_called()
+
+@pytest.mark.parametrize("extra", ["fields=degree", "limit=5", "cursor=abc"])
+def test_get_graduations_by_professor_ids_rejects_page_and_projection(client, mock_graduation_service, extra):
+    # Act
+    response = client.get(f"/api/v1/graduations/?professor_ids={fake_professor_id}&{extra}")
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    mock_graduation_service.get_graduations_for_professors.assert_not_called()
@@ -0,0 +1,76 @@
+import asyncio
+import time
+import uuid
+from prometheus_client import REGISTRY
+
+from professors.main import app
+from professors.adapters.api.loop_watchdog import EventLoopWatchdog, NO_ROUTE
+
+
+def blocking_call():
+    time.sleep(0.3)
+
+
+def test_watchdog_records_stall_with_route_and_stack():
+    watchdog = EventLoopWatchdog(app, interval=0.02, threshold=0.1)
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": f"/api/v1/professors/{uuid.uuid4()}",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+    }
+    route = "GET /api/v1/professors/{id}"
+    before = REGISTRY.get_sample_value("professors_event_loop_stalls_total", {"route": route}) or 0
+
+    async def handler():
+        watchdog.track(asyncio.current_task(), scope)
+        try:
+            blocking_call()
+        finally:
+            watchdog.untrack(asyncio.current_task())
+
+    async def run():
+        watchdog.start()
+        await asyncio.sleep(0.05)
+        await asyncio.create_task(handler())
+        await asyncio.sleep(0.1)
+        await watchdog.stop()
+
+    asyncio.run(run())
+
+    assert len(watchdog.recent_stalls) == 1
+    stall = watchdog.recent_stalls[0]
+    assert stall.route == route
+    assert any("blocking_call" in line for line in stall.stack)
+    assert stall.duration is not None and stall.duration > 0.1
+    assert REGISTRY.get_sample_value("professors_event_loop_stalls_total", {"route": route}) == before + 1
+
+def test_watchdog_without_stalls_only_records_lag():
+    watchdog = EventLoopWatchdog(app, interval=0.01, threshold=0.2)
+
+    async def run():
+        watchdog.start()
+        await asyncio.sleep(0.1)
+        await watchdog.stop()
+
+    asyncio.run(run())
+
+    assert not watchdog.running
+    assert list(watchdog.recent_stalls) == []
+    assert REGISTRY.get_sample_value("professors_event_loop_lag_seconds_count") > 0
+
+def test_watchdog_stall_outside_request_has_no_route():
+    watchdog = EventLoopWatchdog(app, interval=0.02, threshold=0.1)
+
+    async def run():
+        watchdog.start()
+        await asyncio.sleep(0.05)
+        blocking_call()
+        await asyncio.sleep(0.1)
+        await watchdog.stop()
+
+    asyncio.run(run())
+
+    assert [stall.route for stall in watchdog.recent_stalls] == [NO_ROUTE]
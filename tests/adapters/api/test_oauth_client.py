@@ -0,0 +1,35 @@
+import asyncio
+from prometheus_client import generate_latest
+
+from professors.adapters.api import oauth_client
+from professors.config import get_settings
+
+
+def test_start_and_close_oauth_client():
+    async def run():
+        client = await oauth_client.start_oauth_client()
+        # O mesmo cliente é reaproveitado enquanto estiver aberto
+        assert oauth_client.get_oauth_client() is client
+        await oauth_client.close_oauth_client()
+        return client
+
+    client = asyncio.run(run())
+
+    assert client.is_closed
+    assert oauth_client._client is None
+
+def test_create_oauth_client_uses_settings():
+    settings = get_settings()
+
+    client = oauth_client.create_oauth_client(settings)
+
+    assert client.timeout.connect == settings.OAUTH_HTTP_CONNECT_TIMEOUT_SECONDS
+    assert client.timeout.pool == settings.OAUTH_HTTP_POOL_TIMEOUT_SECONDS
+    asyncio.run(client.aclose())
+
+def test_pool_metrics_are_exposed():
+    output = generate_latest().decode()
+
+    assert 'professors_oauth_http_pool_connections{state="idle"}' in output
+    assert "professors_oauth_http_pool_queued_requests" in output
+    assert "professors_oauth_http_requests_in_flight" in output
@@ -1,6 +1,14 @@
 # tests/adapters/api/test_professors.py
+import json
 import uuid
+from unittest.mock import MagicMock
 from fastapi import status, HTTPException
+from professors.config import settings
+from professors.core.domain.pagination import Keyset, Page
+from professors.core.domain.graduation_models import Graduation
+from professors.core.domain.professor_models import Professor, ProfessorCreate, ProfessorWithGraduations
+from professors.adapters.api.pagination import decode_cursor, encode_cursor
+from professors.adapters.cache.stale import mark_stale
 
 # Mock de dados (completo)
 fake_professor_id = str(uuid.uuid4())
@@ -15,6 +23,12 @@ fake_professor_response = {
     **fake_professor_create_request
 }
 
+# Filtros do GET / quando nenhum é informado
+no_filters = {
+    "name": None, "status": None,
+    "degree": None, "course": None, "institution_name": None, "year_min": None, "year_max": None,
+}
+
 # --- Test Cases ---
 
 def test_create_professor_success(client, mock_professor_service):
@@ -75,7 +89,7 @@ def test_search_professors_with_params(client, mock_professor_service):
     # Assert
     assert response.status_code == status.HTTP_200_OK
     assert len(response.json()) == 1
-    mock_professor_service.search_professors.assert_called_with({"name": "Test", "status": "active"})
+    mock_professor_service.search_professors.assert_called_with({**no_filters, "name": "Test", "status": "active"}, fields=None)
     mock_professor_service.get_all_professors.assert_not_called()
 
 def test_get_professor_success(client, mock_professor_service):
@@ -129,4 +143,389 @@ def test_delete_professor_success(client, mock_professor_service):
     
     # Assert
     assert response.status_code == status.HTTP_204_NO_CONTENT
-    mock_professor_service.delete_professor.assert_called_with(uuid.UUID(prof_id))
\ No newline at end of file
+    mock_professor_service.delete_professor.assert_called_with(uuid.UUID(prof_id))
+
+def test_search_professors_paginated_sets_next_link(client, mock_professor_service):
+    # Arrange
+    next_id = uuid.uuid4()
+    mock_professor_service.get_professors_page.return_value = Page(
+        items=[fake_professor_response], next_keyset=Keyset(id=next_id)
+    )
+    
+    # Act
+    response = client.get("/api/v1/professors/?status=active&limit=1")
+    
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 1
+    mock_professor_service.get_professors_page.assert_called_with(
+        {**no_filters, "status": "active"}, 1, None, fields=None
+    )
+    cursor = response.headers["X-Next-Cursor"]
+    assert decode_cursor(cursor) == Keyset(id=next_id)
+    assert f"cursor={cursor}" in response.headers["Link"]
+    assert 'rel="next"' in response.headers["Link"]
+
+def test_search_professors_follows_cursor(client, mock_professor_service):
+    # Arrange
+    after = Keyset(id=uuid.uuid4())
+    mock_professor_service.get_professors_page.return_value = Page(items=[fake_professor_response])
+    
+    # Act
+    response = client.get(f"/api/v1/professors/?limit=10&cursor={encode_cursor(after)}")
+    
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert "Link" not in response.headers
+    mock_professor_service.get_professors_page.assert_called_with(
+        no_filters, 10, after, fields=None
+    )
+
+def test_search_professors_invalid_cursor(client, mock_professor_service):
+    # Act
+    response = client.get("/api/v1/professors/?cursor=not-a-cursor")
+    
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    mock_professor_service.get_professors_page.assert_not_called()
+
+async def fake_export_chunks(*chunks):
+    for rows in chunks:
+        yield rows
+
+def test_export_professors_ndjson(client, mock_professor_service):
+    # Arrange
+    row = {"id": uuid.UUID(fake_professor_id), **fake_professor_create_request}
+    mock_professor_service.export_professors = MagicMock(
+        return_value=fake_export_chunks([row], [row])
+    )
+    
+    # Act
+    response = client.get("/api/v1/professors/export")
+    
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0]) == fake_professor_response
+
+def test_export_professors_csv(client, mock_professor_service):
+    # Arrange
+    row = {"id": uuid.UUID(fake_professor_id), **fake_professor_create_request}
+    mock_professor_service.export_professors = MagicMock(return_value=fake_export_chunks([row]))
+    
+    # Act
+    response = client.get("/api/v1/professors/export?format=csv")
+    
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.text.splitlines() == [
+        "id,name,registration_number,institucional_email,status",
+        f"{fake_professor_id},Dr. Test,12345,test@pucrs.br,active",
+    ]
+
+def test_create_professors_batch_reports_each_item(client, mock_professor_service):
+    # Arrange
+    other_request = {**fake_professor_create_request, "registration_number": 2, "institucional_email": "b@pucrs.br"}
+    mock_professor_service.create_professors.return_value = [
+        Professor(id=uuid.UUID(fake_professor_id), **fake_professor_create_request),
+        None,
+    ]
+    payload = [fake_professor_create_request, {"name": "Sem matrícula"}, other_request]
+    
+    # Act
+    response = client.post("/api/v1/professors/batch", json=payload)
+    
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert (body["created"], body["conflicts"], body["invalid"]) == (1, 1, 1)
+    assert [r["status"] for r in body["results"]] == ["created", "invalid", "conflict"]
+    assert body["results"][0]["professor"]["id"] == fake_professor_id
+    assert body["results"][1]["errors"]
+    mock_professor_service.create_professors.assert_called_once_with(
+        [ProfessorCreate(**fake_professor_create_request), ProfessorCreate(**other_request)]
+    )
+
+def test_create_professors_batch_too_large(client, mock_professor_service, monkeypatch):
+    # Arrange
+    monkeypatch.setattr(settings, "PROFESSOR_BATCH_MAX_SIZE", 1)
+    
+    # Act
+    response = client.post("/api/v1/professors/batch", json=[fake_professor_create_request] * 2)
+    
+    # Assert
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    mock_professor_service.create_professors.assert_not_called()
+
+def test_delete_professors_bulk_by_status(client, mock_professor_service):
+    # Arrange
+    mock_professor_service.delete_professors.return_value = 3
+    
+    # Act
+    response = client.post("/api/v1/professors/bulk/delete", json={"status": "inactive"})
+    
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"affected": 3}
+    mock_professor_service.delete_professors.assert_called_once_with(ids=None, status_filter="inactive")
+
+def test_deactivate_professors_bulk_by_ids(client, mock_professor_service):
+    # Arrange
+    mock_professor_service.deactivate_professors.return_value = 1
+    
+    # Act
+    response = client.post("/api/v1/professors/bulk/deactivate", json={"ids": [fake_professor_id]})
+    
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"affected": 1}
+    mock_professor_service.deactivate_professors.assert_called_once_with(
+        ids=[uuid.UUID(fake_professor_id)], status_filter=None
+    )
+
+def test_get_professor_include_graduations(client, mock_professor_service):
+    # Arrange
+    professor = Professor(id=uuid.UUID(fake_professor_id), **fake_professor_create_request)
+    graduation = Graduation(
+        id=uuid.uuid4(), professor_id=professor.id,
+        degree="Mestrado", course="Computação", institution_name="PUCRS", year=2020
+    )
+    mock_professor_service.get_professor_by_id.return_value = professor
+    mock_professor_service.include_graduations.return_value = [
+        ProfessorWithGraduations(**professor.model_dump(), graduations=[graduation])
+    ]
+    
+    # Act
+    response = client.get(f"/api/v1/professors/{fake_professor_id}?include=graduations")
+    
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["id"] == fake_professor_id
+    assert body["graduations"] == [{
+        "id": str(graduation.id), "degree": "Mestrado", "course": "Computação",
+        "institution_name": "PUCRS", "year": 2020, "version": 1,
+    }]
+    mock_professor_service.include_graduations.assert_called_once_with([professor])
+
+def test_search_professors_include_graduations_uses_one_batch(client, mock_professor_service):
+    # Arrange
+    professors = [
+        Professor(id=uuid.uuid4(), **{**fake_professor_create_request, "registration_number": i})
+        for i in range(3)
+    ]
+    mock_professor_service.get_all_professors.return_value = professors
+    mock_professor_service.include_graduations.return_value = [
+        ProfessorWithGraduations(**p.model_dump()) for p in professors
+    ]
+    
+    # Act
+    response = client.get("/api/v1/professors/?include=graduations")
+    
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert [p["graduations"] for p in response.json()] == [[], [], []]
+    mock_professor_service.include_graduations.assert_called_once_with(professors)
+
+def test_search_professors_rejects_unknown_include(client, mock_professor_service):
+    # Act
+    response = client.get("/api/v1/professors/?include=classes")
+    
+    # Assert
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_search_professors_with_fields_returns_projection(client, mock_professor_service):
+    # Arrange
+    mock_professor_service.get_all_professors.return_value = [{"id": uuid.UUID(fake_professor_id), "name": "Dr. Test"}]
+    
+    # Act
+    response = client.get("/api/v1/professors/?fields=id, name")
+    
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [{"id": fake_professor_id, "name": "Dr. Test"}]
+    mock_professor_service.get_all_professors.assert_called_once_with(fields=["id", "name"])
+
+def test_lookup_professors_reports_batch(client, mock_professor_service):
+    # Arrange
+    missing_id = str(uuid.uuid4())
+    mock_professor_service.lookup_professors.return_value = [
+        Professor(id=uuid.UUID(fake_professor_id), **fake_professor_create_request)
+    ]
+    
+    # Act
+    response = client.post(
+        "/api/v1/professors/lookup", json={"ids": [fake_professor_id, missing_id, fake_professor_id]}
+    )
+    
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["X-Batch-Size"] == "2"
+    body = response.json()
+    assert (body["requested"], body["found"], body["missing"]) == (2, 1, [missing_id])
+    assert body["professors"] == [{**fake_professor_response, "version": 1}]
+    mock_professor_service.lookup_professors.assert_called_once_with(
+        [uuid.UUID(fake_professor_id), uuid.UUID(missing_id)], fields=None
+    )
+
+def test_lookup_professors_caps_batch_size(client, mock_professor_service, monkeypatch):
+    # Arrange
+    monkeypatch.setattr(settings, "LOOKUP_MAX_IDS", 1)
+    
+    # Act
+    response = client.post("/api/v1/professors/lookup", json={"ids": [str(uuid.uuid4()), str(uuid.uuid4())]})
+    
+    # Assert
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    mock_professor_service.lookup_professors.assert_not_called()
+
+def test_search_professors_by_name(client, mock_professor_service):
+    # Arrange
+    mock_professor_service.search_professors_by_name.return_value = [fake_professor_response]
+    
+    # Act
+    response = client.get("/api/v1/professors/search?q=tst&limit=5&accent_insensitive=true")
+    
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [fake_professor_response]
+    mock_professor_service.search_professors_by_name.assert_called_once_with(
+        "tst", 5, accent_insensitive=True, fields=None
+    )
+
+def test_search_professors_by_name_limit_is_capped(client, mock_professor_service):
+    # Act
+    response = client.get(f"/api/v1/professors/search?q=tst&limit={settings.PROFESSOR_SEARCH_MAX_LIMIT + 1}")
+    
+    # Assert
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    mock_professor_service.search_professors_by_name.assert_not_called()
+
+def test_autocomplete_professors(client, mock_professor_service):
+    # Arrange
+    suggestion = {"id": fake_professor_id, "name": "Dr. Test"}
+    mock_professor_service.autocomplete_professors = MagicMock(return_value=[suggestion])
+    
+    # Act
+    response = client.get("/api/v1/professors/autocomplete?q=dr&limit=3")
+    
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [suggestion]
+    mock_professor_service.autocomplete_professors.assert_called_once_with("dr", 3)
+
+def test_search_professors_by_graduation_filters(client, mock_professor_service):
+    # Arrange
+    mock_professor_service.get_professors_page.return_value = Page(items=[fake_professor_response])
+    
+    # Act
+    response = client.get(
+        "/api/v1/professors/?degree=Doutorado&institution_name=USP&year_min=2016&limit=20"
+    )
+    
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    mock_professor_service.get_professors_page.assert_called_with(
+        {**no_filters, "degree": "Doutorado", "institution_name": "USP", "year_min": 2016},
+        20, None, fields=None
+    )
+
+def test_search_professors_by_graduation_filters_without_pagination(client, mock_professor_service):
+    # Arrange
+    mock_professor_service.search_professors.return_value = [fake_professor_response]
+    
+    # Act
+    response = client.get("/api/v1/professors/?course=Computação&year_max=2010")
+    
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    mock_professor_service.get_all_professors.assert_not_called()
+    mock_professor_service.search_professors.assert_called_with(
+        {**no_filters, "course": "Computação", "year_max": 2010}, fields=None
+    )
+
+def test_stale_cache_response_has_warning_header(client, mock_professor_service):
+    # Arrange
+    async def stale_read(*args, **kwargs):
+        mark_stale(f"professor:{fake_professor_id}")
+        return fake_professor_response
+    mock_professor_service.get_professor_by_id.side_effect = stale_read
+    
+    # Act
+    stale_response = client.get(f"/api/v1/professors/{fake_professor_id}")
+    mock_professor_service.get_professor_by_id.side_effect = None
+    mock_professor_service.get_professor_by_id.return_value = fake_professor_response
+    fresh_response = client.get(f"/api/v1/professors/{fake_professor_id}")
+    
+    # Assert
+    assert stale_response.headers["Warning"] == '110 - "Response is Stale"'
+    assert "Warning" not in fresh_response.headers
+
+def test_get_professor_returns_version_etag(client, mock_professor_service):
+    # Arrange
+    mock_professor_service.get_professor_by_id.return_value = {**fake_professor_response, "version": 3}
+    
+    # Act
+    response = client.get(f"/api/v1/professors/{fake_professor_id}")
+    
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] == '"v3"'
+    mock_professor_service.get_professor_version.assert_not_called()
+
+def test_get_professor_if_none_match_returns_304_without_loading(client, mock_professor_service):
+    # Arrange
+    mock_professor_service.get_professor_version.return_value = 3
+    
+    # Act
+    response = client.get(f"/api/v1/professors/{fake_professor_id}", headers={"If-None-Match": '"v3"'})
+    
+    # Assert
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == '"v3"'
+    assert response.content == b""
+    mock_professor_service.get_professor_by_id.assert_not_called()
+
+def test_get_professor_if_none_match_outdated_returns_body(client, mock_professor_service):
+    # Arrange
+    mock_professor_service.get_professor_version.return_value = 4
+    mock_professor_service.get_professor_by_id.return_value = {**fake_professor_response, "version": 4}
+    
+    # Act
+    response = client.get(f"/api/v1/professors/{fake_professor_id}", headers={"If-None-Match": '"v3"'})
+    
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] == '"v4"'
+
+def test_update_professor_if_match_passes_expected_version(client, mock_professor_service):
+    # Arrange
+    mock_professor_service.update_professor.return_value = {**fake_professor_response, "version": 4}
+    
+    # Act
+    response = client.put(
+        f"/api/v1/professors/{fake_professor_id}",
+        json=fake_professor_create_request,
+        headers={"If-Match": '"v3"'},
+    )
+    
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] == '"v4"'
+    assert mock_professor_service.update_professor.call_args.kwargs == {"expected_version": 3}
+
+def test_update_professor_if_match_with_foreign_etag_returns_412(client, mock_professor_service):
+    # Act
+    response = client.put(
+        f"/api/v1/professors/{fake_professor_id}",
+        json=fake_professor_create_request,
+        headers={"If-Match": 'W/"v3"'},
+    )
+    
+    # Assert
+    assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+    mock_professor_service.update_professor.assert_not_called()
@@ -0,0 +1,36 @@
+import json
+import uuid
+
+from professors.adapters.api.responses import ORJSONModelResponse
+from professors.adapters.api.schemas.professor_schemas import BatchItemStatus, ProfessorBatchItemResult
+from professors.core.domain.graduation_models import Graduation
+from professors.core.domain.professor_models import Professor
+
+
+def test_renders_constructed_domain_models():
+    professor = Professor.model_construct(
+        id=uuid.uuid4(), name="Dr. Test", registration_number=1,
+        institucional_email="test@pucrs.br", status="active",
+    )
+
+    body = json.loads(ORJSONModelResponse([professor]).body)
+
+    assert body == [{**professor.model_dump(), "id": str(professor.id)}]
+
+def test_projects_graduation_to_response_schema():
+    graduation = Graduation.model_construct(
+        id=uuid.uuid4(), professor_id=uuid.uuid4(), degree="Mestrado",
+        course="Engenharia de Software", institution_name="PUCRS", year=2025,
+    )
+
+    body = json.loads(ORJSONModelResponse(graduation).body)
+
+    assert "professor_id" not in body
+    assert body["id"] == str(graduation.id)
+
+def test_renders_nested_models_and_enums():
+    result = ProfessorBatchItemResult(index=0, status=BatchItemStatus.conflict)
+
+    body = json.loads(ORJSONModelResponse(result).body)
+
+    assert body == {"index": 0, "status": "conflict", "professor": None, "errors": None}
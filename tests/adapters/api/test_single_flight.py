@@ -0,0 +1,132 @@
+import asyncio
+from contextlib import asynccontextmanager
+from prometheus_client import REGISTRY
+
+from professors.adapters.api.single_flight import SingleFlight, coalesced_json_response
+from professors.adapters.cache.stale import mark_stale, start_tracking
+
+
+@asynccontextmanager
+async def open_service():
+    yield "service"
+
+
+def coalesced_count(name):
+    return REGISTRY.get_sample_value("professors_single_flight_coalesced_total", {"name": name}) or 0
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight("test_share")
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"id": 1}
+
+    async def run():
+        return await asyncio.gather(*(flight.run("k", load) for _ in range(5)))
+
+    assert asyncio.run(run()) == [{"id": 1}] * 5
+    assert calls == [1]
+    assert len(flight) == 0
+    assert flight.hot_keys() == [("k", 4)]
+    assert coalesced_count("test_share") == 4
+    assert REGISTRY.get_sample_value(
+        "professors_single_flight_hot_key_coalesced", {"name": "test_share", "key": "k"}
+    ) == 4
+
+def test_calls_after_completion_run_again():
+    flight = SingleFlight("test_sequential")
+    calls = []
+
+    async def load():
+        calls.append(1)
+        return len(calls)
+
+    async def run():
+        return [await flight.run("k", load), await flight.run("k", load)]
+
+    assert asyncio.run(run()) == [1, 2]
+
+def test_exception_is_shared_by_all_waiters():
+    flight = SingleFlight("test_error")
+
+    async def load():
+        await asyncio.sleep(0.01)
+        raise LookupError("missing")
+
+    async def run():
+        return await asyncio.gather(*(flight.run("k", load) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, LookupError) for result in results)
+
+def test_cancelled_leader_does_not_cancel_followers():
+    flight = SingleFlight("test_cancel")
+
+    async def load():
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    async def run():
+        leader = asyncio.ensure_future(flight.run("k", load))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.run("k", load))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(run()) == "ok"
+
+def test_coalesced_response_shares_body_and_stale_marks():
+    flight = SingleFlight("test_response")
+
+    async def load(service):
+        await asyncio.sleep(0.01)
+        mark_stale("professor:1")
+        return {"name": "Dr. Test"}, '"v1"'
+
+    async def request():
+        stale_keys = start_tracking()
+        response = await coalesced_json_response(flight, "k", load, open_service)
+        return response, stale_keys
+
+    async def run():
+        return await asyncio.gather(*(asyncio.create_task(request()) for _ in range(3)))
+
+    results = asyncio.run(run())
+    assert {response.body for response, _ in results} == {b'{"name":"Dr. Test"}'}
+    assert {response.headers["ETag"] for response, _ in results} == {'"v1"'}
+    assert all(stale_keys == ["professor:1"] for _, stale_keys in results)
+
+def test_coalesced_response_uses_its_own_session_when_leader_is_cancelled():
+    flight = SingleFlight("test_response_cancel")
+    sessions = []
+
+    @asynccontextmanager
+    async def open_session_service():
+        # Sessão da leitura compartilhada: fechada só quando ela termina
+        session = {"closed": False}
+        sessions.append(session)
+        try:
+            yield session
+        finally:
+            session["closed"] = True
+
+    async def load(service):
+        await asyncio.sleep(0.02)
+        assert not service["closed"]
+        return {"name": "Dr. Test"}, None
+
+    async def run():
+        leader = asyncio.ensure_future(coalesced_json_response(flight, "k", load, open_session_service))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(coalesced_json_response(flight, "k", load, open_session_service))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(run()).body == b'{"name":"Dr. Test"}'
+    assert len(sessions) == 1
+    assert sessions[0]["closed"]
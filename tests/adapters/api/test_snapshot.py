@@ -0,0 +1,102 @@
+import asyncio
+import gzip
+
+import pytest
+from fastapi import status
+from starlette.requests import Request
+
+from professors.adapters.api.snapshot import DirectorySnapshot, _accepts_gzip
+from professors.core.domain.pagination import Page
+from professors.core.domain.table_version import TableVersion
+from professors.dependencies import professor_directory
+
+
+def make_request(accept_encoding=None):
+    headers = [(b"accept-encoding", accept_encoding.encode())] if accept_encoding else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class FakeDirectory:
+    def __init__(self):
+        self.version = 1
+        self.items = [{"name": "Dr. Test"}]
+        self.loads = 0
+
+    async def __call__(self):
+        self.loads += 1
+        return TableVersion(version=self.version), list(self.items)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_served_only_at_current_table_version():
+    directory = FakeDirectory()
+    snapshot = DirectorySnapshot("test", "professors", directory, debounce_seconds=0.01)
+    await snapshot.refresh()
+
+    current = snapshot.get({"professors": TableVersion(version=1)})
+    assert current.body == b'[{"name":"Dr. Test"}]'
+    assert gzip.decompress(current.gzip_body) == current.body
+
+    directory.version, directory.items = 2, [{"name": "Dr. New"}]
+    assert snapshot.get({"professors": TableVersion(version=2)}) is None
+    await snapshot.close()
+
+@pytest.mark.asyncio
+async def test_refresh_is_debounced_across_a_burst_of_changes():
+    directory = FakeDirectory()
+    snapshot = DirectorySnapshot("test", "professors", directory, debounce_seconds=0.05)
+    await snapshot.refresh()
+
+    for version in (2, 3, 4):
+        directory.version = version
+        assert snapshot.get({"professors": TableVersion(version=version)}) is None
+    await asyncio.sleep(0.1)
+
+    assert directory.loads == 2
+    assert snapshot.get({"professors": TableVersion(version=4)}) is not None
+    await snapshot.close()
+
+@pytest.mark.asyncio
+async def test_gzip_response_uses_weak_etag():
+    directory = FakeDirectory()
+    snapshot = DirectorySnapshot("test", "professors", directory)
+    await snapshot.refresh()
+    current = snapshot.get({"professors": TableVersion(version=1)})
+
+    compressed = current.response(make_request("br, gzip"), {"ETag": '"c1"'})
+    plain = current.response(make_request("gzip;q=0"), {"ETag": '"c1"'})
+
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert compressed.headers["ETag"] == 'W/"c1"'
+    assert compressed.body == current.gzip_body
+    assert "Content-Encoding" not in plain.headers
+    assert plain.headers["ETag"] == '"c1"'
+    assert plain.body == current.body
+
+def test_accepts_gzip():
+    assert _accepts_gzip("gzip, deflate")
+    assert _accepts_gzip("*")
+    assert not _accepts_gzip("br")
+    assert not _accepts_gzip("gzip; q=0")
+
+@pytest.fixture
+def loaded_professor_directory(monkeypatch):
+    monkeypatch.setattr(professor_directory, "_load", FakeDirectory())
+    yield professor_directory
+    professor_directory.clear()
+
+@pytest.mark.asyncio
+async def test_full_listing_is_served_from_snapshot(client, mock_professor_service, loaded_professor_directory):
+    await loaded_professor_directory.refresh()
+    mock_professor_service.get_listing_versions.return_value = {"professors": TableVersion(version=1)}
+    mock_professor_service.get_professors_page.return_value = Page(items=[])
+
+    response = client.get("/api/v1/professors/")
+    filtered = client.get("/api/v1/professors/?limit=1")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.json() == [{"name": "Dr. Test"}]
+    mock_professor_service.get_all_professors.assert_not_called()
+    assert filtered.status_code == status.HTTP_200_OK
+    mock_professor_service.get_professors_page.assert_called_once()
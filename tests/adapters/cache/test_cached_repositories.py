@@ -0,0 +1,270 @@
+import uuid
+import pytest
+from unittest.mock import AsyncMock
+from sqlalchemy.exc import DBAPIError, OperationalError, ProgrammingError
+
+from professors.adapters.cache.cached_repositories import (
+    CacheTTL, CachedGraduationRepository, CachedProfessorRepository, graduations_key, professor_key
+)
+from professors.adapters.cache.memory_cache import InMemoryCache
+from professors.adapters.cache.redis_cache import RedisCache
+from professors.adapters.cache.stale import start_tracking
+from professors.core.domain.errors import ProfessorNotFoundError
+from professors.core.domain.graduation_models import Graduation
+from professors.core.domain.professor_models import Professor
+from professors.core.ports.cache_port import NOT_FOUND
+
+pytestmark = pytest.mark.asyncio
+
+fake_professor_id = uuid.uuid4()
+fake_professor = Professor(
+    id=fake_professor_id, name="Test User", registration_number=123,
+    institucional_email="test@pucrs.br", status="active"
+)
+fake_graduation = Graduation(
+    id=uuid.uuid4(), professor_id=fake_professor_id,
+    degree="Mestrado", course="Computação", institution_name="PUCRS", year=2020
+)
+db_down = OperationalError("SELECT 1", {}, ConnectionRefusedError("connection refused"))
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRedis:
+    """Substituto local do cliente redis.asyncio (expiração pelo `ex`, no relógio falso)."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.data = {}
+
+    async def get(self, key):
+        expires_at, value = self.data.get(key, (None, None))
+        if expires_at is not None and expires_at <= self.clock():
+            del self.data[key]
+            return None
+        return value
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = (self.clock() + ex, value)
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def aclose(self):
+        pass
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request, clock):
+    if request.param == "memory":
+        return InMemoryCache(max_size=100, stale_ttl=60, clock=clock)
+    return RedisCache(client=FakeRedis(clock), stale_ttl=60, clock=clock)
+
+
+@pytest.fixture
+def mock_repo():
+    return AsyncMock()
+
+
+@pytest.fixture
+def repository(mock_repo, cache):
+    return CachedProfessorRepository(mock_repo, cache, CacheTTL(ttl=30, negative_ttl=5))
+
+
+@pytest.fixture
+def graduation_repository(cache):
+    return CachedGraduationRepository(AsyncMock(), cache, CacheTTL(ttl=30, negative_ttl=5))
+
+
+async def test_memory_cache_evicts_least_recently_used(clock):
+    cache = InMemoryCache(max_size=2, clock=clock)
+    await cache.set("a", 1, ttl=10)
+    await cache.set("b", 2, ttl=10)
+    await cache.get("a")
+    await cache.set("c", 3, ttl=10)
+
+    assert await cache.get("b") is None
+    assert (await cache.get("a")).value == 1
+    assert len(cache) == 2
+
+async def test_cache_keeps_expired_entries_only_as_stale(cache, clock):
+    await cache.set("k", "v", ttl=10)
+    clock.now += 11
+
+    assert await cache.get("k") is None
+    stale = await cache.get("k", allow_stale=True)
+    assert stale.value == "v" and stale.stale
+
+async def test_redis_cache_stores_json_and_ignores_invalid_entries(clock):
+    client = FakeRedis(clock)
+    cache = RedisCache(client=client, clock=clock)
+    await cache.set("professor", fake_professor, ttl=10)
+    await cache.set("graduations", [fake_graduation], ttl=10)
+    await cache.set("missing", NOT_FOUND, ttl=10)
+
+    assert (await cache.get("professor")).value == fake_professor
+    assert (await cache.get("graduations")).value == [fake_graduation]
+    assert (await cache.get("missing")).value is NOT_FOUND
+    assert b"Test User" in client.data["professors:professor"][1]
+
+    client.data["professors:professor"] = (clock.now + 10, b"\x80\x04not json")
+    client.data["professors:graduations"] = (clock.now + 10, b'{"kind": "graduations", "value": [{}]}')
+    assert await cache.get("professor") is None
+    assert await cache.get("graduations") is None
+
+async def test_get_by_id_is_served_from_cache(repository, mock_repo):
+    mock_repo.get_by_id.return_value = fake_professor
+
+    assert await repository.get_by_id(fake_professor_id) == fake_professor
+    assert await repository.get_by_id(fake_professor_id, fields=["id", "name"]) == {
+        "id": fake_professor_id, "name": "Test User"
+    }
+    mock_repo.get_by_id.assert_called_once_with(fake_professor_id)
+
+async def test_get_version_reads_database_and_drops_outdated_entry(repository, mock_repo, cache):
+    mock_repo.get_by_id.return_value = fake_professor
+    await repository.get_by_id(fake_professor_id)
+
+    # Mesma versão: a entrada continua valendo
+    mock_repo.get_version.return_value = fake_professor.version
+    assert await repository.get_version(fake_professor_id) == fake_professor.version
+    assert await cache.get(professor_key(fake_professor_id)) is not None
+
+    # Alterado em outra instância: a versão vem do banco e a entrada é descartada
+    mock_repo.get_version.return_value = fake_professor.version + 1
+    assert await repository.get_version(fake_professor_id) == fake_professor.version + 1
+    assert await cache.get(professor_key(fake_professor_id)) is None
+    assert mock_repo.get_version.call_count == 2
+
+async def test_get_by_id_caches_not_found_with_negative_ttl(repository, mock_repo, clock):
+    mock_repo.get_by_id.return_value = None
+
+    assert await repository.get_by_id(fake_professor_id) is None
+    assert await repository.get_by_id(fake_professor_id) is None
+    assert mock_repo.get_by_id.call_count == 1
+
+    clock.now += 6
+    await repository.get_by_id(fake_professor_id)
+    assert mock_repo.get_by_id.call_count == 2
+
+async def test_writes_invalidate_professor_and_graduations(repository, mock_repo, cache):
+    mock_repo.get_by_id.return_value = fake_professor
+    await repository.get_by_id(fake_professor_id)
+    await cache.set(graduations_key(fake_professor_id), [fake_graduation], ttl=30)
+
+    mock_repo.update.return_value = fake_professor
+    await repository.update(fake_professor_id, {"name": "Renamed"})
+    assert await cache.get(professor_key(fake_professor_id)) is None
+    assert await cache.get(graduations_key(fake_professor_id)) is not None
+
+    mock_repo.delete_many.return_value = [fake_professor_id]
+    await repository.delete_many(status="active")
+    assert await cache.get(graduations_key(fake_professor_id)) is None
+
+async def test_registration_lookup_follows_id_entry(repository, mock_repo):
+    mock_repo.get_by_registration_number.return_value = fake_professor
+
+    assert await repository.get_by_registration_number(123) == fake_professor
+    assert await repository.get_by_registration_number(123) == fake_professor
+    mock_repo.get_by_registration_number.assert_called_once_with(123)
+
+    # Matrícula alterada: a entrada antiga da matrícula não vale mais
+    renumbered = fake_professor.model_copy(update={"registration_number": 456})
+    mock_repo.update.return_value = renumbered
+    mock_repo.get_by_id.return_value = renumbered
+    mock_repo.get_by_registration_number.return_value = None
+    await repository.update(fake_professor_id, {"registration_number": 456})
+
+    assert await repository.get_by_registration_number(123) is None
+
+async def test_serves_stale_entry_when_database_is_down(repository, mock_repo, clock):
+    stale_keys = start_tracking()
+    mock_repo.get_by_id.return_value = fake_professor
+    await repository.get_by_id(fake_professor_id)
+    clock.now += 31
+    mock_repo.get_by_id.side_effect = db_down
+
+    assert await repository.get_by_id(fake_professor_id) == fake_professor
+    assert stale_keys == [professor_key(fake_professor_id)]
+
+    clock.now += 60
+    with pytest.raises(OperationalError):
+        await repository.get_by_id(fake_professor_id)
+
+@pytest.mark.parametrize("error, serves_stale", [
+    (DBAPIError("SELECT 1", {}, Exception("terminating connection"), connection_invalidated=True), True),
+    (ProgrammingError("SELECT 1", {}, Exception("column does not exist")), False),
+])
+async def test_stale_entries_only_cover_connection_failures(repository, mock_repo, clock, error, serves_stale):
+    mock_repo.get_by_id.return_value = fake_professor
+    await repository.get_by_id(fake_professor_id)
+    clock.now += 31
+    mock_repo.get_by_id.side_effect = error
+
+    if serves_stale:
+        assert await repository.get_by_id(fake_professor_id) == fake_professor
+    else:
+        with pytest.raises(ProgrammingError):
+            await repository.get_by_id(fake_professor_id)
+
+async def test_graduations_cached_including_missing_professor(graduation_repository):
+    inner = graduation_repository.repository
+    inner.get_all_for_professor.return_value = [fake_graduation]
+
+    assert await graduation_repository.get_all_for_professor(fake_professor_id) == [fake_graduation]
+    assert await graduation_repository.get_all_for_professor(fake_professor_id, fields=["id"]) == [
+        {"id": fake_graduation.id}
+    ]
+    inner.get_all_for_professor.assert_called_once_with(fake_professor_id)
+
+    missing_id = uuid.uuid4()
+    inner.get_all_for_professor.side_effect = ProfessorNotFoundError(missing_id)
+    for _ in range(2):
+        with pytest.raises(ProfessorNotFoundError):
+            await graduation_repository.get_all_for_professor(missing_id)
+    assert inner.get_all_for_professor.call_count == 2
+
+async def test_graduation_versions_read_database_and_drop_outdated_list(graduation_repository, cache):
+    inner = graduation_repository.repository
+    inner.get_all_for_professor.return_value = [fake_graduation]
+    await graduation_repository.get_all_for_professor(fake_professor_id)
+
+    inner.get_versions_for_professor.return_value = [(fake_graduation.id, fake_graduation.version)]
+    assert await graduation_repository.get_versions_for_professor(fake_professor_id) == [
+        (fake_graduation.id, fake_graduation.version)
+    ]
+    assert await cache.get(graduations_key(fake_professor_id)) is not None
+
+    # Graduação criada em outra instância
+    other = (uuid.uuid4(), 1)
+    inner.get_versions_for_professor.return_value = [(fake_graduation.id, fake_graduation.version), other]
+    assert len(await graduation_repository.get_versions_for_professor(fake_professor_id)) == 2
+    assert await cache.get(graduations_key(fake_professor_id)) is None
+
+    # Professor removido em outra instância
+    await graduation_repository.get_all_for_professor(fake_professor_id)
+    inner.get_versions_for_professor.side_effect = ProfessorNotFoundError(fake_professor_id)
+    with pytest.raises(ProfessorNotFoundError):
+        await graduation_repository.get_versions_for_professor(fake_professor_id)
+    assert await cache.get(graduations_key(fake_professor_id)) is None
+
+async def test_graduation_writes_invalidate_professor_list(graduation_repository, cache):
+    inner = graduation_repository.repository
+    inner.get_all_for_professor.return_value = [fake_graduation]
+    await graduation_repository.get_all_for_professor(fake_professor_id)
+
+    await graduation_repository.delete(fake_professor_id, fake_graduation.id)
+
+    assert await cache.get(graduations_key(fake_professor_id)) is None
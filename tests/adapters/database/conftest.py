@@ -0,0 +1,24 @@
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from professors.adapters.database.database import Base
+
+
+# Banco real (SQLite em memória via aiosqlite): exercita as consultas dos repositórios
+# (ON CONFLICT, RETURNING, INSERT ... SELECT) em vez de mocks da sessão
+@pytest_asyncio.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_foreign_keys(connection, _):
+        # O SQLite só aplica FKs (e o ON DELETE CASCADE) com este pragma
+        connection.execute("PRAGMA foreign_keys=ON")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)()
+    yield session
+    await session.close()
+    await engine.dispose()
@@ -0,0 +1,75 @@
+import uuid
+import pytest
+
+from professors.adapters.database.graduation_repository import SQLAlchemyGraduationRepository
+from professors.adapters.database.professor_repository import SQLAlchemyProfessorRepository
+from professors.core.domain.errors import ProfessorNotFoundError, VersionConflictError
+from professors.core.domain.graduation_models import GraduationCreate, GraduationUpdate
+from professors.core.domain.professor_models import ProfessorCreate
+
+pytestmark = pytest.mark.asyncio
+
+graduation_data = GraduationCreate(degree="PhD", course="CS", institution_name="USP", year=2016)
+
+
+async def add_professor(db, number):
+    return await SQLAlchemyProfessorRepository(db).add(ProfessorCreate(
+        name=f"Professor {number}", registration_number=number,
+        institucional_email=f"p{number}@pucrs.br", status="active"
+    ))
+
+
+async def test_add_inserts_only_for_existing_professor(db):
+    repository = SQLAlchemyGraduationRepository(db)
+    professor = await add_professor(db, 1)
+
+    created = await repository.add(professor.id, graduation_data)
+
+    assert created.professor_id == professor.id
+    assert created.version == 1
+    assert await repository.get_all_for_professor(professor.id) == [created]
+    with pytest.raises(ProfessorNotFoundError):
+        await repository.add(uuid.uuid4(), graduation_data)
+    assert len(await repository.get_all()) == 1
+
+async def test_get_all_for_professor_distinguishes_missing_and_empty(db):
+    repository = SQLAlchemyGraduationRepository(db)
+    professor = await add_professor(db, 1)
+
+    assert await repository.get_all_for_professor(professor.id) == []
+    assert await repository.get_versions_for_professor(professor.id) == []
+    with pytest.raises(ProfessorNotFoundError):
+        await repository.get_all_for_professor(uuid.uuid4())
+    with pytest.raises(ProfessorNotFoundError):
+        await repository.get_versions_for_professor(uuid.uuid4())
+
+async def test_update_is_scoped_to_the_owning_professor(db):
+    repository = SQLAlchemyGraduationRepository(db)
+    owner = await add_professor(db, 1)
+    other = await add_professor(db, 2)
+    graduation = await repository.add(owner.id, graduation_data)
+    changes = GraduationUpdate(**{**graduation_data.model_dump(), "year": 2018})
+
+    # Professor existente, mas dono de outra graduação: não encontrada
+    assert await repository.update(other.id, graduation.id, changes) is None
+    with pytest.raises(ProfessorNotFoundError):
+        await repository.update(uuid.uuid4(), graduation.id, changes)
+    assert await repository.update(owner.id, uuid.uuid4(), changes, expected_version=1) is None
+    with pytest.raises(VersionConflictError):
+        await repository.update(owner.id, graduation.id, changes, expected_version=7)
+
+    updated = await repository.update(owner.id, graduation.id, changes, expected_version=1)
+    assert updated.year == 2018
+    assert updated.version == 2
+
+async def test_delete_is_scoped_to_the_owning_professor(db):
+    repository = SQLAlchemyGraduationRepository(db)
+    owner = await add_professor(db, 1)
+    other = await add_professor(db, 2)
+    graduation = await repository.add(owner.id, graduation_data)
+
+    assert await repository.delete(other.id, graduation.id) is False
+    with pytest.raises(ProfessorNotFoundError):
+        await repository.delete(uuid.uuid4(), graduation.id)
+    assert await repository.delete(owner.id, graduation.id) is True
+    assert await repository.get_all_for_professor(owner.id) == []
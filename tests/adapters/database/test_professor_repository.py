@@ -0,0 +1,112 @@
+import uuid
+import pytest
+
+from professors.adapters.database.graduation_repository import SQLAlchemyGraduationRepository
+from professors.adapters.database.professor_repository import SQLAlchemyProfessorRepository
+from professors.adapters.database.table_version_repository import SQLAlchemyTableVersionRepository
+from professors.core.domain.errors import VersionConflictError
+from professors.core.domain.graduation_models import GraduationCreate
+from professors.core.domain.professor_models import ProfessorCreate
+from professors.core.domain.table_version import GRADUATIONS_TABLE, PROFESSORS_TABLE
+
+pytestmark = pytest.mark.asyncio
+
+
+def professor_data(number, **overrides):
+    data = {
+        "name": f"Professor {number}",
+        "registration_number": number,
+        "institucional_email": f"p{number}@pucrs.br",
+        "status": "active",
+    }
+    return ProfessorCreate(**{**data, **overrides})
+
+
+async def professors_version(db):
+    return (await SQLAlchemyTableVersionRepository(db).get_versions([PROFESSORS_TABLE]))[PROFESSORS_TABLE].version
+
+
+async def test_add_returns_created_row_and_skips_conflicts(db):
+    repository = SQLAlchemyProfessorRepository(db)
+
+    created = await repository.add(professor_data(1))
+
+    assert created.registration_number == 1
+    assert created.version == 1
+    assert await repository.get_by_id(created.id) == created
+    assert await professors_version(db) == 1
+    # ON CONFLICT DO NOTHING: nenhuma linha retornada (matrícula ou e-mail repetidos)
+    assert await repository.add(professor_data(1, institucional_email="other@pucrs.br")) is None
+    assert await repository.add(professor_data(2, institucional_email="p1@pucrs.br")) is None
+    assert await professors_version(db) == 1
+    assert len(await repository.get_all()) == 1
+
+async def test_add_many_marks_conflicting_items_as_none(db):
+    repository = SQLAlchemyProfessorRepository(db)
+    await repository.add(professor_data(1))
+
+    created = await repository.add_many([professor_data(2), professor_data(1), professor_data(3)])
+
+    assert [p.registration_number if p else None for p in created] == [2, None, 3]
+    assert len(await repository.get_all()) == 3
+
+async def test_update_returns_new_version(db):
+    repository = SQLAlchemyProfessorRepository(db)
+    created = await repository.add(professor_data(1))
+
+    updated = await repository.update(
+        created.id, professor_data(1, name="Renamed").model_dump(), expected_version=1
+    )
+
+    assert updated.name == "Renamed"
+    assert updated.version == 2
+    assert await repository.get_version(created.id) == 2
+
+async def test_update_not_found_conflict_and_unique_violation(db):
+    repository = SQLAlchemyProfessorRepository(db)
+    created = await repository.add(professor_data(1))
+    await repository.add(professor_data(2))
+
+    assert await repository.update(uuid.uuid4(), professor_data(3).model_dump()) is None
+    assert await repository.update(uuid.uuid4(), professor_data(3).model_dump(), expected_version=1) is None
+    with pytest.raises(VersionConflictError):
+        await repository.update(created.id, professor_data(1).model_dump(), expected_version=5)
+    # Matrícula de outro professor: IntegrityError vira None (rollback)
+    assert await repository.update(created.id, professor_data(2, institucional_email="x@pucrs.br").model_dump()) is None
+    assert await repository.get_version(created.id) == 1
+
+async def test_delete_cascades_graduations(db):
+    repository = SQLAlchemyProfessorRepository(db)
+    graduations = SQLAlchemyGraduationRepository(db)
+    created = await repository.add(professor_data(1))
+    await graduations.add(
+        created.id, GraduationCreate(degree="PhD", course="CS", institution_name="USP", year=2016)
+    )
+
+    assert await repository.delete(created.id) is True
+    assert await repository.delete(created.id) is False
+    assert await graduations.get_all() == []
+    versions = await SQLAlchemyTableVersionRepository(db).get_versions([PROFESSORS_TABLE, GRADUATIONS_TABLE])
+    assert versions[GRADUATIONS_TABLE].version == 2
+
+async def test_bulk_status_update_and_delete_return_affected_ids(db):
+    repository = SQLAlchemyProfessorRepository(db)
+    first = await repository.add(professor_data(1))
+    second = await repository.add(professor_data(2, status="on_leave"))
+
+    assert await repository.update_status_many("inactive", status="on_leave") == [second.id]
+    assert await repository.update_status_many("inactive", ids=[first.id, second.id]) == [first.id]
+    assert sorted(await repository.delete_many(status="inactive")) == sorted([first.id, second.id])
+    assert await repository.get_all() == []
+
+async def test_name_searches_match_wildcards_literally(db):
+    repository = SQLAlchemyProfessorRepository(db)
+    for number, name in enumerate(["Ana 100% Silva", "Ana 1000 Silva", "Bia_Souza", "Bia Souza", "Caio \\ Lima"], 1):
+        await repository.add(professor_data(number, name=name))
+
+    # Fallback portável da busca por nome (fora do PostgreSQL): ILIKE com escape
+    assert [p.name for p in await repository.search_by_name("0%", 10)] == ["Ana 100% Silva"]
+    assert [p.name for p in await repository.search_by_name("a_s", 10)] == ["Bia_Souza"]
+    assert [p.name for p in await repository.search_by_name("\\", 10)] == ["Caio \\ Lima"]
+    assert [p.name for p in await repository.search_by_name("silva", 10)] == ["Ana 100% Silva", "Ana 1000 Silva"]
+    assert [p.name for p in await repository.search({"name": "_"})] == ["Bia_Souza"]
@@ -1,35 +1,58 @@
 import pytest
+from contextlib import asynccontextmanager
 from fastapi.testclient import TestClient
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock
 
+from professors import main
 from professors.main import app
 # Importar o novo serviço
-from professors.dependencies import get_professor_service, get_graduation_service
+from professors.dependencies import (
+    get_graduation_service, get_graduation_service_factory, get_professor_autocomplete_service,
+    get_professor_service, get_professor_service_factory
+)
 from professors.adapters.api.auth import validate_token
 
 # Fixture para o mock do serviço (lógica de negócio)
 @pytest.fixture
 def mock_professor_service():
     """Retorna um mock do ProfessorService."""
-    return MagicMock()
+    service = AsyncMock()
+    # Sem contador de versões: as listagens não passam pelo cache HTTP (ver test_collection_cache)
+    service.get_listing_versions.return_value = None
+    return service
 
 # --- NOVO FIXTURE ---
 @pytest.fixture
 def mock_graduation_service():
     """Retorna um mock do GraduationService."""
-    return MagicMock()
+    service = AsyncMock()
+    service.get_listing_versions.return_value = None
+    return service
+
+def service_factory(service):
+    """Fábrica de serviço das leituras coalescidas (single-flight), entregando o mock."""
+    @asynccontextmanager
+    async def open_service():
+        yield service
+    return lambda: open_service
 
 # Fixture para o cliente da API
 @pytest.fixture
-def client(mock_professor_service, mock_graduation_service): # <-- Adicionar mock
+def client(mock_professor_service, mock_graduation_service, monkeypatch): # <-- Adicionar mock
     """Retorna um TestClient da API com dependências mockadas."""
+
+    # Sem banco nos testes: o índice e os snapshots não são carregados no lifespan
+    monkeypatch.setattr(main, "warm_up_read_models", AsyncMock())
     
     # 1. Mockar a autenticação (essencial)
     app.dependency_overrides[validate_token] = lambda: {"sub": "test-user-id"}
     
     # 2. Mockar os serviços (para testar as rotas em isolamento)
     app.dependency_overrides[get_professor_service] = lambda: mock_professor_service
+    app.dependency_overrides[get_professor_autocomplete_service] = lambda: mock_professor_service
     app.dependency_overrides[get_graduation_service] = lambda: mock_graduation_service # <-- Adicionar
+    app.dependency_overrides[get_professor_service_factory] = service_factory(mock_professor_service)
+    app.dependency_overrides[get_graduation_service_factory] = service_factory(mock_graduation_service)
     
     with TestClient(app) as test_client:
         yield test_client
@@ -1,9 +1,11 @@
 import uuid
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock
 from fastapi import HTTPException, status
 from professors.core.services.graduation_service import GraduationService
 from professors.core.domain.graduation_models import Graduation, GraduationCreate, GraduationUpdate
+from professors.core.domain.errors import ProfessorNotFoundError, VersionConflictError
+from professors.core.domain.pagination import Page
 
 # Dados de exemplo
 fake_professor_id = uuid.uuid4()
@@ -23,7 +25,7 @@ fake_graduation = Graduation(
 @pytest.fixture
 def mock_repo():
     """Mock do GraduationRepositoryPort."""
-    return MagicMock()
+    return AsyncMock()
 
 @pytest.fixture
 def graduation_service(mock_repo):
@@ -34,15 +36,18 @@ def graduation_service(mock_repo):
     """
     return GraduationService(repository=mock_repo)
 
+# Os serviços são assíncronos
+pytestmark = pytest.mark.asyncio
+
 # --- Test Cases ---
 
-def test_create_graduation_success(graduation_service, mock_repo):
+async def test_create_graduation_success(graduation_service, mock_repo):
     # Arrange
     grad_create = GraduationCreate(**fake_graduation_data)
     mock_repo.add.return_value = fake_graduation
 
     # Act
-    result = graduation_service.create_graduation(fake_professor_id, grad_create)
+    result = await graduation_service.create_graduation(fake_professor_id, grad_create)
 
     # Assert
     # Verifica se o repositório foi chamado com os argumentos corretos
@@ -50,53 +55,53 @@ def test_create_graduation_success(graduation_service, mock_repo):
     assert result.degree == "Mestrado"
     assert result.id == fake_graduation_id
 
-def test_get_all_graduations_for_professor(graduation_service, mock_repo):
+async def test_get_all_graduations_for_professor(graduation_service, mock_repo):
     # Arrange
     # O nome do método no serviço é get_all_for_professor
     mock_repo.get_all_for_professor.return_value = [fake_graduation]
 
     # Act
-    result = graduation_service.get_all_graduations_for_professor(fake_professor_id)
+    result = await graduation_service.get_all_graduations_for_professor(fake_professor_id)
 
     # Assert
-    mock_repo.get_all_for_professor.assert_called_with(fake_professor_id)
+    mock_repo.get_all_for_professor.assert_called_with(fake_professor_id, fields=None)
     assert len(result) == 1
     assert result[0].id == fake_graduation_id
 
-def test_get_all_graduations(graduation_service, mock_repo):
+async def test_get_all_graduations(graduation_service, mock_repo):
     # Arrange
     mock_repo.get_all.return_value = [fake_graduation]
     
     # Act
-    result = graduation_service.get_all_graduations()
+    result = await graduation_service.get_all_graduations()
     
     # Assert
     mock_repo.get_all.assert_called_once()
     assert len(result) == 1
     assert result[0].id == fake_graduation_id
 
-def test_get_graduation_by_id_success(graduation_service, mock_repo):
+async def test_get_graduation_by_id_success(graduation_service, mock_repo):
     # Arrange
     mock_repo.get_by_id.return_value = fake_graduation
 
     # Act
-    result = graduation_service.get_graduation_by_id(fake_graduation_id)
+    result = await graduation_service.get_graduation_by_id(fake_graduation_id)
 
     # Assert
     mock_repo.get_by_id.assert_called_with(fake_graduation_id)
     assert result.id == fake_graduation_id
 
-def test_get_graduation_by_id_not_found(graduation_service, mock_repo):
+async def test_get_graduation_by_id_not_found(graduation_service, mock_repo):
     # Arrange
     mock_repo.get_by_id.return_value = None
 
     # Act / Assert
     with pytest.raises(HTTPException) as exc_info:
-        graduation_service.get_graduation_by_id(uuid.uuid4())
+        await graduation_service.get_graduation_by_id(uuid.uuid4())
 
     assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
 
-def test_update_graduation_success(graduation_service, mock_repo):
+async def test_update_graduation_success(graduation_service, mock_repo):
     # Arrange
     grad_update = GraduationUpdate(**fake_graduation_data)
     # O repositório deve retornar o objeto atualizado
@@ -104,41 +109,87 @@ def test_update_graduation_success(graduation_service, mock_repo):
     mock_repo.update.return_value = updated_graduation
 
     # Act
-    result = graduation_service.update_graduation(fake_graduation_id, grad_update)
+    result = await graduation_service.update_graduation(fake_professor_id, fake_graduation_id, grad_update)
 
     # Assert
     # O serviço passa o objeto Pydantic 'grad_update', não um dict
-    mock_repo.update.assert_called_with(fake_graduation_id, grad_update)
+    mock_repo.update.assert_called_with(fake_professor_id, fake_graduation_id, grad_update, expected_version=None)
     assert result
     assert result.id == fake_graduation_id
 
-def test_update_graduation_not_found(graduation_service, mock_repo):
+async def test_update_graduation_not_found(graduation_service, mock_repo):
     # Arrange
     grad_update = GraduationUpdate(**fake_graduation_data)
     mock_repo.update.return_value = None
 
     # Act / Assert
     with pytest.raises(HTTPException) as exc_info:
-        graduation_service.update_graduation(fake_graduation_id, grad_update)
+        await graduation_service.update_graduation(fake_professor_id, fake_graduation_id, grad_update)
 
     assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+    assert exc_info.value.detail == "Graduation not found."
+
+async def test_update_graduation_version_conflict(graduation_service, mock_repo):
+    # Arrange
+    grad_update = GraduationUpdate(**fake_graduation_data)
+    mock_repo.update.side_effect = VersionConflictError(1)
+
+    # Act / Assert
+    with pytest.raises(HTTPException) as exc_info:
+        await graduation_service.update_graduation(
+            fake_professor_id, fake_graduation_id, grad_update, expected_version=1
+        )
 
-def test_delete_graduation_success(graduation_service, mock_repo):
+    assert exc_info.value.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+async def test_delete_graduation_success(graduation_service, mock_repo):
     # Arrange
     mock_repo.delete.return_value = True
 
     # Act
-    graduation_service.delete_graduation(fake_graduation_id)
+    await graduation_service.delete_graduation(fake_professor_id, fake_graduation_id)
 
     # Assert
-    mock_repo.delete.assert_called_with(fake_graduation_id)
+    mock_repo.delete.assert_called_with(fake_professor_id, fake_graduation_id)
 
-def test_delete_graduation_not_found(graduation_service, mock_repo):
+async def test_delete_graduation_not_found(graduation_service, mock_repo):
     # Arrange
     mock_repo.delete.return_value = False
 
     # Act / Assert
     with pytest.raises(HTTPException) as exc_info:
-        graduation_service.delete_graduation(fake_graduation_id)
+        await graduation_service.delete_graduation(fake_professor_id, fake_graduation_id)
+
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+async def test_get_graduations_page(graduation_service, mock_repo):
+    # Arrange
+    mock_repo.get_page.return_value = Page(items=[fake_graduation])
+
+    # Act
+    result = await graduation_service.get_graduations_page(10)
+
+    # Assert
+    mock_repo.get_page.assert_called_with(10, None, fields=None)
+    assert result.items == [fake_graduation]
+
+async def test_create_graduation_professor_not_found(graduation_service, mock_repo):
+    # Arrange
+    mock_repo.add.side_effect = ProfessorNotFoundError(fake_professor_id)
+
+    # Act / Assert
+    with pytest.raises(HTTPException) as exc_info:
+        await graduation_service.create_graduation(fake_professor_id, GraduationCreate(**fake_graduation_data))
+
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+    assert exc_info.value.detail == "Professor not found."
+
+async def test_delete_graduation_professor_not_found(graduation_service, mock_repo):
+    # Arrange
+    mock_repo.delete.side_effect = ProfessorNotFoundError(fake_professor_id)
+
+    # Act / Assert
+    with pytest.raises(HTTPException) as exc_info:
+        await graduation_service.delete_graduation(fake_professor_id, fake_graduation_id)
 
-    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
\ No newline at end of file
+    assert exc_info.value.detail == "Professor not found."
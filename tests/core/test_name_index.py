@@ -0,0 +1,88 @@
+# tests/core/test_name_index.py
+import asyncio
+import uuid
+import pytest
+from professors.core.services.name_index import ProfessorNameIndex, normalize_name
+
+joao_id, joana_id, maria_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+
+def build_index():
+    index = ProfessorNameIndex()
+    index.build([(joao_id, "João da Silva"), (joana_id, "Joana Dark"), (maria_id, "Maria Silveira")])
+    return index
+
+
+def test_normalize_name_strips_accents_case_and_spaces():
+    assert normalize_name("  JOÃO   da  Conceição ") == "joao da conceicao"
+
+def test_search_matches_any_word_prefix_ignoring_accents():
+    index = build_index()
+
+    assert index.search("jo", 10) == [
+        {"id": joana_id, "name": "Joana Dark"},
+        {"id": joao_id, "name": "João da Silva"},
+    ]
+    assert [s["id"] for s in index.search("SIL", 10)] == [joao_id, maria_id]
+    assert [s["id"] for s in index.search("da sil", 10)] == [joao_id]
+    assert index.search("x", 10) == []
+    assert index.search("  ", 10) == []
+
+def test_search_respects_limit():
+    assert len(build_index().search("j", 1)) == 1
+
+def test_add_replaces_and_remove_drops_entries():
+    index = build_index()
+
+    index.add(joao_id, "Pedro Alves")
+    index.remove(maria_id)
+    index.remove(uuid.uuid4())
+
+    assert [s["id"] for s in index.search("jo", 10)] == [joana_id]
+    assert index.search("silv", 10) == []
+    assert index.search("alv", 10) == [{"id": joao_id, "name": "Pedro Alves"}]
+    assert len(index) == 2
+
+@pytest.mark.asyncio
+async def test_refresh_if_stale_reloads_only_on_version_change():
+    versions = [3, 4]
+    loads = []
+
+    async def load():
+        loads.append(versions[0])
+        return versions[0], [(joao_id, "João da Silva")]
+
+    async def load_version():
+        return versions[0]
+
+    index = ProfessorNameIndex(load, load_version)
+
+    # Nunca carregado: recarrega sem conferir a versão
+    assert await index.refresh_if_stale() is True
+    assert await index.refresh_if_stale() is False
+    versions.pop(0)
+    assert await index.refresh_if_stale() is True
+    assert loads == [3, 4]
+    assert index.version == 4
+
+@pytest.mark.asyncio
+async def test_poll_retries_failed_loads_in_background():
+    results = [ConnectionRefusedError("db down"), (1, [(joao_id, "João da Silva")])]
+
+    async def load():
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def load_version():
+        return 1
+
+    index = ProfessorNameIndex(load, load_version, refresh_interval_seconds=0)
+    index.start()
+    for _ in range(10):
+        await asyncio.sleep(0)
+    await index.close()
+
+    assert index.ready
+    assert index.search("jo", 10) == [{"id": joao_id, "name": "João da Silva"}]
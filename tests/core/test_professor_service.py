@@ -1,10 +1,14 @@
 # tests/core/test_professor_service.py
 import uuid
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock
 from fastapi import HTTPException, status
 from professors.core.services.professor_service import ProfessorService
 from professors.core.domain.professor_models import ProfessorCreate, ProfessorUpdate, Professor
+from professors.core.domain.graduation_models import Graduation
+from professors.core.domain.pagination import Keyset, Page
+from professors.core.services.name_index import ProfessorNameIndex
+from professors.core.domain.errors import VersionConflictError
 
 # Dados de exemplo completos
 fake_professor_data = {
@@ -18,86 +22,94 @@ fake_professor = Professor(id=fake_professor_id, **fake_professor_data)
 
 @pytest.fixture
 def mock_repo():
-    return MagicMock()
+    return AsyncMock()
 
 @pytest.fixture
-def professor_service(mock_repo):
-    return ProfessorService(repository=mock_repo)
+def mock_graduation_repo():
+    return AsyncMock()
+
+@pytest.fixture
+def professor_service(mock_repo, mock_graduation_repo):
+    return ProfessorService(repository=mock_repo, graduation_repository=mock_graduation_repo)
+
+# Os serviços são assíncronos
+pytestmark = pytest.mark.asyncio
 
 # --- Test Cases ---
 
-def test_create_professor_success(professor_service, mock_repo):
+async def test_create_professor_success(professor_service, mock_repo):
     # Arrange
     professor_data = ProfessorCreate(**fake_professor_data)
-    mock_repo.get_by_registration_number.return_value = None
     mock_repo.add.return_value = fake_professor
     
     # Act
-    result = professor_service.create_professor(professor_data)
+    result = await professor_service.create_professor(professor_data)
     
     # Assert
-    mock_repo.get_by_registration_number.assert_called_with(123)
+    # Sem consulta prévia: o conflito vem do próprio INSERT
+    mock_repo.get_by_registration_number.assert_not_called()
     mock_repo.add.assert_called_with(professor_data)
     assert result.name == "Test User"
 
-def test_create_professor_conflict_raises_http_409(professor_service, mock_repo):
+async def test_create_professor_conflict_raises_http_409(professor_service, mock_repo):
     # Arrange
     professor_data = ProfessorCreate(**fake_professor_data)
-    mock_repo.get_by_registration_number.return_value = fake_professor
+    # ON CONFLICT DO NOTHING não retorna linha
+    mock_repo.add.return_value = None
     
     # Act / Assert
     with pytest.raises(HTTPException) as exc_info:
-        professor_service.create_professor(professor_data)
+        await professor_service.create_professor(professor_data)
         
     assert exc_info.value.status_code == status.HTTP_409_CONFLICT
-    mock_repo.add.assert_not_called()
+    mock_repo.add.assert_called_once_with(professor_data)
 
-def test_get_professor_by_id_success(professor_service, mock_repo):
+async def test_get_professor_by_id_success(professor_service, mock_repo):
     # Arrange
     mock_repo.get_by_id.return_value = fake_professor
     
     # Act
-    result = professor_service.get_professor_by_id(fake_professor_id)
+    result = await professor_service.get_professor_by_id(fake_professor_id)
     
     # Assert
-    mock_repo.get_by_id.assert_called_with(fake_professor_id)
+    mock_repo.get_by_id.assert_called_with(fake_professor_id, fields=None)
     assert result.id == fake_professor_id
 
-def test_get_professor_by_id_not_found_raises_http_404(professor_service, mock_repo):
+async def test_get_professor_by_id_not_found_raises_http_404(professor_service, mock_repo):
     # Arrange
     prof_id = uuid.uuid4()
     mock_repo.get_by_id.return_value = None
     
     # Act / Assert
     with pytest.raises(HTTPException) as exc_info:
-        professor_service.get_professor_by_id(prof_id)
+        await professor_service.get_professor_by_id(prof_id)
         
     assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
 
-def test_get_all_professors(professor_service, mock_repo):
+async def test_get_all_professors(professor_service, mock_repo):
     # Arrange
     mock_repo.get_all.return_value = [fake_professor, fake_professor]
     
     # Act
-    result = professor_service.get_all_professors()
+    result = await professor_service.get_all_professors()
     
     # Assert
     assert len(result) == 2
     mock_repo.get_all.assert_called_once()
 
-def test_search_professors(professor_service, mock_repo):
+async def test_search_professors(professor_service, mock_repo):
     # Arrange
     params = {"name": "Test", "status": "active"}
     mock_repo.search.return_value = [fake_professor]
     
     # Act
-    result = professor_service.search_professors(params)
+    result = await professor_service.search_professors(params)
     
     # Assert
-    mock_repo.search.assert_called_with(params)
+    mock_repo.search.assert_called_with(params, fields=None)
     assert len(result) == 1
 
-def test_update_professor_success(professor_service, mock_repo):
+async def test_update_professor_success(professor_service, mock_repo):
     # Arrange
     update_data_dict = {
         "name": "Updated Name",
@@ -109,39 +121,252 @@ def test_update_professor_success(professor_service, mock_repo):
     mock_repo.update.return_value = Professor(id=fake_professor_id, **update_data_dict)
     
     # Act
-    result = professor_service.update_professor(fake_professor_id, update_data)
+    result = await professor_service.update_professor(fake_professor_id, update_data)
     
     # Assert
-    mock_repo.update.assert_called_with(fake_professor_id, update_data.model_dump())
+    mock_repo.update.assert_called_with(fake_professor_id, update_data.model_dump(), expected_version=None)
     assert result.name == "Updated Name"
 
-def test_update_professor_not_found_raises_http_404(professor_service, mock_repo):
+async def test_update_professor_not_found_raises_http_404(professor_service, mock_repo):
     # Arrange
     update_data = ProfessorUpdate(**fake_professor_data)
     mock_repo.update.return_value = None
     
     # Act / Assert
     with pytest.raises(HTTPException) as exc_info:
-        professor_service.update_professor(fake_professor_id, update_data)
+        await professor_service.update_professor(fake_professor_id, update_data)
+        
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+async def test_update_professor_version_conflict_raises_http_412(professor_service, mock_repo):
+    # Arrange
+    update_data = ProfessorUpdate(**fake_professor_data)
+    mock_repo.update.side_effect = VersionConflictError(3)
+    
+    # Act / Assert
+    with pytest.raises(HTTPException) as exc_info:
+        await professor_service.update_professor(fake_professor_id, update_data, expected_version=3)
+        
+    assert exc_info.value.status_code == status.HTTP_412_PRECONDITION_FAILED
+    mock_repo.update.assert_called_with(fake_professor_id, update_data.model_dump(), expected_version=3)
+
+async def test_get_professor_version_not_found_raises_http_404(professor_service, mock_repo):
+    # Arrange
+    mock_repo.get_version.return_value = None
+    
+    # Act / Assert
+    with pytest.raises(HTTPException) as exc_info:
+        await professor_service.get_professor_version(fake_professor_id)
         
     assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
 
-def test_delete_professor_success(professor_service, mock_repo):
+async def test_delete_professor_success(professor_service, mock_repo):
     # Arrange
     mock_repo.delete.return_value = True
     
     # Act
-    professor_service.delete_professor(fake_professor_id)
+    await professor_service.delete_professor(fake_professor_id)
     
     # Assert
     mock_repo.delete.assert_called_with(fake_professor_id)
 
-def test_delete_professor_not_found_raises_http_404(professor_service, mock_repo):
+async def test_delete_professor_not_found_raises_http_404(professor_service, mock_repo):
     # Arrange
     mock_repo.delete.return_value = False
     
     # Act / Assert
     with pytest.raises(HTTPException) as exc_info:
-        professor_service.delete_professor(fake_professor_id)
+        await professor_service.delete_professor(fake_professor_id)
+        
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+async def test_get_professors_page_drops_empty_filters(professor_service, mock_repo):
+    # Arrange
+    after = Keyset(id=uuid.uuid4())
+    mock_repo.get_page.return_value = Page(items=[fake_professor])
+    
+    # Act
+    result = await professor_service.get_professors_page({"name": None, "status": "active"}, 20, after)
+    
+    # Assert
+    mock_repo.get_page.assert_called_with({"status": "active"}, 20, after, fields=None)
+    assert result.items == [fake_professor]
+
+async def test_create_professors_skips_duplicates_within_batch(professor_service, mock_repo):
+    # Arrange
+    first = ProfessorCreate(**fake_professor_data)
+    same_registration = ProfessorCreate(**{**fake_professor_data, "institucional_email": "other@pucrs.br"})
+    same_email = ProfessorCreate(**{**fake_professor_data, "registration_number": 999})
+    distinct = ProfessorCreate(**{**fake_professor_data, "registration_number": 2, "institucional_email": "b@pucrs.br"})
+    mock_repo.add_many.return_value = [fake_professor, None]
+    
+    # Act
+    result = await professor_service.create_professors([first, same_registration, same_email, distinct])
+    
+    # Assert
+    mock_repo.add_many.assert_called_once_with([first, distinct])
+    assert result == [fake_professor, None, None, None]
+
+async def test_deactivate_professors_sets_inactive_status(professor_service, mock_repo):
+    # Arrange
+    ids = [uuid.uuid4(), uuid.uuid4()]
+    mock_repo.update_status_many.return_value = ids
+    
+    # Act
+    affected = await professor_service.deactivate_professors(ids=ids)
+    
+    # Assert
+    assert affected == 2
+    mock_repo.update_status_many.assert_called_once_with("inactive", ids=ids, status=None)
+
+async def test_delete_professors_returns_count_and_updates_name_index(mock_repo):
+    # Arrange
+    name_index = ProfessorNameIndex()
+    name_index.build([(fake_professor_id, "Test User")])
+    service = ProfessorService(repository=mock_repo, name_index=name_index)
+    mock_repo.delete_many.return_value = [fake_professor_id]
+    
+    # Act
+    affected = await service.delete_professors(status_filter="inactive")
+    
+    # Assert
+    assert affected == 1
+    assert service.autocomplete_professors("test", 10) == []
+
+async def test_bulk_operations_require_a_selection(professor_service, mock_repo):
+    # Act / Assert
+    with pytest.raises(HTTPException) as exc_info:
+        await professor_service.delete_professors()
+        
+    assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+    mock_repo.delete_many.assert_not_called()
+
+async def test_include_graduations_loads_all_in_one_call(professor_service, mock_graduation_repo):
+    # Arrange
+    other = Professor(id=uuid.uuid4(), **{**fake_professor_data, "registration_number": 456})
+    graduation = Graduation(
+        id=uuid.uuid4(), professor_id=fake_professor_id,
+        degree="Mestrado", course="Computação", institution_name="PUCRS", year=2020
+    )
+    mock_graduation_repo.get_all_for_professors.return_value = {fake_professor_id: [graduation], other.id: []}
+    
+    # Act
+    result = await professor_service.include_graduations([fake_professor, other])
+    
+    # Assert
+    mock_graduation_repo.get_all_for_professors.assert_called_once_with([fake_professor_id, other.id])
+    assert [p.id for p in result] == [fake_professor_id, other.id]
+    assert result[0].graduations == [graduation]
+    assert result[1].graduations == []
+
+
+async def test_get_all_professors_with_fields_selects_only_those_columns(professor_service, mock_repo):
+    # Arrange
+    mock_repo.get_all.return_value = [{"id": fake_professor_id, "name": "Test User"}]
+    
+    # Act
+    result = await professor_service.get_all_professors(fields=["name"])
+    
+    # Assert
+    # `id` sempre é incluído na projeção
+    mock_repo.get_all.assert_called_once_with(fields=["id", "name"])
+    assert result == [{"id": fake_professor_id, "name": "Test User"}]
+
+async def test_unknown_fields_raise_http_400(professor_service, mock_repo):
+    # Act / Assert
+    with pytest.raises(HTTPException) as exc_info:
+        await professor_service.get_all_professors(fields=["name", "password"])
         
-    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
\ No newline at end of file
+    assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+    assert "password" in exc_info.value.detail
+    mock_repo.get_all.assert_not_called()
+
+async def test_lookup_professors_keeps_request_order_and_skips_missing(professor_service, mock_repo):
+    # Arrange
+    other = Professor(id=uuid.uuid4(), **{**fake_professor_data, "registration_number": 456})
+    missing_id = uuid.uuid4()
+    mock_repo.get_many.return_value = [fake_professor, other]
+    
+    # Act
+    result = await professor_service.lookup_professors([other.id, missing_id, fake_professor_id, other.id])
+    
+    # Assert
+    mock_repo.get_many.assert_called_once_with([other.id, missing_id, fake_professor_id], fields=None)
+    assert result == [other, fake_professor]
+
+async def test_search_professors_by_name_strips_query(professor_service, mock_repo):
+    # Arrange
+    mock_repo.search_by_name.return_value = [fake_professor]
+    
+    # Act
+    result = await professor_service.search_professors_by_name("  joao ", 10, accent_insensitive=True)
+    
+    # Assert
+    mock_repo.search_by_name.assert_called_once_with("joao", 10, accent_insensitive=True, fields=None)
+    assert result == [fake_professor]
+
+async def test_search_professors_by_name_rejects_blank_query(professor_service, mock_repo):
+    # Act / Assert
+    with pytest.raises(HTTPException) as exc_info:
+        await professor_service.search_professors_by_name("   ", 10)
+        
+    assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+    mock_repo.search_by_name.assert_not_called()
+
+async def test_writes_keep_name_index_up_to_date(mock_repo):
+    # Arrange
+    name_index = ProfessorNameIndex()
+    name_index.build([])
+    service = ProfessorService(repository=mock_repo, name_index=name_index)
+    renamed = Professor(id=fake_professor_id, **{**fake_professor_data, "name": "Renamed"})
+    mock_repo.add.return_value = fake_professor
+    mock_repo.update.return_value = renamed
+    mock_repo.delete.return_value = True
+    
+    # Act / Assert
+    await service.create_professor(ProfessorCreate(**fake_professor_data))
+    assert service.autocomplete_professors("tes", 10) == [{"id": fake_professor_id, "name": "Test User"}]
+
+    await service.update_professor(fake_professor_id, ProfessorUpdate(**{**fake_professor_data, "name": "Renamed"}))
+    assert service.autocomplete_professors("tes", 10) == []
+    assert service.autocomplete_professors("ren", 10) == [{"id": fake_professor_id, "name": "Renamed"}]
+
+    await service.delete_professor(fake_professor_id)
+    assert service.autocomplete_professors("ren", 10) == []
+
+async def test_autocomplete_unavailable_until_index_is_built(professor_service):
+    # Act / Assert
+    with pytest.raises(HTTPException) as exc_info:
+        professor_service.autocomplete_professors("te", 10)
+        
+    assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+async def test_autocomplete_never_reads_table_versions(mock_repo):
+    # Arrange
+    name_index = ProfessorNameIndex()
+    name_index.build([(fake_professor_id, "Test User")], version=6)
+    table_versions = AsyncMock()
+    service = ProfessorService(repository=mock_repo, name_index=name_index, table_versions=table_versions)
+
+    # Act / Assert
+    assert service.autocomplete_professors("tes", 10) == [{"id": fake_professor_id, "name": "Test User"}]
+    table_versions.get_versions.assert_not_called()
+    assert mock_repo.mock_calls == []
+
+async def test_listing_versions_include_graduations_only_when_read(mock_repo, mock_graduation_repo):
+    # Arrange
+    table_versions = AsyncMock()
+    service = ProfessorService(mock_repo, mock_graduation_repo, table_versions=table_versions)
+    
+    # Act
+    await service.get_listing_versions({"name": "Ana", "degree": None})
+    await service.get_listing_versions({"name": None, "degree": "Doutorado"})
+    await service.get_listing_versions({}, include_graduations=True)
+    
+    # Assert
+    assert [call.args[0] for call in table_versions.get_versions.call_args_list] == [
+        ["professors"], ["professors", "graduations"], ["professors", "graduations"]
+    ]
+
+async def test_listing_versions_without_counter(professor_service):
+    assert await professor_service.get_listing_versions({}) is None